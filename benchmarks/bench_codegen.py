@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Compare building an enum at startup from a CSV file with the functional API
+with loading the module generated from the same file by :mod:`enum_tools.codegen`.
+
+Modules are compiled once beforehand, as they would be when imported from a ``.pyc`` file.
+
+Run with ``python -m benchmarks.bench_codegen`` from the repository root.
+"""
+
+# stdlib
+import csv
+import io
+import timeit
+from typing import Any, Dict
+
+# this package
+from enum_tools import IntEnum
+from enum_tools.codegen import generate_module, parse_spec
+
+MEMBER_COUNT = 10_000
+
+CSV_DATA = "name,value,doc\n" + ''.join(f"ERROR_{idx},{idx + 1000},Error number {idx}\n" for idx in range(MEMBER_COUNT))
+
+
+def build_from_csv() -> Any:
+	reader = csv.DictReader(io.StringIO(CSV_DATA))
+	return IntEnum("ErrorCode", [(row["name"], int(row["value"])) for row in reader])  # type: ignore[misc]
+
+
+def load(code: Any) -> Dict[str, Any]:
+	namespace: Dict[str, Any] = {"__name__": "generated"}
+	exec(code, namespace)  # noqa: DUO105
+	return namespace
+
+
+def main() -> None:
+	reader = csv.DictReader(io.StringIO(CSV_DATA))
+	spec = parse_spec("ErrorCode", [(row["name"], int(row["value"]), row["doc"]) for row in reader], base="IntEnum")
+	eager = compile(generate_module(spec), "generated.py", "exec")
+	lazy = compile(generate_module(parse_spec("ErrorCode", spec.members), lazy=True), "generated_lazy.py", "exec")
+
+	assert list(load(eager)["ErrorCode"]) == list(build_from_csv())
+
+	print(f"Loading an enum with {MEMBER_COUNT} members")
+
+	for label, function in [
+			("CSV + functional API", build_from_csv),
+			("generated module", lambda: load(eager)),
+			("generated, --lazy", lambda: load(lazy)),
+			]:
+		elapsed = min(timeit.repeat(function, number=1, repeat=5))
+		print(f"{label:<22}{elapsed * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measure writing and scanning a column file of enum members,
+compared with reading the whole of an :mod:`enum_tools.codec` encoded file into memory.
+
+Run with ``python -m benchmarks.bench_columnfile`` from the repository root.
+"""
+
+# stdlib
+import os
+import random
+import tempfile
+import time
+from enum import Enum
+
+# this package
+from enum_tools.codec import decode_members, encode_members
+from enum_tools.columnfile import ColumnReader, ColumnWriter
+
+EventType = Enum("EventType", [f"EVENT_{idx}" for idx in range(40)], module=__name__)  # type: ignore[misc]
+
+LENGTH = 5_000_000
+
+
+def timed(label: str, function) -> None:  # noqa: MAN001
+	start = time.perf_counter()
+	result = function()
+	print(f"{label:<34}{(time.perf_counter() - start) * 1e3:>9.1f} ms")
+	return result
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	members = list(EventType)
+	events = [members[rng.randrange(len(members))] for _ in range(LENGTH)]
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		column = os.path.join(tmpdir, "events.etcf")
+		encoded = os.path.join(tmpdir, "events.etoc")
+
+		print(f"{LENGTH} members of a {len(members)} member enum")
+
+		def write_column() -> None:
+			with ColumnWriter(column, EventType) as writer:
+				writer.extend(events)
+
+		def write_encoded() -> None:
+			with open(encoded, "wb") as fp:
+				fp.write(encode_members(events, EventType))
+
+		timed("write: ColumnWriter.extend", write_column)
+		timed("write: encode_members", write_encoded)
+
+		def read_encoded() -> int:
+			with open(encoded, "rb") as fp:
+				return len(decode_members(fp.read(), EventType))
+
+		def scan_column() -> int:
+			with ColumnReader(column, EventType) as reader:
+				return sum(map(len, reader.iter_chunks()))
+
+		def open_column() -> int:
+			with ColumnReader(column, EventType) as reader:
+				return len(reader)
+
+		def count_column() -> int:
+			with ColumnReader(column, EventType) as reader:
+				array = reader.to_array()
+				return array.value_counts().total()
+
+		assert timed("read: decode_members", read_encoded) == LENGTH
+		assert timed("read: ColumnReader.iter_chunks", scan_column) == LENGTH
+		assert timed("open: ColumnReader", open_column) == LENGTH
+		assert timed("count: to_array().value_counts()", count_column) == LENGTH
+
+
+if __name__ == "__main__":
+	main()
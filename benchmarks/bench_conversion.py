@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Compare converting raw values to members with :func:`enum_tools.conversion.convert_values`
+with calling the enum for each value and catching the exception for invalid values.
+
+Run with ``python -m benchmarks.bench_conversion`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from enum import Enum
+from typing import Any, List, Optional, Sequence, Type
+
+# 3rd party
+import numpy  # nodep
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.conversion import convert_values
+from enum_tools.custom_enums import IterableIntFlag
+
+Code = IntEnum("Code", [(f"CODE_{idx}", idx * 3) for idx in range(500)], module=__name__)  # type: ignore[misc]
+Currency = StrEnum("Currency", [(f"C{idx}", f"C{idx:03}") for idx in range(180)], module=__name__)  # type: ignore[misc]
+Permission = IterableIntFlag("Permission", [(f"BIT_{idx}", 1 << idx) for idx in range(12)], module=__name__)  # type: ignore[misc]
+
+LENGTH = 1_000_000
+
+
+def one_at_a_time(enum: Type[Enum], values: Sequence[Any]) -> List[Optional[Enum]]:
+	members: List[Optional[Enum]] = []
+
+	for value in values:
+		try:
+			members.append(enum(value))
+		except ValueError:
+			members.append(None)
+
+	return members
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	datasets = [
+			("IntEnum", Code, [rng.randrange(1550) for _ in range(LENGTH)]),
+			("StrEnum", Currency, [f"C{rng.randrange(200):03}" for _ in range(LENGTH)]),
+			("IterableIntFlag", Permission, [rng.randrange(1 << 13) for _ in range(LENGTH)]),
+			]
+
+	print(f"Converting {LENGTH} values")
+
+	for label, enum, values in datasets:
+		array = numpy.array(values)
+		if enum is not Permission:
+			# IntFlag keeps undefined bits rather than raising, but they are reported as invalid by convert_values.
+			assert convert_values(enum, values).members == one_at_a_time(enum, values)
+
+		result, array_result = convert_values(enum, values), convert_values(enum, array)
+		assert array_result.members.tolist() == result.members
+		assert array_result.ordinals.tolist() == result.ordinals
+		assert array_result.invalid.tolist() == result.invalid
+
+		timings = [
+				min(timeit.repeat(lambda: one_at_a_time(enum, values), number=1, repeat=3)),
+				min(timeit.repeat(lambda: convert_values(enum, values), number=1, repeat=3)),
+				min(timeit.repeat(lambda: convert_values(enum, array), number=1, repeat=3)),
+				]
+
+		invalid = len(result.invalid)
+		print(
+				f"{label:<16}{invalid / LENGTH:>5.0%} invalid   "
+				f"Cls(value): {timings[0] * 1e3:>6.0f} ms   "
+				f"list: {timings[1] * 1e3:>5.0f} ms   "
+				f"NumPy: {timings[2] * 1e3:>5.0f} ms"
+				)
+
+
+if __name__ == "__main__":
+	main()
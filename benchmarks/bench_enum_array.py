@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare a column of members stored in :class:`enum_tools.arrays.EnumArray` with one stored in a :class:`list`.
+
+Run with ``python -m benchmarks.bench_enum_array`` from the repository root.
+"""
+
+# stdlib
+import random
+import sys
+import timeit
+from collections import Counter
+from enum import Enum
+
+# this package
+from enum_tools.arrays import EnumArray
+
+Status = Enum("Status", [f"STATUS_{idx}" for idx in range(40)], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	members = list(Status)
+	column = rng.choices(members, k=1_000_000)
+	values = [member.value for member in column]
+	wanted = set(members[:5])
+
+	array = EnumArray.from_members(Status, column)
+	assert array.tolist() == column
+
+	cases = {
+			"from values": (
+					lambda: list(map(Status, values)),
+					lambda: EnumArray.from_values(Status, values),
+					),
+			"== member": (
+					lambda: [member is Status.STATUS_3 for member in column],
+					lambda: array == Status.STATUS_3,
+					),
+			"isin": (
+					lambda: [member in wanted for member in column],
+					lambda: array.isin(wanted),
+					),
+			"value_counts": (
+					lambda: Counter(column),
+					lambda: array.value_counts(),
+					),
+			"values": (
+					lambda: [member.value for member in column],
+					lambda: array.values(),
+					),
+			"slice": (
+					lambda: column[1000:900_000],
+					lambda: array[1000:900_000],
+					),
+			}
+
+	list_size = sys.getsizeof(column)
+	print(f"{len(column)} members: list {list_size / 1e6:.1f} MB, EnumArray {array.nbytes / 1e6:.1f} MB")
+	print(f"{'':<14}{'list (ms)':>12}{'EnumArray (ms)':>16}")
+
+	for label, (with_list, with_array) in cases.items():
+		old = min(timeit.repeat(with_list, number=1, repeat=3)) * 1000
+		new = min(timeit.repeat(with_array, number=1, repeat=3)) * 1000
+		print(f"{label:<14}{old:>12.2f}{new:>16.2f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compare counting members with :class:`enum_tools.containers.EnumCounter` and :class:`collections.Counter`.
+
+Run with ``python -m benchmarks.bench_enum_counter`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from array import array
+from collections import Counter
+from enum import Enum
+
+# this package
+from enum_tools.containers import EnumCounter
+
+Event = Enum("Event", [f"EVENT_{idx}" for idx in range(32)], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	members = list(Event)
+	stream = rng.choices(members, k=1_000_000)
+	ordinals = array('B', (members.index(member) for member in stream[:1000]))  # type: ignore[misc]
+	ordinals *= 1000
+
+	timings = {
+			"Counter(members)": lambda: Counter(stream),
+			"EnumCounter(members)": lambda: EnumCounter(Event, stream),
+			"EnumCounter.update_ordinals(array)": lambda: EnumCounter(Event).update_ordinals(ordinals),
+			}
+
+	try:
+		# 3rd party
+		import numpy
+	except ImportError:  # pragma: no cover
+		pass
+	else:
+		as_numpy = numpy.frombuffer(ordinals, dtype=numpy.uint8)
+		timings["EnumCounter.update_ordinals(numpy)"] = lambda: EnumCounter(Event).update_ordinals(as_numpy)
+
+	print(f"{'':<38}{'ns per member':>14}")
+
+	for label, func in timings.items():
+		best = min(timeit.repeat(func, number=3, repeat=3)) / 3
+		print(f"{label:<38}{best / 1_000_000 * 1e9:>14.2f}")
+
+
+if __name__ == "__main__":
+	main()
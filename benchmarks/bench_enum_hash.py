@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compare dictionary and set operations keyed by members of an :class:`~enum.Enum`
+with the same operations on an :class:`~enum_tools.custom_enums.IdentityHashEnum`.
+
+Run with ``python -m benchmarks.bench_enum_hash`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from collections import Counter
+from enum import Enum
+
+# this package
+from enum_tools.custom_enums import IdentityHashEnum
+
+NAMES = [f"MEMBER_{idx}" for idx in range(64)]
+
+Plain = Enum("Plain", NAMES, module=__name__)  # type: ignore[misc]
+Identity = IdentityHashEnum("Identity", NAMES, module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	ordinals = [rng.randrange(len(NAMES)) for _ in range(200_000)]
+
+	print(f"{'':<18}{'Enum':>10}{'IdentityHashEnum':>18}")
+
+	for label, statement in [
+			("hash()", "for m in keys: hash(m)"),
+			("dict lookup", "for m in keys: table[m]"),
+			("set membership", "for m in keys: m in subset"),
+			("Counter", "Counter(keys)"),
+			]:
+		timings = []
+
+		for enum in (Plain, Identity):
+			members = list(enum)
+			namespace = {
+					"keys": [members[ordinal] for ordinal in ordinals],
+					"table": {member: member.value for member in members},
+					"subset": set(members[::2]),
+					"Counter": Counter,
+					}
+			timings.append(min(timeit.repeat(statement, globals=namespace, number=1, repeat=5)))
+
+		per_key = [timing / len(ordinals) * 1e9 for timing in timings]
+		print(f"{label:<18}{per_key[0]:>7.1f} ns{per_key[1]:>15.1f} ns")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Compare the memory use and lookup speed of :class:`enum_tools.containers.EnumMap` with :class:`dict`.
+
+Run with ``python -m benchmarks.bench_enum_map`` from the repository root.
+"""
+
+# stdlib
+import sys
+import timeit
+from enum import Enum
+
+# this package
+from enum_tools.containers import EnumMap
+
+State = Enum("State", [f"STATE_{idx}" for idx in range(64)], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	members = list(State)
+	as_dict = {member: idx for idx, member in enumerate(members)}
+	as_map = EnumMap(State, as_dict)
+
+	print(f"{'':<12}{'bytes':>10}{'lookup (ns)':>14}{'update (ns)':>14}{'fill (µs)':>12}")
+
+	for label, mapping in [("dict", as_dict), ("EnumMap", as_map)]:
+		if isinstance(mapping, dict):
+			size = sys.getsizeof(mapping)
+		else:
+			size = sys.getsizeof(mapping) + sys.getsizeof(mapping._values)
+
+		lookup = min(timeit.repeat(lambda: [mapping[m] for m in members], number=2000, repeat=5))
+		update = min(timeit.repeat(lambda: mapping.update(as_map), number=2000, repeat=5))
+
+		if isinstance(mapping, dict):
+			fill = min(timeit.repeat(lambda: mapping.update(dict.fromkeys(members, 0)), number=2000, repeat=5))
+		else:
+			fill = min(timeit.repeat(lambda: mapping.fill(0), number=2000, repeat=5))
+
+		per_lookup = lookup / 2000 / len(members) * 1e9
+		per_update = update / 2000 / len(members) * 1e9
+		print(f"{label:<12}{size:>10}{per_lookup:>14.1f}{per_update:>14.1f}{fill / 2000 * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+	main()
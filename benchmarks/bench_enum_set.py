@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Compare the speed of set operations on :class:`enum_tools.containers.EnumSet` and :class:`frozenset`.
+
+Run with ``python -m benchmarks.bench_enum_set`` from the repository root.
+"""
+
+# stdlib
+import timeit
+from enum import Enum
+
+# this package
+from enum_tools.containers import EnumSet
+
+State = Enum("State", [f"STATE_{idx}" for idx in range(64)], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	members = list(State)
+	evens, thirds = members[::2], members[::3]
+
+	print(f"{'':<12}{'union (ns)':>12}{'and (ns)':>12}{'subset (ns)':>14}{'hash (ns)':>12}{'contains (ns)':>16}")
+
+	for label, factory in [("frozenset", frozenset), ("EnumSet", lambda m: EnumSet(State, m))]:
+		left, right = factory(evens), factory(thirds)
+		subset = factory(members[::6])
+		number = 20000
+
+		timings = [
+				min(timeit.repeat(lambda: left | right, number=number, repeat=5)),
+				min(timeit.repeat(lambda: left & right, number=number, repeat=5)),
+				min(timeit.repeat(lambda: subset <= left, number=number, repeat=5)),
+				min(timeit.repeat(lambda: hash(left), number=number, repeat=5)),
+				min(timeit.repeat(lambda: State.STATE_10 in left, number=number, repeat=5)),
+				]
+
+		print(f"{label:<12}" + "".join(f"{t / number * 1e9:>{w}.1f}" for t, w in zip(timings, (12, 12, 14, 12, 16))))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compare formatting members of the enums in :mod:`enum_tools.custom_enums`, whose output is cached,
+with formatting members of equivalent enums built on :mod:`enum` alone.
+
+Run with ``python -m benchmarks.bench_enum_strings`` from the repository root.
+"""
+
+# stdlib
+import timeit
+from enum import Enum, Flag, IntFlag
+
+# this package
+from enum_tools.custom_enums import IntEnum, IterableFlag, IterableIntFlag, StrEnum
+
+NUMBER = 200_000
+
+
+class PlainIntEnum(int, Enum):
+	pass
+
+
+class PlainStrEnum(str, Enum):
+
+	def __str__(self) -> str:
+		return self.value
+
+
+def make_members(int_enum, str_enum, flag, int_flag):  # noqa: MAN001,MAN002
+	Status = int_enum("Status", [("OK", 200), ("NOT_FOUND", 404)])
+	Level = str_enum("Level", [("INFO", "info"), ("ERROR", "error")])
+	Mode = flag("Mode", [("READ", 4), ("WRITE", 2), ("EXECUTE", 1)])
+	Permission = int_flag("Permission", [("READ", 4), ("WRITE", 2), ("EXECUTE", 1)])
+
+	return [
+			("IntEnum", Status.NOT_FOUND),
+			("StrEnum", Level.ERROR),
+			("IterableFlag", Mode.READ),
+			("IterableFlag (composite)", Mode.READ | Mode.WRITE),
+			("IterableIntFlag", Permission.READ),
+			("IterableIntFlag (composite)", Permission.READ | Permission.WRITE),
+			]
+
+
+def main() -> None:
+	plain = make_members(PlainIntEnum, PlainStrEnum, Flag, IntFlag)
+	cached = make_members(IntEnum, StrEnum, IterableFlag, IterableIntFlag)
+
+	print(f"{'':<30}{'':<10}{'enum':>10}{'enum_tools':>12}")
+
+	for (label, plain_member), (_, cached_member) in zip(plain, cached):
+		for operation, statement in [("str()", "str(m)"), ("repr()", "repr(m)"), ("f-string", "f'{m}'")]:
+			timings = [
+					min(timeit.repeat(statement, globals={'m': member}, number=NUMBER, repeat=5)) / NUMBER * 1e9
+					for member in (plain_member, cached_member)
+					]
+			print(f"{label:<30}{operation:<10}{timings[0]:>7.0f} ns{timings[1]:>9.0f} ns")
+
+
+if __name__ == "__main__":
+	main()
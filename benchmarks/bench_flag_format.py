@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compare :meth:`IterableFlag.parse <enum_tools.custom_enums.IterableFlag.parse>`
+and :meth:`~enum_tools.custom_enums.IterableFlag.format` with splitting and joining member names directly.
+
+Run with ``python -m benchmarks.bench_flag_format`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from functools import reduce
+from operator import or_
+
+# this package
+from enum_tools.custom_enums import IterableFlag
+
+Permission = IterableFlag("Permission", [f"PERM_{idx}" for idx in range(16)], module=__name__)  # type: ignore[misc]
+
+
+def naive_parse(text: str) -> Permission:
+	return reduce(or_, (Permission[name] for name in text.split('|')))
+
+
+def naive_format(flag: Permission) -> str:
+	return '|'.join(member.name for member in flag)
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	members = list(Permission)
+
+	# A log of 10,000 lines, drawn from 100 distinct combinations.
+	flags = [reduce(or_, rng.sample(members, 3)) for _ in range(100)]
+	lines = [rng.choice(flags) for _ in range(10_000)]
+	texts = [naive_format(flag) for flag in lines]
+
+	assert [Permission.parse(text) for text in texts] == [naive_parse(text) for text in texts]
+	# IterableFlag iterates from the highest bit, so only the order of the names differs
+	assert [Permission.parse(Permission.format(flag)) for flag in lines] == lines
+
+	print(f"{'':<10}{'naive (ns)':>12}{'cached (ns)':>13}")
+
+	for label, naive, cached, data in [
+			("parse", naive_parse, Permission.parse, texts),
+			("format", naive_format, Permission.format, lines),
+			]:
+		old = min(timeit.repeat(lambda: list(map(naive, data)), number=3, repeat=3)) / 3 / len(data) * 1e9
+		new = min(timeit.repeat(lambda: list(map(cached, data)), number=3, repeat=3)) / 3 / len(data) * 1e9
+		print(f"{label:<10}{old:>12.1f}{new:>13.1f}")
+
+	print(Permission.cache_info())
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Compare :meth:`IterableFlag.__len__ <enum_tools.custom_enums.IterableFlag.__len__>`,
+``__contains__`` and ``issubset`` with the equivalent operations done by iterating over the flag.
+
+Run with ``python -m benchmarks.bench_flag_ops`` from the repository root.
+"""
+
+# stdlib
+import timeit
+from functools import reduce
+from operator import or_
+
+# this package
+from enum_tools.custom_enums import IterableFlag, IterableIntFlag
+
+Permission = IterableFlag("Permission", [f"P{idx}" for idx in range(16)], module=__name__)  # type: ignore[misc]
+IntPermission = IterableIntFlag("IntPermission", [f"P{idx}" for idx in range(16)], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	print(f"{'':<16}{'':<12}{'iteration (ns)':>16}{'bitwise (ns)':>14}")
+
+	for enum in [Permission, IntPermission]:
+		members = list(enum)
+		granted = reduce(or_, members[::2])
+		required = members[0] | members[4]
+		number = 20000
+
+		cases = {
+				"len": (lambda: len(list(granted)), lambda: len(granted)),
+				"contains": (lambda: members[4] in list(granted), lambda: members[4] in granted),
+				"issubset": (lambda: set(required) <= set(granted), lambda: required.issubset(granted)),
+				}
+
+		for label, (iterating, bitwise) in cases.items():
+			old = min(timeit.repeat(iterating, number=number, repeat=5)) / number * 1e9
+			new = min(timeit.repeat(bitwise, number=number, repeat=5)) / number * 1e9
+			print(f"{enum.__name__:<16}{label:<12}{old:>16.1f}{new:>14.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compare classifying numbers into the members of an :class:`~enum_tools.custom_enums.IntervalEnum`
+with an ``if``/``elif`` chain.
+
+Run with ``python -m benchmarks.bench_interval`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from enum import Enum
+
+# 3rd party
+import numpy  # nodep
+
+# this package
+from enum_tools.custom_enums import IntervalEnum
+
+BOUNDS = [0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10_000, 20_000, 50_000, 100_000]
+
+Latency = IntervalEnum(  # type: ignore[misc]
+		"Latency",
+		[(f"UNDER_{upper}", (lower, upper)) for lower, upper in zip(BOUNDS, BOUNDS[1:])],
+		module=__name__,
+		)
+
+
+def if_chain(value: float) -> Enum:
+	if value < 1:
+		return Latency.UNDER_1
+	elif value < 2:
+		return Latency.UNDER_2
+	elif value < 5:
+		return Latency.UNDER_5
+	elif value < 10:
+		return Latency.UNDER_10
+	elif value < 20:
+		return Latency.UNDER_20
+	elif value < 50:
+		return Latency.UNDER_50
+	elif value < 100:
+		return Latency.UNDER_100
+	elif value < 200:
+		return Latency.UNDER_200
+	elif value < 500:
+		return Latency.UNDER_500
+	elif value < 1000:
+		return Latency.UNDER_1000
+	elif value < 2000:
+		return Latency.UNDER_2000
+	elif value < 5000:
+		return Latency.UNDER_5000
+	elif value < 10_000:
+		return Latency.UNDER_10000
+	elif value < 20_000:
+		return Latency.UNDER_20000
+	elif value < 50_000:
+		return Latency.UNDER_50000
+	else:
+		return Latency.UNDER_100000
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	values = [rng.lognormvariate(5, 2) % 100_000 for _ in range(100_000)]
+	array = numpy.array(values)
+
+	expected = [if_chain(value) for value in values]
+	assert [Latency(value) for value in values] == expected
+	assert [Latency.lookup(value) for value in values] == expected
+	assert Latency.lookup_array(array).tolist() == expected
+
+	print(f"Classifying {len(values)} values into {len(Latency)} intervals")
+
+	for label, function in [
+			("if/elif chain", lambda: [if_chain(value) for value in values]),
+			("Latency(value)", lambda: [Latency(value) for value in values]),
+			("Latency.lookup", lambda: list(map(Latency.lookup, values))),
+			("lookup_array", lambda: Latency.lookup_array(array)),
+			]:
+		elapsed = min(timeit.repeat(function, number=1, repeat=3))
+		print(f"{label:<16}{elapsed / len(values) * 1e9:>8.1f} ns per value")
+
+
+if __name__ == "__main__":
+	main()
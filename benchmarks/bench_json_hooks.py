@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare :mod:`enum_tools.json_hooks` with a naive ``default`` function and per-field ``Cls(value)`` decoding.
+
+Run with ``python -m benchmarks.bench_json_hooks`` from the repository root.
+"""
+
+# stdlib
+import json
+import timeit
+from enum import Enum
+from typing import Any, Dict, List
+
+# this package
+from enum_tools.custom_enums import IterableFlag
+from enum_tools.json_hooks import EnumEncoder, make_object_hook
+
+
+class Region(Enum):
+	EUROPE = "eu"
+	AMERICAS = "am"
+	ASIA = "as"
+	AFRICA = "af"
+	OCEANIA = "oc"
+
+
+class Features(IterableFlag):
+	SEARCH = 1
+	EXPORT = 2
+	SHARE = 4
+	ADMIN = 8
+
+
+def naive_default(obj: Any) -> Any:
+	if isinstance(obj, IterableFlag):
+		return [member.name for member in type(obj) if member in obj]
+	elif isinstance(obj, Enum):
+		return obj.value
+	raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def naive_object_hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+	if "region" in obj:
+		obj["region"] = Region(obj["region"])
+	if "features" in obj:
+		value = 0
+		for name in obj["features"]:
+			value |= Features[name].value
+		obj["features"] = Features(value)
+	return obj
+
+
+def make_payload(count: int = 5000) -> List[Dict[str, Any]]:
+	regions = list(Region)
+	return [{"id": idx, "region": regions[idx % 5], "features": Features(idx % 16)} for idx in range(count)]
+
+
+def main() -> None:
+	payload = make_payload()
+	encoder = EnumEncoder()
+	hook = make_object_hook({"region": Region, "features": Features})
+	assert json.dumps(payload, default=naive_default) == json.dumps(payload, default=encoder)
+	text = json.dumps(payload, default=encoder)
+
+	timings = {
+			"encode (naive)": lambda: json.dumps(payload, default=naive_default),
+			"encode (EnumEncoder)": lambda: json.dumps(payload, default=encoder),
+			"decode (naive)": lambda: json.loads(text, object_hook=naive_object_hook),
+			"decode (make_object_hook)": lambda: json.loads(text, object_hook=hook),
+			}
+
+	for label, function in timings.items():
+		best = min(timeit.repeat(function, number=5, repeat=5)) / 5
+		print(f"{label:<28}{len(payload) / best / 1e3:>10.1f}k records/s")
+
+
+if __name__ == "__main__":
+	main()
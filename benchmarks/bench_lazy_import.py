@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compare the time taken to import a module defining a large :class:`~enum.Enum`
+with one defining the equivalent :class:`enum_tools.lazy.LazyEnum`.
+
+Run with ``python -m benchmarks.bench_lazy_import [member_count]`` from the repository root.
+"""
+
+# stdlib
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_TEMPLATE = """\
+import time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{module}.Catalogue.ITEM_{last}
+{module}.Catalogue({middle})
+accessed = time.perf_counter()
+print(imported - start, accessed - imported)
+"""
+
+
+def write_modules(directory: Path, member_count: int) -> None:
+	members = ''.join(f"\t\tITEM_{idx} = {idx}\n" for idx in range(member_count))
+	(directory / "eager_catalogue.py").write_text(
+			f"from enum import Enum\n\n\nclass Catalogue(Enum):\n{members}",
+			)
+
+	table = ''.join(f"\t\t\t(\"ITEM_{idx}\", {idx}),\n" for idx in range(member_count))
+	(directory / "lazy_catalogue.py").write_text(
+			"from enum_tools.lazy import LazyEnum\n\n\n"
+			f"class Catalogue(LazyEnum):\n\t_table_ = (\n{table}\t\t\t)\n",
+			)
+
+
+def main() -> None:
+	member_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		write_modules(Path(tmpdir), member_count)
+
+		print(f"{member_count} members")
+		print(f"{'':<10}{'import (ms)':>14}{'two lookups (ms)':>18}")
+
+		for label in ["eager", "lazy"]:
+			code = _TEMPLATE.format(module=f"{label}_catalogue", last=member_count - 1, middle=member_count // 2)
+
+			# Run twice, and report the second run so both import from bytecode caches.
+			for _ in range(2):
+				output = subprocess.run(
+						[sys.executable, "-c", code],
+						cwd=tmpdir,
+						check=True,
+						capture_output=True,
+						text=True,
+						env={"PYTHONPATH": f"{Path.cwd()}"},
+						).stdout
+
+			import_time, access_time = map(float, output.split())
+			print(f"{label:<10}{import_time * 1000:>14.1f}{access_time * 1000:>18.3f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Measure the cost of :func:`dir` on the members of a large :class:`~enum_tools.custom_enums.MemberDirEnum`,
+compared with computing the result without a cache.
+
+Run with ``python -m benchmarks.bench_member_dir`` from the repository root.
+"""
+
+# stdlib
+import timeit
+from enum import Enum
+from typing import List
+
+# this package
+from enum_tools.custom_enums import MemberDirEnum
+
+
+class CodeBase(int, MemberDirEnum):
+	"""
+	An enum with a mixin type, which gives :meth:`enum.Enum.__dir__` more work to do.
+	"""
+
+	def __new__(cls, value: int, description: str):  # noqa: D102
+		member = int.__new__(cls, value)
+		member._value_ = value
+		member.description = description
+		return member
+
+
+Code = CodeBase("Code", [(f"CODE_{idx}", (idx, f"Code {idx}")) for idx in range(5000)])  # type: ignore[misc]
+
+
+def uncached_dir(member: MemberDirEnum) -> List[str]:
+	return sorted(Enum.__dir__(member) + [m for m in member.__dict__ if m[0] != '_'])
+
+
+def main() -> None:
+	members = list(Code)
+	assert [dir(member) for member in members[:100]] == [uncached_dir(member) for member in members[:100]]
+
+	uncached = min(timeit.repeat(lambda: [uncached_dir(member) for member in members], number=1, repeat=3))
+	cached = min(timeit.repeat(lambda: [dir(member) for member in members], number=1, repeat=3))
+
+	print(f"dir() on {len(members)} members")
+	print(f"{'uncached':<10}{uncached / len(members) * 1e6:>8.1f} µs per member")
+	print(f"{'cached':<10}{cached / len(members) * 1e6:>8.1f} µs per member")
+
+
+if __name__ == "__main__":
+	main()
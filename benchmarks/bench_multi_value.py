@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Compare looking up members of a :class:`~enum_tools.custom_enums.MultiValueEnum` by their extra values
+with an :class:`~enum.Enum` whose ``_missing_`` searches the members for the value.
+
+Run with ``python -m benchmarks.bench_multi_value`` from the repository root.
+"""
+
+# stdlib
+import random
+import timeit
+from enum import Enum
+from typing import Any, Optional
+
+# this package
+from enum_tools.custom_enums import MultiValueEnum
+
+TABLE = [(f"COUNTRY_{idx}", (idx, f"C{idx}", f"CC{idx}", f"Country {idx}")) for idx in range(250)]
+
+
+class _SearchingBase(Enum):
+
+	def __new__(cls, *values):  # noqa: D102
+		member = object.__new__(cls)
+		member._value_ = values[0]
+		member.codes = values
+		return member
+
+	@classmethod
+	def _missing_(cls, value: Any) -> Optional["_SearchingBase"]:
+		for member in cls:
+			if value in member.codes:
+				return member
+		return None
+
+
+Searching = _SearchingBase("Searching", TABLE, module=__name__)  # type: ignore[misc]
+Indexed = MultiValueEnum("Indexed", TABLE, module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	keys = [values[rng.randrange(4)] for _, values in (rng.choice(TABLE) for _ in range(50_000))]
+	assert [Searching(key).name for key in keys] == [Indexed(key).name for key in keys]
+
+	print(f"Lookup by any of 4 values, {len(TABLE)} members")
+
+	for label, enum in [("_missing_ search", Searching), ("MultiValueEnum", Indexed)]:
+		elapsed = min(timeit.repeat(lambda: [enum(key) for key in keys], number=1, repeat=3))
+		print(f"{label:<18}{elapsed / len(keys) * 1e9:>10.0f} ns per lookup")
+
+
+if __name__ == "__main__":
+	main()
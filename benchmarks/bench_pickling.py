@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Compare the size and speed of pickling enum members with and without :mod:`enum_tools.pickling`.
+
+Run with ``python -m benchmarks.bench_pickling`` from the repository root.
+"""
+
+# stdlib
+import pickle
+import timeit
+from typing import Dict, List, Type
+
+# this package
+from enum_tools import StrEnum
+from enum_tools.pickling import register, set_extension_code
+
+MEMBERS = [(f"STATUS_{idx}", f"status-{idx}") for idx in range(50)]
+
+Default = StrEnum("Default", MEMBERS, module=__name__)  # type: ignore[misc]
+ByName = StrEnum("ByName", MEMBERS, module=__name__)  # type: ignore[misc]
+ByInt = StrEnum("ByInt", MEMBERS, module=__name__)  # type: ignore[misc]
+
+register(ByName)
+register(ByInt, key=1)
+set_extension_code(200)
+
+
+def make_messages(enum: Type[StrEnum], count: int = 1000) -> List[Dict]:
+	members = list(enum)
+	return [{"id": idx, "status": members[idx % 50], "previous": members[(idx + 7) % 50]} for idx in range(count)]
+
+
+def main() -> None:
+	print(f"{'strategy':<20}{'bytes/message':>15}{'dumps (µs)':>12}{'loads (µs)':>12}{'batch bytes':>13}")
+
+	for label, enum in [("default", Default), ("registered (name)", ByName), ("registered (int)", ByInt)]:
+		messages = make_messages(enum)
+		pickled = [pickle.dumps(message) for message in messages]
+		batch = pickle.dumps(messages)
+
+		dumps = min(timeit.repeat(lambda: [pickle.dumps(m) for m in messages], number=5, repeat=5)) / 5
+		loads = min(timeit.repeat(lambda: [pickle.loads(p) for p in pickled], number=5, repeat=5)) / 5
+
+		size = sum(map(len, pickled)) / len(pickled)
+		per_message = 1e6 / len(messages)
+		print(f"{label:<20}{size:>15.1f}{dumps * per_message:>12.2f}{loads * per_message:>12.2f}{len(batch):>13}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compare sending a large :class:`~enum_tools.arrays.EnumArray` to process pool workers by pickling it
+with sending a :class:`~enum_tools.shared.SharedEnumArray`.
+
+Run with ``python -m benchmarks.bench_shared`` from the repository root.
+"""
+
+# stdlib
+import multiprocessing
+import time
+from enum import Enum
+from typing import Union
+
+# 3rd party
+import numpy  # nodep
+
+# this package
+from enum_tools.arrays import EnumArray
+from enum_tools.shared import SharedEnumArray
+
+Region = Enum("Region", [f"REGION_{idx}" for idx in range(300)], module=__name__)  # type: ignore[misc]
+
+LENGTH = 50_000_000
+TASKS = 8
+
+
+def count_first(data: Union[EnumArray, SharedEnumArray]) -> int:
+	if isinstance(data, SharedEnumArray):
+		with data:
+			array = data.array
+			result = int((array == Region.REGION_0).sum())
+			del array
+			return result
+
+	return int((data == Region.REGION_0).sum())
+
+
+def main() -> None:
+	rng = numpy.random.default_rng(1234)
+	array = EnumArray(Region, rng.integers(0, len(Region), LENGTH))
+
+	print(f"{TASKS} tasks over an array of {LENGTH} members ({array.nbytes / 2**20:.0f} MiB)")
+
+	# The shared array is created before the pool, so the workers share this process's resource tracker.
+	start = time.perf_counter()
+	shared = SharedEnumArray.create(array)
+	setup = time.perf_counter() - start
+
+	with shared, multiprocessing.Pool(4) as pool:
+		pool.map(abs, range(4))
+
+		start = time.perf_counter()
+		pickled = pool.map(count_first, [array] * TASKS)
+		print(f"{'pickled EnumArray':<20}{(time.perf_counter() - start) * 1e3:>8.0f} ms")
+
+		start = time.perf_counter()
+		results = pool.map(count_first, [shared] * TASKS)
+		print(f"{'SharedEnumArray':<20}{(time.perf_counter() - start) * 1e3:>8.0f} ms  (+{setup * 1e3:.0f} ms to create)")
+
+	assert results == pickled
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compare creating large enums with the functional API against rebuilding them
+with :func:`enum_tools.snapshot.cached_enum`.
+
+On Python 3.9 and 3.10 creating an enum takes time quadratic in the number of members,
+so the functional API takes several minutes for the largest enum.
+
+Run with ``python -m benchmarks.bench_snapshot`` from the repository root.
+"""
+
+# stdlib
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+# this package
+from enum_tools import IntEnum
+from enum_tools.snapshot import cached_enum
+
+SIZES = [10_000, 100_000]
+
+
+def best_of(function: Callable[[], object], repeat: int = 3) -> float:
+	timings = []
+
+	for _ in range(repeat):
+		start = time.perf_counter()
+		function()
+		timings.append(time.perf_counter() - start)
+
+	return min(timings)
+
+
+def main() -> None:
+	print(f"Python {sys.version.split()[0]}")
+	print(f"{'members':>10}{'functional API':>18}{'snapshot':>12}{'with key':>12}{'file size':>12}")
+
+	with tempfile.TemporaryDirectory() as tmpdir:
+		for size in SIZES:
+			members = [(f"PRODUCT_{idx}", idx) for idx in range(size)]
+			filename = os.path.join(tmpdir, f"products-{size}.snapshot")
+
+			functional = best_of(lambda: IntEnum("Product", members, module=__name__), repeat=1)  # type: ignore[misc]
+
+			cached_enum(filename, "Product", members, type=IntEnum)
+			cached = best_of(lambda: cached_enum(filename, "Product", members, type=IntEnum))
+
+			cached_enum(filename, "Product", members, type=IntEnum, key="v1")
+			keyed = best_of(lambda: cached_enum(filename, "Product", members, type=IntEnum, key="v1"))
+
+			print(
+					f"{size:>10,}{functional * 1e3:>15.0f} ms{cached * 1e3:>9.0f} ms{keyed * 1e3:>9.0f} ms"
+					f"{os.path.getsize(filename) / 1024:>9.0f} KiB"
+					)
+
+
+if __name__ == "__main__":
+	main()
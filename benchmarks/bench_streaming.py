@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare decoding records with :func:`enum_tools.streaming.iter_records` and
+:func:`enum_tools.streaming.iter_column_batches` with reading and decoding them one record at a time.
+
+Run with ``python -m benchmarks.bench_streaming`` from the repository root.
+"""
+
+# stdlib
+import asyncio
+import random
+import struct
+import timeit
+from enum import Enum
+from typing import Any, Awaitable, Callable, List, Tuple
+
+# this package
+from enum_tools import IntEnum
+from enum_tools.streaming import RecordLayout, iter_column_batches, iter_records
+
+Method = Enum("Method", ["GET", "POST", "PUT", "DELETE"], module=__name__)  # type: ignore[misc]
+Status = IntEnum("Status", [(f"S{code}", code) for code in range(200, 600)], module=__name__)  # type: ignore[misc]
+Region = Enum("Region", [f"R{idx}" for idx in range(20)], module=__name__)  # type: ignore[misc]
+
+LAYOUT = RecordLayout([(Method, 1), (Status, 2), (Region, 1)])
+
+
+def make_reader(data: bytes) -> asyncio.StreamReader:
+	reader = asyncio.StreamReader()
+	reader.feed_data(data)
+	reader.feed_eof()
+	return reader
+
+
+async def naive(data: bytes) -> List[Tuple[Enum, ...]]:
+	reader = make_reader(data)
+	methods, statuses, regions = list(Method), list(Status), list(Region)
+	records = []
+
+	while True:
+		try:
+			record = await reader.readexactly(4)
+		except asyncio.IncompleteReadError:
+			break
+
+		method, status, region = struct.unpack("<BHB", record)
+		records.append((methods[method], statuses[status], regions[region]))
+
+	return records
+
+
+async def records(data: bytes) -> List[Tuple[Enum, ...]]:
+	return [record async for record in iter_records(make_reader(data), LAYOUT)]
+
+
+async def column_batches(data: bytes) -> List[Tuple[List[Enum], ...]]:
+	return [columns async for columns in iter_column_batches(make_reader(data), LAYOUT)]
+
+
+def as_records(batches: List[Tuple[List[Enum], ...]]) -> List[Tuple[Enum, ...]]:
+	return [record for columns in batches for record in zip(*columns)]
+
+
+def main() -> None:
+	rng = random.Random(1234)
+	expected = [(rng.choice(list(Method)), rng.choice(list(Status)), rng.choice(list(Region))) for _ in range(200_000)]
+	data = LAYOUT.encode(expected)
+
+	decoders: List[Tuple[str, Callable[[bytes], Awaitable[Any]], Callable[[Any], List[Tuple[Enum, ...]]]]] = [
+			("per record", naive, list),
+			("iter_records", records, list),
+			("iter_column_batches", column_batches, as_records),
+			]
+
+	for label, decoder, to_records in decoders:
+		assert to_records(asyncio.run(decoder(data))) == expected
+
+		elapsed = min(timeit.repeat(lambda: asyncio.run(decoder(data)), number=1, repeat=5))
+		print(f"{label:<21}{elapsed / len(expected) * 1e9:>6.0f} ns per record")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Measure how the cached lookup paths of ``enum_tools`` scale with the number of threads.
+
+Each thread does the same amount of work, so on a free-threaded build (``python3.13t``)
+the total throughput should grow with the number of threads, up to the number of cores.
+With the GIL the threads take turns, and the throughput stays roughly the same.
+
+Run with ``python -m benchmarks.bench_threading`` from the repository root.
+"""
+
+# stdlib
+import sys
+import threading
+import time
+from typing import Callable, List
+
+# this package
+from enum_tools import IntEnum
+from enum_tools.containers import EnumSet
+from enum_tools.custom_enums import IterableIntFlag
+from enum_tools.utils import get_members
+
+OPERATIONS = 20_000
+THREADS = [1, 2, 4, 8, 16]
+
+Status = IntEnum("Status", [(f"S{idx}", idx) for idx in range(64)], module=__name__)  # type: ignore[misc]
+Permission = IterableIntFlag(  # type: ignore[call-arg]
+		"Permission",
+		[(f"P{idx}", 1 << idx) for idx in range(8)],
+		module=__name__,
+		)
+
+
+def from_int() -> None:
+	lookup = Status.from_int
+	for value in range(OPERATIONS):
+		lookup(value & 63)
+
+
+def flag_iteration() -> None:
+	for value in range(OPERATIONS // 10):
+		list(Permission(value & 255))
+
+
+def flag_format() -> None:
+	for value in range(OPERATIONS):
+		Permission.format(value & 255)
+
+
+def enum_set() -> None:
+	members = get_members(Status)[::3]
+	for _ in range(OPERATIONS // 10):
+		EnumSet(Status, members)
+
+
+def throughput(function: Callable[[], None], threads: int) -> float:
+	barrier = threading.Barrier(threads + 1)
+
+	def worker() -> None:
+		barrier.wait()
+		function()
+
+	pool: List[threading.Thread] = [threading.Thread(target=worker) for _ in range(threads)]
+	for thread in pool:
+		thread.start()
+
+	start = time.perf_counter()
+	barrier.wait()
+	for thread in pool:
+		thread.join()
+
+	return threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+	gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+	print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+	print("Calls of each workload per second, relative to one thread")
+	print(f"{'':<18}" + ''.join(f"{threads:>8}" for threads in THREADS))
+
+	for function in (from_int, flag_iteration, flag_format, enum_set):
+		# Warm the caches first, so only the read paths are measured.
+		function()
+
+		baseline = throughput(function, 1)
+		ratios = [max(throughput(function, threads) for _ in range(3)) / baseline for threads in THREADS]
+		print(f"{function.__name__:<18}" + ''.join(f"{ratio:>7.2f}x" for ratio in ratios))
+
+
+if __name__ == "__main__":
+	main()
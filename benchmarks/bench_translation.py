@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compare translating members between two enums with :class:`enum_tools.translation.EnumTranslator`
+against looking each member up by name, and against a hand-written dictionary.
+
+Run with ``python -m benchmarks.bench_translation`` from the repository root.
+"""
+
+# stdlib
+import timeit
+from enum import Enum
+
+# this package
+from enum_tools.translation import EnumTranslator
+
+SIZE = 256
+NUMBER = 20
+
+Source = Enum("Source", [(f"M{idx}", idx) for idx in range(SIZE)], module=__name__)  # type: ignore[misc]
+Target = Enum("Target", [(f"M{idx}", f"m{idx}") for idx in reversed(range(SIZE))], module=__name__)  # type: ignore[misc]
+
+
+def main() -> None:
+	members = [Source(idx % SIZE) for idx in range(100_000)]
+	translator = EnumTranslator.by_name(Source, Target)
+	mapping = {member: Target[member.name] for member in Source}
+
+	def by_name() -> None:
+		[Target[member.name] for member in members]
+
+	def by_dict() -> None:
+		[mapping[member] for member in members]
+
+	def by_translator() -> None:
+		translator.translate_members(members)
+
+	candidates = [("Target[member.name]", by_name), ("dict lookup", by_dict), ("translate_members", by_translator)]
+
+	try:
+		# this package
+		from enum_tools.arrays import EnumArray
+	except ImportError:  # pragma: no cover
+		pass
+	else:
+		array = EnumArray.from_members(Source, members)
+		candidates.append(("translate_array", lambda: translator.translate_array(array)))
+
+	print(f"Translating {len(members):,} members")
+
+	for label, function in candidates:
+		best = min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER
+		print(f"{label:<24}{best * 1e3:>8.2f} ms")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+#  __main__.py
+"""
+Command line interface for enum_tools.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import argparse
+import sys
+from typing import List, Optional
+
+# this package
+from enum_tools.codegen import BASES, generate_module, load_spec
+
+__all__ = ["main"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	"""
+	Entry point for ``python -m enum_tools``.
+
+	:param argv: The command line arguments. Defaults to :py:obj:`sys.argv`.
+
+	:returns: The exit code.
+	"""
+
+	parser = argparse.ArgumentParser(prog="python -m enum_tools")
+	subparsers = parser.add_subparsers(dest="command", required=True)
+
+	generate = subparsers.add_parser("generate", help="Generate a module defining an enum from a JSON or CSV file.")
+	generate.add_argument("spec", help="The JSON or CSV file containing the specification.")
+	generate.add_argument("-o", "--output", help="The file to write the module to. Defaults to standard output.")
+	generate.add_argument("--name", help="The name of the enum. Required for CSV files.")
+	generate.add_argument("--base", choices=list(BASES), help="The base class of the enum.")
+	generate.add_argument("--lazy", action="store_true", help="Generate a LazyEnum, whose members are created on demand.")
+
+	args = parser.parse_args(argv)
+
+	try:
+		spec = load_spec(args.spec, name=args.name, base=args.base)
+		source = generate_module(spec, lazy=args.lazy, source=args.spec)
+	except (OSError, ValueError) as e:
+		print(f"error: {e}", file=sys.stderr)
+		return 1
+
+	if args.output is None:
+		sys.stdout.write(source)
+	else:
+		with open(args.output, 'w', encoding="UTF-8") as fp:
+			fp.write(source)
+
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
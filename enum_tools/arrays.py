@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+#
+#  arrays.py
+"""
+NumPy-backed arrays of enum members.
+
+An :class:`~.EnumArray` stores a column of members as a NumPy array of their ordinals
+(see :func:`enum_tools.utils.get_members`), using the smallest unsigned integer type which can hold them.
+Comparisons, membership tests and counts are vectorised over the ordinals.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from enum import Enum
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Tuple, Type, TypeVar, Union, overload
+from weakref import WeakKeyDictionary
+
+# 3rd party
+import numpy  # nodep
+
+# this package
+from enum_tools.codec import get_ordinal_width
+from enum_tools.containers import EnumCounter, _get_id_ordinals
+from enum_tools.utils import get_members
+
+__all__ = ["EnumArray", "get_code_dtype"]
+
+_E = TypeVar("_E", bound=Enum)
+
+# Arrays of the values and names of each enum's members, indexed by ordinal.
+_tables: "WeakKeyDictionary[Type[Enum], Dict[str, numpy.ndarray]]" = WeakKeyDictionary()
+
+
+def get_code_dtype(enum: Type[Enum]) -> numpy.dtype:
+	"""
+	Returns the smallest unsigned integer dtype which can hold the ordinal of every member of ``enum``.
+
+	:param enum:
+	"""
+
+	return numpy.dtype(f"u{get_ordinal_width(enum)}")
+
+
+def _get_table(enum: Type[Enum], kind: str) -> numpy.ndarray:
+	try:
+		return _tables[enum][kind]
+	except KeyError:
+		pass
+
+	members = get_members(enum)
+
+	if kind == "names":
+		table = numpy.array([member._name_ for member in members])
+	else:
+		table = _to_array(member._value_ for member in members)
+
+	table.flags.writeable = False
+	return _tables.setdefault(enum, {}).setdefault(kind, table)
+
+
+class EnumArray(Generic[_E]):
+	"""
+	An array of members of ``enum``, stored as a NumPy array of their ordinals.
+
+	:param enum:
+	:param codes: The ordinals of the members.
+		The array is converted to the dtype returned by :func:`~.get_code_dtype`, copying it if necessary.
+
+	:raises ValueError: If any of the ordinals is out of range for the enum.
+	"""
+
+	__slots__ = ("_enum", "_codes")
+
+	_enum: Type[_E]
+	_codes: numpy.ndarray
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def __init__(self, enum: Type[_E], codes: Union[numpy.ndarray, Iterable[int]]):
+		codes = numpy.asarray(codes)
+		member_count = len(get_members(enum))
+
+		if codes.ndim != 1:
+			raise ValueError("codes must be one-dimensional")
+
+		if codes.size:
+			if codes.dtype.kind not in "iu":
+				raise TypeError(f"codes must be integers, not {codes.dtype}")
+			if codes.min() < 0 or codes.max() >= member_count:
+				raise ValueError(f"ordinal out of range for {enum.__qualname__}")
+
+		self._enum = enum
+		self._codes = codes.astype(get_code_dtype(enum), copy=False)
+
+	@classmethod
+	def _from_valid_codes(cls, enum: Type[_E], codes: numpy.ndarray) -> "EnumArray[_E]":
+		new = object.__new__(cls)
+		new._enum = enum
+		new._codes = codes
+		return new
+
+	@classmethod
+	def from_members(cls, enum: Type[_E], members: Iterable[_E]) -> "EnumArray[_E]":
+		"""
+		Construct an array from members of ``enum``.
+
+		:param enum:
+		:param members:
+
+		:raises ValueError: If ``members`` contains objects which are not canonical members of ``enum``.
+		"""
+
+		index = _get_id_ordinals(enum)
+
+		try:
+			codes = numpy.fromiter(map(index.__getitem__, map(id, members)), dtype=get_code_dtype(enum))
+		except KeyError:
+			raise ValueError(f"not all items are canonical members of {enum.__qualname__}") from None
+
+		return cls._from_valid_codes(enum, codes)
+
+	@classmethod
+	def from_values(cls, enum: Type[_E], values: Union[numpy.ndarray, Iterable[Any]]) -> "EnumArray[_E]":
+		"""
+		Construct an array from the values of members of ``enum``.
+
+		Each distinct value is only looked up once.
+
+		:param enum:
+		:param values:
+
+		:raises ValueError: If ``values`` contains a value which is not the value of a member.
+		"""
+
+		unique, inverse = _unique(_to_array(values))
+		index = _get_id_ordinals(enum)
+
+		try:
+			ordinals = [index[id(enum(value))] for value in unique]
+		except KeyError:
+			raise ValueError(f"not all values are values of canonical members of {enum.__qualname__}") from None
+
+		return cls._from_lookup(enum, ordinals, inverse)
+
+	@classmethod
+	def from_names(cls, enum: Type[_E], names: Union[numpy.ndarray, Iterable[str]]) -> "EnumArray[_E]":
+		"""
+		Construct an array from the names of members of ``enum``.
+
+		Each distinct name is only looked up once. Aliases may be used.
+
+		:param enum:
+		:param names:
+
+		:raises ValueError: If ``names`` contains a name which is not the name of a member.
+		"""
+
+		unique, inverse = _unique(_to_array(names))
+		index = _get_id_ordinals(enum)
+
+		try:
+			ordinals = [index[id(enum.__members__[name])] for name in unique]
+		except KeyError as e:
+			raise ValueError(f"{e.args[0]!r} is not the name of a canonical member of {enum.__qualname__}") from None
+
+		return cls._from_lookup(enum, ordinals, inverse)
+
+	@classmethod
+	def _from_lookup(cls, enum: Type[_E], ordinals: List[int], inverse: numpy.ndarray) -> "EnumArray[_E]":
+		dtype = get_code_dtype(enum)
+		return cls._from_valid_codes(enum, numpy.array(ordinals, dtype=dtype).take(inverse.ravel()))
+
+	@property
+	def enum(self) -> Type[_E]:
+		"""
+		The enum whose members are in the array.
+		"""
+
+		return self._enum
+
+	@property
+	def codes(self) -> numpy.ndarray:
+		"""
+		A read-only view of the ordinals of the members in the array.
+		"""
+
+		codes = self._codes.view()
+		codes.flags.writeable = False
+		return codes
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		The number of bytes used by the ordinals.
+		"""
+
+		return self._codes.nbytes
+
+	def __len__(self) -> int:
+		return len(self._codes)
+
+	@overload
+	def __getitem__(self, item: int) -> _E: ...
+
+	@overload
+	def __getitem__(self, item: Union[slice, numpy.ndarray, List[int]]) -> "EnumArray[_E]": ...
+
+	def __getitem__(self, item: Union[int, slice, numpy.ndarray, List[int]]) -> Union[_E, "EnumArray[_E]"]:
+		"""
+		Returns the member at the given position, or an array of the members selected by a slice, index array or mask.
+
+		Slicing returns a view of the same ordinals, without copying them.
+
+		:param item:
+		"""
+
+		codes = self._codes[item]
+
+		if isinstance(codes, numpy.ndarray):
+			return self._from_valid_codes(self._enum, codes)
+
+		return get_members(self._enum)[codes]  # type: ignore[return-value]
+
+	def __iter__(self) -> Iterator[_E]:
+		return iter(self.tolist())
+
+	def tolist(self) -> List[_E]:
+		"""
+		Returns the members in the array, as a list.
+		"""
+
+		return list(map(get_members(self._enum).__getitem__, self._codes.tolist()))  # type: ignore[arg-type]
+
+	def _ordinal(self, member: Any) -> int:
+		try:
+			return _get_id_ordinals(self._enum)[id(member)]
+		except KeyError:
+			return -1
+
+	def __eq__(self, other: object) -> numpy.ndarray:  # type: ignore[override]
+		"""
+		Returns a boolean array of whether each member equals ``other``.
+
+		:param other: A member of the enum, or another :class:`~.EnumArray` for the same enum with the same length.
+		"""
+
+		if isinstance(other, EnumArray):
+			if other._enum is not self._enum:
+				return numpy.zeros(len(self), dtype=bool)
+			return self._codes == other._codes
+
+		return self._codes == self._ordinal(other)
+
+	def __ne__(self, other: object) -> numpy.ndarray:  # type: ignore[override]
+		return ~(self == other)
+
+	def isin(self, members: Iterable[_E]) -> numpy.ndarray:
+		"""
+		Returns a boolean array of whether each member of the array is in ``members``.
+
+		:param members:
+		"""
+
+		mask = numpy.zeros(len(get_members(self._enum)), dtype=bool)
+		ordinals = [ordinal for ordinal in map(self._ordinal, members) if ordinal >= 0]
+		mask[ordinals] = True
+		return mask.take(self._codes)
+
+	def value_counts(self) -> EnumCounter[_E]:
+		"""
+		Returns the number of times each member occurs in the array.
+		"""
+
+		counter = EnumCounter(self._enum)
+		counter.update_ordinals(self._codes)
+		return counter
+
+	def values(self) -> numpy.ndarray:
+		"""
+		Returns an array of the values of the members in the array.
+		"""
+
+		return _get_table(self._enum, "values").take(self._codes)
+
+	def names(self) -> numpy.ndarray:
+		"""
+		Returns an array of the names of the members in the array.
+		"""
+
+		return _get_table(self._enum, "names").take(self._codes)
+
+	def copy(self) -> "EnumArray[_E]":
+		"""
+		Returns a copy of the array, with its own copy of the ordinals.
+		"""
+
+		return self._from_valid_codes(self._enum, self._codes.copy())
+
+	def __repr__(self) -> str:
+		members = get_members(self._enum)
+
+		if len(self) > 10:
+			head = ", ".join(repr(members[code]._name_) for code in self._codes[:5].tolist())
+			tail = ", ".join(repr(members[code]._name_) for code in self._codes[-5:].tolist())
+			names = f"{head}, ..., {tail}"
+		else:
+			names = ", ".join(repr(members[code]._name_) for code in self._codes.tolist())
+
+		return f"{self.__class__.__name__}({self._enum.__qualname__}, [{names}])"
+
+	def __reduce__(self) -> Tuple:
+		return self.__class__, (self._enum, self._codes)
+
+
+def _is_uniform(items: List[Any]) -> bool:
+	# Whether NumPy can store the items without converting any of them to another type.
+	return any(all(isinstance(item, kind) for item in items) for kind in (str, int, float))
+
+
+def _to_array(items: Union[numpy.ndarray, Iterable[Any]]) -> numpy.ndarray:
+	if isinstance(items, numpy.ndarray):
+		return items
+
+	items = list(items)
+
+	if _is_uniform(items):
+		array = numpy.array(items)
+		if array.ndim == 1:
+			return array
+
+	# Mixed values would all be converted to strings, and values such as tuples would become extra dimensions.
+	array = numpy.empty(len(items), dtype=object)
+	array[:] = items
+	return array
+
+
+def _unique(array: numpy.ndarray) -> Tuple[List[Any], numpy.ndarray]:
+	"""
+	Returns the distinct items in ``array``, and the position of each item of ``array`` in them.
+	"""
+
+	if array.dtype != object:
+		unique, inverse = numpy.unique(array, return_inverse=True)
+		return unique.tolist(), inverse
+
+	# Objects of different types cannot be sorted, so are deduplicated by hashing instead.
+	items = array.tolist()
+	unique = list(dict.fromkeys(items))
+	positions = {item: position for position, item in enumerate(unique)}
+	return unique, numpy.fromiter(map(positions.__getitem__, items), dtype=numpy.intp, count=len(items))
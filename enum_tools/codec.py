@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+#
+#  codec.py
+"""
+Compact binary encoding of sequences of enum members.
+
+Members are stored as their ordinals (see :func:`enum_tools.utils.get_members`),
+using the smallest unsigned integer width which can hold every ordinal of the enum.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import struct
+import sys
+from array import array
+from enum import Enum
+from operator import attrgetter
+from typing import Iterable, List, NamedTuple, Type, Union
+
+# this package
+from enum_tools.utils import get_members, get_ordinals
+
+__all__ = [
+		"Header",
+		"MAGIC",
+		"decode_members",
+		"decode_ordinals",
+		"encode_members",
+		"encode_ordinals",
+		"get_identity",
+		"get_ordinal_width",
+		"read_header",
+		]
+
+#: The magic bytes at the start of every encoded sequence.
+MAGIC = b"ETOC"
+
+_VERSION = 1
+
+# magic, version, width, reserved, member count, length, identity length
+_header_struct = struct.Struct("<4sBBHIQH")
+
+_typecodes = {1: 'B', 2: 'H', 4: 'I'}
+
+_BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class Header(NamedTuple):
+	"""
+	The header of an encoded sequence of enum members.
+	"""
+
+	#: The identity of the enum, as returned by :func:`~.get_identity`.
+	identity: str
+
+	#: The number of canonical members of the enum.
+	member_count: int
+
+	#: The width of each ordinal, in bytes.
+	width: int
+
+	#: The number of encoded members.
+	length: int
+
+	#: The offset of the first ordinal from the start of the data.
+	offset: int
+
+
+def get_identity(enum: Type[Enum]) -> str:
+	"""
+	Returns the identity of ``enum`` as stored in the header, i.e. its module and qualified name.
+
+	:param enum:
+	"""
+
+	return f"{enum.__module__}.{enum.__qualname__}"
+
+
+def get_ordinal_width(enum: Type[Enum]) -> int:
+	"""
+	Returns the smallest width, in bytes, which can hold every ordinal of ``enum``.
+
+	:param enum:
+
+	:returns: ``1``, ``2`` or ``4``.
+	"""
+
+	member_count = len(get_members(enum))
+
+	if member_count <= 0x100:
+		return 1
+	elif member_count <= 0x10000:
+		return 2
+	else:
+		return 4
+
+
+def encode_ordinals(ordinals: Iterable[int], enum: Type[Enum]) -> bytes:
+	"""
+	Encode a sequence of ordinals of members of ``enum``.
+
+	:param ordinals:
+	:param enum:
+
+	:raises ValueError: If an ordinal is out of range for the enum.
+	"""
+
+	member_count = len(get_members(enum))
+	width = get_ordinal_width(enum)
+
+	try:
+		codes = array(_typecodes[width], ordinals)
+	except OverflowError:
+		raise ValueError(f"ordinal out of range for {enum.__qualname__}") from None
+
+	if codes and max(codes) >= member_count:
+		raise ValueError(f"ordinal {max(codes)} out of range for {enum.__qualname__}")
+
+	if sys.byteorder == "big":  # pragma: no cover
+		codes.byteswap()
+
+	identity = get_identity(enum).encode("UTF-8")
+	header = _header_struct.pack(MAGIC, _VERSION, width, 0, member_count, len(codes), len(identity)) + identity
+
+	# Pad the header so the ordinals are aligned
+	padding = b"\x00" * (-len(header) % 8)
+
+	return header + padding + codes.tobytes()
+
+
+def encode_members(members: Iterable[Enum], enum: Type[Enum]) -> bytes:
+	"""
+	Encode a sequence of members of ``enum``.
+
+	:param members:
+	:param enum:
+
+	:raises ValueError: If ``members`` contains objects which are not canonical members of ``enum``,
+		such as members of other enums or composite :class:`~enum.Flag` values.
+	"""
+
+	members = list(members)
+
+	if not set(map(type, members)) <= {enum}:
+		for member in members:
+			if type(member) is not enum:
+				raise ValueError(f"{member!r} is not a member of {enum.__qualname__}")
+
+	try:
+		return encode_ordinals(map(get_ordinals(enum).__getitem__, map(attrgetter("_name_"), members)), enum)
+	except KeyError:
+		for member in members:
+			if member._name_ not in get_ordinals(enum):
+				raise ValueError(f"{member!r} is not a canonical member of {enum.__qualname__}") from None
+		raise  # pragma: no cover
+
+
+def read_header(data: _BytesLike) -> Header:
+	"""
+	Parse the header of an encoded sequence.
+
+	:param data:
+
+	:raises ValueError: If the header is invalid or truncated.
+	"""
+
+	view = memoryview(data).cast('B')
+
+	try:
+		magic, version, width, _, member_count, length, identity_length = _header_struct.unpack_from(view)
+	except struct.error:
+		raise ValueError("truncated header") from None
+
+	if magic != MAGIC:
+		raise ValueError("not an encoded sequence of enum members")
+	if version != _VERSION:
+		raise ValueError(f"unsupported version {version}")
+	if width not in _typecodes:
+		raise ValueError(f"invalid ordinal width {width}")
+
+	identity_end = _header_struct.size + identity_length
+	if len(view) < identity_end:
+		raise ValueError("truncated header")
+
+	identity = bytes(view[_header_struct.size:identity_end]).decode("UTF-8")
+	offset = identity_end + (-identity_end % 8)
+
+	return Header(identity, member_count, width, length, offset)
+
+
+def decode_ordinals(data: _BytesLike, enum: Type[Enum]) -> memoryview:
+	"""
+	Decode the ordinals from an encoded sequence of members of ``enum``.
+
+	On little-endian platforms the returned :class:`memoryview` refers directly to ``data``, without copying.
+
+	:param data:
+	:param enum:
+
+	:raises ValueError: If ``data`` was not encoded from the same enum, or is truncated.
+	"""
+
+	header = read_header(data)
+
+	if header.identity != get_identity(enum):
+		raise ValueError(f"data was encoded from {header.identity!r}, not {get_identity(enum)!r}")
+	if header.member_count != len(get_members(enum)):
+		raise ValueError(
+				f"data was encoded from an enum with {header.member_count} members, "
+				f"but {enum.__qualname__} has {len(get_members(enum))}"
+				)
+	if header.width != get_ordinal_width(enum):
+		raise ValueError(f"invalid ordinal width {header.width} for {enum.__qualname__}")
+
+	end = header.offset + header.length * header.width
+	view = memoryview(data).cast('B')
+
+	if len(view) < end:
+		raise ValueError("truncated data")
+
+	typecode = _typecodes[header.width]
+
+	if sys.byteorder == "big":  # pragma: no cover
+		codes = array(typecode)
+		codes.frombytes(view[header.offset:end])
+		codes.byteswap()
+		return memoryview(codes)
+
+	return view[header.offset:end].cast(typecode)
+
+
+def decode_members(data: _BytesLike, enum: Type[Enum]) -> List[Enum]:
+	"""
+	Decode an encoded sequence of members of ``enum``.
+
+	:param data:
+	:param enum:
+
+	:raises ValueError: If ``data`` was not encoded from the same enum, or is corrupt.
+	"""
+
+	try:
+		return list(map(get_members(enum).__getitem__, decode_ordinals(data, enum)))
+	except IndexError:
+		raise ValueError(f"ordinal out of range for {enum.__qualname__}") from None
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+#
+#  codegen.py
+"""
+Generate Python modules containing enums from JSON or CSV specifications.
+
+Building a large enum at runtime with the functional API means parsing its data file
+and constructing the enum every time the program starts.
+The modules generated here define the enum with the ordinary class syntax,
+with each member's documentation in a ``#:`` comment,
+followed by lookup tables of the members' names and values as literal constants.
+
+Generate a module from the command line with:
+
+.. prompt:: bash
+
+	python -m enum_tools generate currencies.csv --name Currency --base StrEnum -o currency.py
+
+A JSON specification is an object with the keys ``name``, ``members``, and optionally ``base`` and ``doc``.
+Each member is an object with the keys ``name``, ``value``, and optionally ``doc``:
+
+.. code-block:: json
+
+	{
+		"name": "Currency",
+		"base": "StrEnum",
+		"doc": "ISO 4217 currency codes.",
+		"members": [
+			{"name": "GBP", "value": "GBP", "doc": "Pound sterling"},
+			{"name": "USD", "value": "USD", "doc": "United States dollar"}
+		]
+	}
+
+A CSV specification has a header row with the columns ``name``, ``value`` and optionally ``doc``.
+The name and base of the enum are given on the command line.
+For bases with integer values, values in CSV files are parsed with :class:`int`,
+and may be written in hexadecimal, octal or binary with the usual prefixes.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import csv
+import json
+import keyword
+import os
+from math import isfinite
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__ = ["BASES", "EnumSpec", "MemberSpec", "generate_module", "load_spec", "parse_spec"]
+
+#: The base classes which generated enums may use, and the modules they are imported from.
+BASES: Dict[str, str] = {
+		"Enum": "enum_tools",
+		"IntEnum": "enum_tools",
+		"StrEnum": "enum_tools",
+		"IterableFlag": "enum_tools.custom_enums",
+		"IterableIntFlag": "enum_tools.custom_enums",
+		}
+
+# Bases whose members must have integer values.
+_int_bases = {"IntEnum", "IterableFlag", "IterableIntFlag"}
+
+# The names defined by every generated module, other than the enum and its base class.
+_module_names = frozenset({"Dict", "Tuple", "NAMES", "VALUES", "VALUE_TO_NAME"})
+
+# Types whose repr() is a literal which evaluates to an equal value.
+_literal_types = (str, int, float, bool, type(None))
+
+
+class MemberSpec(NamedTuple):
+	"""
+	The specification of a member of a generated enum.
+	"""
+
+	#: The name of the member.
+	name: str
+
+	#: The value of the member.
+	value: Any
+
+	#: The documentation for the member.
+	doc: str = ''
+
+
+class EnumSpec(NamedTuple):
+	"""
+	The specification of a generated enum.
+	"""
+
+	#: The name of the enum.
+	name: str
+
+	#: The name of the enum's base class. One of the keys of :data:`~.BASES`.
+	base: str
+
+	#: The members of the enum, in definition order.
+	members: Tuple[MemberSpec, ...]
+
+	#: The docstring of the enum.
+	doc: str = ''
+
+
+def _is_literal(value: Any) -> bool:
+	if isinstance(value, float):
+		# repr() of infinity and NaN is not a literal.
+		return isfinite(value)
+	return isinstance(value, _literal_types)
+
+
+def _check_name(name: Any, what: str) -> None:
+	if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+		raise ValueError(f"{name!r} is not a valid {what} name")
+
+
+def parse_spec(
+		name: str,
+		members: Iterable[Tuple[str, Any, str]],
+		base: str = "Enum",
+		doc: str = '',
+		) -> EnumSpec:
+	"""
+	Validate the specification of an enum.
+
+	:param name: The name of the enum.
+	:param members: The ``(name, value, doc)`` of each member.
+	:param base: The name of the enum's base class. One of the keys of :data:`~.BASES`.
+	:param doc: The docstring of the enum.
+
+	:raises ValueError: If the specification is invalid.
+	"""
+
+	_check_name(name, "enum")
+
+	if base not in BASES:
+		raise ValueError(f"unknown base {base!r}; must be one of {', '.join(BASES)}")
+
+	specs = tuple(MemberSpec(*member) for member in members)
+	seen = set()
+
+	for member in specs:
+		_check_name(member.name, "member")
+
+		if member.name.startswith('_'):
+			raise ValueError(f"member names must not start with an underscore: {member.name!r}")
+		if member.name in seen:
+			raise ValueError(f"duplicate member name {member.name!r}")
+		seen.add(member.name)
+
+		if not _is_literal(member.value):
+			raise ValueError(f"unsupported value {member.value!r} for {member.name!r}")
+		if base in _int_bases and (not isinstance(member.value, int) or isinstance(member.value, bool)):
+			raise ValueError(f"the value of {member.name!r} must be an integer for {base}")
+		if base == "StrEnum" and not isinstance(member.value, str):
+			raise ValueError(f"the value of {member.name!r} must be a string for {base}")
+		if not isinstance(member.doc, str):
+			raise ValueError(f"the documentation for {member.name!r} must be a string")
+
+	return EnumSpec(name, base, specs, doc)
+
+
+def load_spec(filename: str, name: Optional[str] = None, base: Optional[str] = None) -> EnumSpec:
+	"""
+	Load the specification of an enum from a JSON or CSV file, depending on its extension.
+
+	:param filename:
+	:param name: The name of the enum. Overrides the name given in a JSON file, and is required for CSV files.
+	:param base: The name of the enum's base class. Overrides the base given in a JSON file.
+
+	:raises ValueError: If the specification is invalid.
+	"""
+
+	extension = os.path.splitext(filename)[1].lower()
+
+	if extension == ".json":
+		with open(filename, encoding="UTF-8") as fp:
+			data = json.load(fp)
+
+		if not isinstance(data, dict) or not isinstance(data.get("members"), list):
+			raise ValueError(f"{filename}: expected an object with a list of 'members'")
+
+		try:
+			members = [(member["name"], member["value"], member.get("doc", '')) for member in data["members"]]
+		except (KeyError, TypeError, AttributeError):
+			raise ValueError(f"{filename}: each member must be an object with a 'name' and a 'value'") from None
+
+		return parse_spec(
+				name or data.get("name"),
+				members,
+				base=base or data.get("base", "Enum"),
+				doc=data.get("doc", ''),
+				)
+
+	if extension == ".csv":
+		if name is None:
+			raise ValueError("the name of the enum must be given for CSV files")
+
+		base = base or "Enum"
+
+		with open(filename, encoding="UTF-8", newline='') as fp:
+			reader = csv.DictReader(fp)
+
+			if not {"name", "value"}.issubset(reader.fieldnames or ()):
+				raise ValueError(f"{filename}: expected 'name' and 'value' columns")
+
+			members = []
+			for row in reader:
+				value: Any = row["value"]
+				if base in _int_bases:
+					try:
+						value = int(value, 0)
+					except ValueError:
+						raise ValueError(f"{filename}: invalid integer {value!r} for {row['name']!r}") from None
+				members.append((row["name"], value, row.get("doc") or ''))
+
+		return parse_spec(name, members, base=base)
+
+	raise ValueError(f"unsupported specification format {extension!r}; expected '.json' or '.csv'")
+
+
+def _comment_lines(text: str, prefix: str, indent: str) -> List[str]:
+	return [f"{indent}{prefix} {line}".rstrip() for line in text.splitlines()]
+
+
+def _docstring(text: str, indent: str) -> List[str]:
+	text = text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+	return [f'{indent}"""', *(f"{indent}{line}".rstrip() for line in text.splitlines()), f'{indent}"""']
+
+
+def generate_module(spec: EnumSpec, lazy: bool = False, source: Optional[str] = None) -> str:
+	"""
+	Returns the source code of a module defining the enum described by ``spec``.
+
+	As well as the enum, the module defines the tuples ``NAMES`` and ``VALUES``
+	with the names and values of the canonical members in definition order,
+	and the dictionary ``VALUE_TO_NAME``, which maps each value to the name of its canonical member.
+	These can be used without accessing the members themselves.
+
+	:param spec:
+	:param lazy: Whether to generate a :class:`~enum_tools.lazy.LazyEnum`,
+		whose members are only created when they are first accessed.
+		Lazy enums do not support aliases, and ``spec.base`` must be ``'Enum'``.
+	:param source: The name of the file the specification was loaded from, which is recorded in the module.
+
+	:raises ValueError: If ``lazy`` is :py:obj:`True` and the enum cannot be lazy,
+		or if the name of the enum is one of the other names defined by the module.
+	"""
+
+	base = "LazyEnum" if lazy else spec.base
+	if spec.name in _module_names or spec.name == base:
+		raise ValueError(f"the enum cannot be named {spec.name!r}, as the generated module defines that name")
+
+	value_to_name: Dict[Any, str] = {}
+	for member in spec.members:
+		value_to_name.setdefault(member.value, member.name)
+
+	canonical = [member for member in spec.members if value_to_name[member.value] == member.name]
+
+	if lazy:
+		if spec.base != "Enum":
+			raise ValueError(f"lazy enums cannot have the base {spec.base}")
+		if len(canonical) != len(spec.members):
+			raise ValueError("lazy enums do not support aliases")
+
+	header = "This module was generated by ``python -m enum_tools generate``"
+	if source is not None:
+		header += f" from {os.path.basename(source)}"
+
+	lines = [
+			f"# {header}.",
+			"# Do not edit it by hand.",
+			'',
+			*_docstring(f"The :class:`~.{spec.name}` enum.", ''),
+			'',
+			"# stdlib",
+			"from typing import Dict, Tuple",
+			'',
+			"# 3rd party",
+			]
+
+	if lazy:
+		lines.append("from enum_tools.lazy import LazyEnum")
+	else:
+		lines.append(f"from {BASES[spec.base]} import {spec.base}")
+
+	lines.extend(['', f"__all__ = [{spec.name!r}, 'NAMES', 'VALUES', 'VALUE_TO_NAME']", '', ''])
+
+	lines.append(f"class {spec.name}({base}):")
+
+	lines.extend(_docstring(spec.doc or f"The :class:`~.{spec.name}` enum.", '\t'))
+	lines.append('')
+
+	if lazy:
+		lines.append("\t_table_ = (")
+		for member in spec.members:
+			lines.extend(_comment_lines(member.doc, '#', "\t\t\t"))
+			lines.append(f"\t\t\t({member.name!r}, {member.value!r}),")
+		lines.append("\t\t\t)")
+	else:
+		for member in spec.members:
+			lines.extend(_comment_lines(member.doc, "#:", '\t'))
+			lines.append(f"\t{member.name} = {member.value!r}")
+
+	lines.extend(['', ''])
+	lines.append("#: The names of the canonical members, in definition order.")
+	lines.append("NAMES: Tuple[str, ...] = (")
+	lines.extend(f"\t\t{member.name!r}," for member in canonical)
+	lines.append("\t\t)")
+	lines.append('')
+	lines.append("#: The values of the canonical members, in definition order.")
+	lines.append("VALUES: Tuple = (")
+	lines.extend(f"\t\t{member.value!r}," for member in canonical)
+	lines.append("\t\t)")
+	lines.append('')
+	lines.append("#: Mapping of member values to the names of their canonical members.")
+	lines.append("VALUE_TO_NAME: Dict = {")
+	lines.extend(f"\t\t{member.value!r}: {member.name!r}," for member in canonical)
+	lines.append("\t\t}")
+	lines.append('')
+
+	return '\n'.join(lines)
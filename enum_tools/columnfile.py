@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+#
+#  columnfile.py
+"""
+Files storing a column of enum members, which can be read through a memory map.
+
+A column file starts with a header recording the identity of the enum (see :func:`enum_tools.codec.get_identity`)
+and a table of the names and values of its members,
+followed by the ordinal of each member (see :func:`enum_tools.utils.get_members`)
+as little-endian unsigned integers of the width returned by :func:`enum_tools.codec.get_ordinal_width`.
+
+.. code-block:: python
+
+	with ColumnWriter("events.etcf", EventType) as writer:
+		for event in events:
+			writer.append(event.type)
+
+	with ColumnReader("events.etcf", EventType) as reader:
+		for chunk in reader.iter_chunks():
+			...
+
+When a file is read the table is compared with the current definition of the enum,
+so files written before members were added, removed, renamed, reordered or given new values are rejected,
+rather than being decoded to the wrong members.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from enum import Enum
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Any, Generic, Iterable, Iterator, List, NamedTuple, Optional, Type, TypeVar, Union
+
+# this package
+from enum_tools.codec import get_identity, get_ordinal_width
+from enum_tools.containers import _get_id_ordinals
+from enum_tools.utils import get_members
+
+if TYPE_CHECKING:
+	# this package
+	from enum_tools.arrays import EnumArray
+
+__all__ = ["MAGIC", "ColumnHeader", "ColumnReader", "ColumnWriter", "read_column_header"]
+
+_E = TypeVar("_E", bound=Enum)
+
+_PathLike = Union[str, "os.PathLike[str]"]
+
+#: The magic bytes at the start of every column file.
+MAGIC = b"ETCF"
+
+_VERSION = 1
+
+# magic, version, width, reserved, member count, length, identity length, table length
+_header_struct = struct.Struct("<4sBBHIQHI")
+
+# The offset of the length field, which the writer updates as it appends.
+_length_offset = 12
+
+_typecodes = {1: 'B', 2: 'H', 4: 'I'}
+
+# The number of ordinals the writer buffers before writing them to the file.
+_BUFFER_SIZE = 65536
+
+
+class ColumnHeader(NamedTuple):
+	"""
+	The header of a column file.
+	"""
+
+	#: The identity of the enum, as returned by :func:`enum_tools.codec.get_identity`.
+	identity: str
+
+	#: The name and value of each canonical member of the enum, in definition order.
+	#: Values which cannot be stored as JSON are stored as their :func:`repr`.
+	members: List[List[Any]]
+
+	#: The width of each ordinal, in bytes.
+	width: int
+
+	#: The number of ordinals in the file.
+	length: int
+
+	#: The offset of the first ordinal from the start of the file.
+	offset: int
+
+
+def _member_table(enum: Type[Enum]) -> List[List[Any]]:
+	table = []
+
+	for member in get_members(enum):
+		value = member._value_
+		if not isinstance(value, (str, int, float, bool, type(None))):
+			value = repr(value)
+		table.append([member._name_, value])
+
+	return table
+
+
+def _encode_table(table: List[Any]) -> bytes:
+	return json.dumps(table, separators=(',', ':')).encode("UTF-8")
+
+
+def _header_bytes(enum: Type[Enum], length: int) -> bytes:
+	identity = get_identity(enum).encode("UTF-8")
+	table = _encode_table(_member_table(enum))
+	width = get_ordinal_width(enum)
+	member_count = len(get_members(enum))
+
+	header = _header_struct.pack(MAGIC, _VERSION, width, 0, member_count, length, len(identity), len(table))
+	header += identity + table
+
+	# Pad the header so the ordinals are aligned
+	return header + b"\x00" * (-len(header) % 8)
+
+
+def read_column_header(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> ColumnHeader:
+	"""
+	Parse the header of a column file.
+
+	:param data: The start of the file. It must contain at least the whole header.
+
+	:raises ValueError: If the header is invalid or truncated.
+	"""
+
+	# Release the views even if the header is invalid, so a memory map can be closed.
+	with memoryview(data) as raw, raw.cast('B') as view:
+		try:
+			fields = _header_struct.unpack_from(view)
+		except struct.error:
+			raise ValueError("truncated header") from None
+
+		magic, version, width, _, member_count, length, identity_length, table_length = fields
+
+		if magic != MAGIC:
+			raise ValueError("not a column file")
+		if version != _VERSION:
+			raise ValueError(f"unsupported version {version}")
+		if width not in _typecodes:
+			raise ValueError(f"invalid ordinal width {width}")
+
+		identity_end = _header_struct.size + identity_length
+		table_end = identity_end + table_length
+
+		if len(view) < table_end:
+			raise ValueError("truncated header")
+
+		identity = bytes(view[_header_struct.size:identity_end]).decode("UTF-8")
+		members = json.loads(bytes(view[identity_end:table_end]).decode("UTF-8"))
+
+		if len(members) != member_count:
+			raise ValueError("corrupt member table")
+
+	return ColumnHeader(identity, members, width, length, table_end + (-table_end % 8))
+
+
+def _read_header_from_file(fp: IO[bytes]) -> ColumnHeader:
+	data = fp.read(_header_struct.size)
+
+	try:
+		*_, identity_length, table_length = _header_struct.unpack(data)
+	except struct.error:
+		raise ValueError("truncated header") from None
+
+	return read_column_header(data + fp.read(identity_length + table_length))
+
+
+def _check_header(header: ColumnHeader, enum: Type[Enum]) -> None:
+	"""
+	Check that the header was written for the current definition of ``enum``.
+	"""
+
+	if header.identity != get_identity(enum):
+		raise ValueError(f"file was written for {header.identity!r}, not {get_identity(enum)!r}")
+
+	expected = _member_table(enum)
+
+	# Compared as JSON, as values such as NaN are not equal to themselves, and 1, 1.0 and True are equal.
+	if _encode_table(header.members) != _encode_table(expected):
+		for ordinal, (stored, current) in enumerate(zip(header.members, expected)):
+			if _encode_table(stored) != _encode_table(current):
+				raise ValueError(
+						f"{enum.__qualname__} has changed since the file was written: "
+						f"member {ordinal} was {stored[0]}={stored[1]!r}, but is now {current[0]}={current[1]!r}"
+						)
+
+		raise ValueError(
+				f"{enum.__qualname__} has changed since the file was written: "
+				f"it had {len(header.members)} members, but now has {len(expected)}"
+				)
+
+
+class ColumnWriter(Generic[_E]):
+	"""
+	Writes members of ``enum`` to a column file.
+
+	Ordinals are buffered, and written to the file in blocks.
+	The number of ordinals recorded in the header is updated each time the buffer is written,
+	so a file whose writer was not closed can still be read, up to the last block which was written.
+
+	:param filename:
+	:param enum:
+	:param append: If :py:obj:`True` and the file exists, add to the end of the file instead of replacing it.
+		The existing file must have been written for the current definition of the enum.
+
+	:raises ValueError: If ``append`` is :py:obj:`True` and the existing file is invalid,
+		or was written for a different enum or a different definition of it.
+	"""
+
+	#: The enum whose members are written.
+	enum: Type[_E]
+
+	_fp: IO[bytes]
+
+	def __init__(self, filename: _PathLike, enum: Type[_E], append: bool = False):
+		self.enum = enum
+		self._index = _get_id_ordinals(enum)
+		self._typecode = _typecodes[get_ordinal_width(enum)]
+		self._buffer = array(self._typecode)
+
+		if append and os.path.exists(filename):
+			fp = open(filename, "r+b")  # noqa: SIM115
+
+			try:
+				header = _read_header_from_file(fp)
+				_check_header(header, enum)
+			except ValueError:
+				fp.close()
+				raise
+
+			# Discard anything after the last complete block, e.g. if the previous writer was interrupted.
+			self._length = header.length
+			fp.truncate(header.offset + header.length * header.width)
+			fp.seek(0, os.SEEK_END)
+		else:
+			fp = open(filename, "wb")  # noqa: SIM115
+			fp.write(_header_bytes(enum, 0))
+			self._length = 0
+
+		self._fp = fp
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of members in the file, including those which are still buffered.
+		"""
+
+		return self._length + len(self._buffer)
+
+	def append(self, member: _E) -> None:
+		"""
+		Add a member to the end of the file.
+
+		:param member:
+
+		:raises ValueError: If ``member`` is not a canonical member of the enum.
+		"""
+
+		try:
+			self._buffer.append(self._index[id(member)])
+		except KeyError:
+			raise ValueError(f"{member!r} is not a canonical member of {self.enum.__qualname__}") from None
+
+		if len(self._buffer) >= _BUFFER_SIZE:
+			self.flush()
+
+	def extend(self, members: Iterable[_E]) -> None:
+		"""
+		Add members to the end of the file.
+
+		:param members:
+
+		:raises ValueError: If ``members`` contains objects which are not canonical members of the enum.
+			Members before the invalid object are still added.
+		"""
+
+		index = self._index
+		iterator = iter(members)
+
+		while True:
+			chunk = list(islice(iterator, _BUFFER_SIZE))
+			if not chunk:
+				break
+
+			try:
+				self._buffer.extend(map(index.__getitem__, map(id, chunk)))
+			except KeyError:
+				bad = next(member for member in chunk if id(member) not in index)
+				raise ValueError(f"{bad!r} is not a canonical member of {self.enum.__qualname__}") from None
+
+			if len(self._buffer) >= _BUFFER_SIZE:
+				self.flush()
+
+	def extend_ordinals(self, ordinals: Iterable[int]) -> None:
+		"""
+		Add members to the end of the file, given their ordinals.
+
+		:param ordinals: The ordinals, such as an :class:`array.array` or the ``codes`` of an
+			:class:`~enum_tools.arrays.EnumArray`.
+
+		:raises ValueError: If an ordinal is out of range for the enum.
+		"""
+
+		if hasattr(ordinals, "dtype"):
+			# NumPy array
+			ordinals = ordinals.tolist()  # type: ignore[attr-defined]
+
+		try:
+			codes = array(self._typecode, ordinals)
+		except OverflowError:
+			raise ValueError(f"ordinal out of range for {self.enum.__qualname__}") from None
+
+		if codes and max(codes) >= len(get_members(self.enum)):
+			raise ValueError(f"ordinal {max(codes)} out of range for {self.enum.__qualname__}")
+
+		self.flush()
+		self._write(codes)
+
+	def _write(self, codes: array) -> None:
+		if not codes:
+			return
+
+		if sys.byteorder == "big":  # pragma: no cover
+			codes = array(self._typecode, codes)
+			codes.byteswap()
+
+		self._fp.write(codes.tobytes())
+		self._length += len(codes)
+
+		# Record the new length, so the file can be read up to this point even if it is not closed.
+		position = self._fp.tell()
+		self._fp.seek(_length_offset)
+		self._fp.write(struct.pack("<Q", self._length))
+		self._fp.seek(position)
+
+	def flush(self) -> None:
+		"""
+		Write any buffered members to the file.
+		"""
+
+		buffer, self._buffer = self._buffer, array(self._typecode)
+		self._write(buffer)
+		self._fp.flush()
+
+	def close(self) -> None:
+		"""
+		Write any buffered members to the file, and close it.
+		"""
+
+		if not self._fp.closed:
+			self.flush()
+			self._fp.close()
+
+	def __enter__(self) -> "ColumnWriter[_E]":
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+
+class ColumnReader(Generic[_E]):
+	"""
+	Reads members of ``enum`` from a column file through a memory map.
+
+	The ordinals are not read into memory until they are accessed.
+	Views of them, as returned by :attr:`~.ordinals` and :meth:`~.to_array`, refer directly to the memory map.
+	The :attr:`~.ordinals` view is released when the reader is closed.
+
+	:param filename:
+	:param enum:
+
+	:raises ValueError: If the file is invalid or truncated,
+		or was written for a different enum or a different definition of it.
+	"""
+
+	#: The enum whose members are read.
+	enum: Type[_E]
+
+	#: The header of the file.
+	header: ColumnHeader
+
+	def __init__(self, filename: _PathLike, enum: Type[_E]):
+		self.enum = enum
+
+		with open(filename, "rb") as fp:
+			self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+		try:
+			self.header = read_column_header(self._mmap)
+			_check_header(self.header, enum)
+
+			end = self.header.offset + self.header.length * self.header.width
+			if len(self._mmap) < end:
+				raise ValueError("truncated data")
+		except ValueError:
+			self._mmap.close()
+			raise
+
+		self._view: Optional[memoryview] = None
+
+	def __len__(self) -> int:
+		return self.header.length
+
+	@property
+	def ordinals(self) -> memoryview:
+		"""
+		A read-only :class:`memoryview` of the ordinals in the file.
+
+		On little-endian platforms the view refers directly to the memory map, without copying.
+		"""
+
+		if self._view is None:
+			header = self.header
+			view = memoryview(self._mmap)[header.offset:header.offset + header.length * header.width]
+			typecode = _typecodes[header.width]
+
+			if sys.byteorder == "big":  # pragma: no cover
+				codes = array(typecode)
+				codes.frombytes(view)
+				codes.byteswap()
+				view.release()
+				self._view = memoryview(codes)
+			else:
+				self._view = view.cast(typecode)
+
+		return self._view
+
+	def to_array(self) -> "EnumArray[_E]":
+		"""
+		Returns an :class:`~enum_tools.arrays.EnumArray` of the members in the file.
+
+		The array's ordinals refer directly to the memory map, without copying.
+		Requires NumPy.
+
+		:raises ValueError: If the file contains an ordinal which is out of range for the enum.
+		"""
+
+		# 3rd party
+		import numpy  # nodep
+
+		# this package
+		from enum_tools.arrays import EnumArray
+
+		header = self.header
+		dtype = numpy.dtype(f"<u{header.width}")
+		codes = numpy.frombuffer(self._mmap, dtype=dtype, count=header.length, offset=header.offset)
+		return EnumArray(self.enum, codes)
+
+	def iter_chunks(self, chunk_size: int = 65536) -> Iterator[List[_E]]:
+		"""
+		Iterate over the members in the file in chunks, without reading the whole file into memory.
+
+		:param chunk_size: The maximum number of members in each chunk.
+
+		:raises ValueError: If the file contains an ordinal which is out of range for the enum.
+		"""
+
+		if chunk_size < 1:
+			raise ValueError("'chunk_size' must be at least 1")
+
+		members = get_members(self.enum).__getitem__
+		ordinals = self.ordinals
+
+		for start in range(0, len(ordinals), chunk_size):
+			try:
+				yield list(map(members, ordinals[start:start + chunk_size]))  # type: ignore[arg-type]
+			except IndexError:
+				raise ValueError(f"ordinal out of range for {self.enum.__qualname__}") from None
+
+	def __iter__(self) -> Iterator[_E]:
+		for chunk in self.iter_chunks():
+			yield from chunk
+
+	def close(self) -> None:
+		"""
+		Close the memory map.
+
+		If arrays returned by :meth:`~.to_array`, or buffers exported from :attr:`~.ordinals`,
+		still refer to the memory map, it is instead closed when the last of them is garbage collected.
+		"""
+
+		if self._view is not None:
+			try:
+				self._view.release()
+			except BufferError:
+				pass
+			self._view = None
+
+		try:
+			self._mmap.close()
+		except BufferError:
+			pass
+
+	def __enter__(self) -> "ColumnReader[_E]":
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
@@ -0,0 +1,967 @@
+#!/usr/bin/env python3
+#
+#  containers.py
+"""
+Containers for enum members, indexed by the members' ordinals.
+
+The ordinal of a member is its position in :func:`enum_tools.utils.get_members`.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import threading
+from collections import Counter
+from enum import Enum
+from heapq import nlargest
+from itertools import compress, repeat
+from operator import is_not
+from typing import (
+		AbstractSet,
+		Any,
+		Collection,
+		Dict,
+		FrozenSet,
+		Iterable,
+		Iterator,
+		List,
+		Mapping,
+		MutableMapping,
+		MutableSet,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union
+		)
+from weakref import WeakKeyDictionary
+
+# this package
+from enum_tools.utils import _popcount, get_members
+
+__all__ = ["EnumCounter", "EnumMap", "EnumSet", "MutableEnumSet"]
+
+_E = TypeVar("_E", bound=Enum)
+_V = TypeVar("_V")
+
+_id_ordinals: "WeakKeyDictionary[Type[Enum], Dict[int, int]]" = WeakKeyDictionary()
+
+# Held while storing universes on enums, so every thread uses the same universe.
+_universe_lock = threading.Lock()
+
+
+class _Missing:
+	"""
+	Sentinel for unset slots.
+	"""
+
+	__slots__ = ()
+
+	def __repr__(self) -> str:
+		return "<missing>"
+
+
+_MISSING: Any = _Missing()
+
+
+def _get_id_ordinals(enum: Type[Enum]) -> Dict[int, int]:
+	"""
+	Returns a mapping of the ids of the members of ``enum`` (including aliases) to their ordinals.
+
+	Looking up members by id is faster than by hash, and cannot match members of other enums.
+
+	:param enum:
+	"""
+
+	try:
+		return _id_ordinals[enum]
+	except KeyError:
+		members = get_members(enum)
+		return _id_ordinals.setdefault(enum, {id(member): ordinal for ordinal, member in enumerate(members)})
+
+
+def _get_universe(enum: Type[_E]) -> Tuple[Type[_E], Tuple[_E, ...], Dict[int, int]]:
+	# The universe is stored on the class, as it refers to the class and so would keep it alive if stored elsewhere.
+	universe = enum.__dict__.get("_enum_set_universe_")
+	if universe is not None:
+		return universe
+
+	with _universe_lock:
+		# Sets are compared by the identity of their universes, so every thread must use the same one.
+		universe = enum.__dict__.get("_enum_set_universe_")
+		if universe is None:
+			universe = (enum, get_members(enum), _get_id_ordinals(enum))
+			type.__setattr__(enum, "_enum_set_universe_", universe)
+
+	return universe
+
+
+class EnumMap(MutableMapping[_E, _V]):
+	"""
+	A mutable mapping whose keys are members of ``enum``, backed by a list indexed by the members' ordinals.
+
+	Iteration is in definition order.
+	Only canonical members (including their aliases) can be used as keys;
+	composite :class:`~enum.Flag` values cannot.
+
+	:param enum:
+	:param items: A mapping or iterable of ``(member, value)`` pairs to initialise the map with.
+	"""
+
+	__slots__ = ("_enum", "_members", "_index", "_values", "_size")
+
+	_enum: Type[_E]
+	_members: Tuple[_E, ...]
+	_index: Dict[int, int]
+	_values: List[Any]
+	_size: int
+
+	def __init__(self, enum: Type[_E], items: Union[Mapping[_E, _V], Iterable[Tuple[_E, _V]]] = ()):
+		self._enum = enum
+		self._members = get_members(enum)  # type: ignore[assignment]
+		self._index = _get_id_ordinals(enum)
+		self._values = [_MISSING] * len(self._members)
+		self._size = 0
+
+		if items:
+			self.update(items)
+
+	@property
+	def enum(self) -> Type[_E]:
+		"""
+		The enum whose members are the keys of the map.
+		"""
+
+		return self._enum
+
+	def _ordinal(self, key: Any) -> int:
+		try:
+			return self._index[id(key)]
+		except KeyError:
+			raise KeyError(key) from None
+
+	def __getitem__(self, key: _E) -> _V:
+		try:
+			value = self._values[self._index[id(key)]]
+		except KeyError:
+			raise KeyError(key) from None
+
+		if value is _MISSING:
+			raise KeyError(key)
+		return value
+
+	def get(self, key: _E, default: Any = None) -> Any:  # noqa: D102
+		try:
+			value = self._values[self._index[id(key)]]
+		except KeyError:
+			return default
+		return default if value is _MISSING else value
+
+	def __contains__(self, key: object) -> bool:
+		try:
+			return self._values[self._index[id(key)]] is not _MISSING
+		except KeyError:
+			return False
+
+	def __setitem__(self, key: _E, value: _V) -> None:
+		ordinal = self._ordinal(key)
+		if self._values[ordinal] is _MISSING:
+			self._size += 1
+		self._values[ordinal] = value
+
+	def __delitem__(self, key: _E) -> None:
+		ordinal = self._ordinal(key)
+		if self._values[ordinal] is _MISSING:
+			raise KeyError(key)
+		self._values[ordinal] = _MISSING
+		self._size -= 1
+
+	def __iter__(self) -> Iterator[_E]:
+		return compress(self._members, map(is_not, self._values, repeat(_MISSING)))
+
+	def __len__(self) -> int:
+		return self._size
+
+	def clear(self) -> None:  # noqa: D102
+		self._values = [_MISSING] * len(self._members)
+		self._size = 0
+
+	def fill(self, value: _V) -> None:
+		"""
+		Set the value for every member of the enum to ``value``.
+
+		:param value:
+		"""
+
+		self._values = [value] * len(self._members)
+		self._size = len(self._members)
+
+	def update(self, *args: Any, **kwargs: _V) -> None:
+		"""
+		Update the map from a mapping or iterable of ``(member, value)`` pairs.
+
+		Updating from another :class:`~.EnumMap` for the same enum
+		copies the values without looking up any members.
+		Keyword arguments are interpreted as member names.
+		"""
+
+		if len(args) > 1:
+			raise TypeError(f"update expected at most 1 argument, got {len(args)}")
+
+		if args:
+			other = args[0]
+			if isinstance(other, EnumMap) and other._enum is self._enum:
+				self._values = [
+						mine if theirs is _MISSING else theirs for mine, theirs in zip(self._values, other._values)
+						]
+				self._size = len(self._values) - self._values.count(_MISSING)
+			else:
+				super().update(other)
+
+		for name, value in kwargs.items():
+			self[self._enum[name]] = value
+
+	def copy(self) -> "EnumMap[_E, _V]":
+		"""
+		Returns a shallow copy of the map.
+		"""
+
+		new = self.__class__(self._enum)
+		new._values = self._values.copy()
+		new._size = self._size
+		return new
+
+	def __eq__(self, other: object) -> bool:
+		if isinstance(other, EnumMap) and other._enum is self._enum:
+			return self._values == other._values
+		return super().__eq__(other)
+
+	def __repr__(self) -> str:
+		items = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+		return f"{self.__class__.__name__}({self._enum.__qualname__}, {{{items}}})"
+
+	def __reduce__(self) -> Tuple:
+		return self.__class__, (self._enum, list(self.items()))
+
+
+_S = TypeVar("_S", bound="EnumSet")
+
+
+class EnumSet(AbstractSet[_E]):
+	"""
+	An immutable set of members of ``enum``, stored as an integer bitmask over the members' ordinals.
+
+	Operations between two :class:`~.EnumSet` objects for the same enum work on the bitmasks directly.
+	Other operations behave like those of :class:`frozenset`, and an :class:`~.EnumSet` compares
+	and hashes equal to a :class:`frozenset` of the same members.
+	Unions and symmetric differences with iterables containing items which are not members of the enum
+	return a :class:`frozenset`.
+
+	Iteration is in definition order.
+	Only canonical members (including their aliases) can be added to the set;
+	composite :class:`~enum.Flag` values cannot.
+
+	:param enum:
+	:param members:
+
+	:raises ValueError: If ``members`` contains objects which are not canonical members of ``enum``.
+	"""
+
+	__slots__ = ("_universe", "_bits", "_hash")
+
+	# The enum, its members, and the mapping of member ids to ordinals.
+	# These are shared by every set for the enum, so new sets only need to set two attributes.
+	_universe: Tuple[Type[_E], Tuple[_E, ...], Dict[int, int]]
+	_bits: int
+	_hash: int
+
+	def __init__(self, enum: Type[_E], members: Iterable[_E] = ()):
+		self._universe = _get_universe(enum)
+		self._bits = self._to_bits(members)
+
+	@classmethod
+	def from_bits(cls: Type[_S], enum: Type[_E], bits: int) -> _S:
+		"""
+		Construct a set from a bitmask, where bit ``n`` corresponds to the member with ordinal ``n``.
+
+		:param enum:
+		:param bits:
+
+		:raises ValueError: If ``bits`` has bits set which do not correspond to a member.
+		"""
+
+		if bits < 0 or bits >> len(get_members(enum)):
+			raise ValueError(f"invalid bitmask {bits:#x} for {enum.__qualname__}")
+
+		new = cls(enum)
+		new._bits = bits
+		return new
+
+	@classmethod
+	def full(cls: Type[_S], enum: Type[_E]) -> _S:
+		"""
+		Construct a set containing every member of ``enum``.
+
+		:param enum:
+		"""
+
+		return cls.from_bits(enum, (1 << len(get_members(enum))) - 1)
+
+	@property
+	def enum(self) -> Type[_E]:
+		"""
+		The enum whose members the set contains.
+		"""
+
+		return self._universe[0]
+
+	@property
+	def bits(self) -> int:
+		"""
+		The bitmask of the set, where bit ``n`` corresponds to the member with ordinal ``n``.
+		"""
+
+		return self._bits
+
+	def _to_bits(self, members: Iterable[Any]) -> int:
+		if isinstance(members, EnumSet) and members._universe is self._universe:
+			return members._bits
+
+		bits = 0
+		enum, _, index = self._universe
+
+		try:
+			for ordinal in map(index.__getitem__, map(id, members)):
+				bits |= 1 << ordinal
+		except KeyError:
+			for member in members:
+				if id(member) not in index:
+					raise ValueError(f"{member!r} is not a canonical member of {enum.__qualname__}") from None
+			# ``members`` was an iterator, and has been exhausted.
+			raise ValueError(f"not all items are canonical members of {enum.__qualname__}") from None
+
+		return bits
+
+	def _new(self: _S, bits: int) -> _S:
+		new = object.__new__(self.__class__)
+		new._universe = self._universe
+		new._bits = bits
+		return new
+
+	def _other_bits(self, other: Any) -> Optional[int]:
+		# Returns the bitmask of ``other`` if it is an EnumSet for the same enum.
+		if isinstance(other, EnumSet) and other._universe is self._universe:
+			return other._bits
+		return None
+
+	def _members_bits(self, other: Iterable[Any]) -> Tuple[Iterable[Any], Optional[int]]:
+		# Returns ``other`` (as a collection, if it was an iterator) and the bitmask of its items,
+		# or None if it has items which aren't canonical members.
+		bits = self._other_bits(other)
+		if bits is not None:
+			return other, bits
+
+		if not isinstance(other, Collection):
+			other = list(other)
+
+		bits = 0
+		index = self._universe[2]
+
+		for ordinal in map(index.get, map(id, other)):
+			if ordinal is None:
+				return other, None
+			bits |= 1 << ordinal
+
+		return other, bits
+
+	def __contains__(self, member: object) -> bool:
+		try:
+			return bool(self._bits >> self._universe[2][id(member)] & 1)
+		except KeyError:
+			return False
+
+	def __iter__(self) -> Iterator[_E]:
+		bits = self._bits
+		members = self._universe[1]
+
+		while bits:
+			lowest = bits & -bits
+			yield members[lowest.bit_length() - 1]
+			bits ^= lowest
+
+	def __len__(self) -> int:
+		return _popcount(self._bits)
+
+	def __bool__(self) -> bool:
+		return bool(self._bits)
+
+	def __hash__(self) -> int:
+		try:
+			return self._hash
+		except AttributeError:
+			self._hash = hash(frozenset(self))
+			return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().__eq__(other)
+		return self._bits == bits
+
+	def __le__(self, other: AbstractSet[Any]) -> bool:
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().__le__(other)
+		return self._bits & ~bits == 0
+
+	def __lt__(self, other: AbstractSet[Any]) -> bool:
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().__lt__(other)
+		return self._bits != bits and self._bits & ~bits == 0
+
+	def __ge__(self, other: AbstractSet[Any]) -> bool:
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().__ge__(other)
+		return bits & ~self._bits == 0
+
+	def __gt__(self, other: AbstractSet[Any]) -> bool:
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().__gt__(other)
+		return self._bits != bits and bits & ~self._bits == 0
+
+	def __and__(self: _S, other: Iterable[Any]) -> _S:
+		bits = self._other_bits(other)
+		if bits is None:
+			# Items which aren't members can't be in the intersection.
+			return self._new(self._bits & self._to_bits(m for m in other if id(m) in self._universe[2]))
+		return self._new(self._bits & bits)
+
+	__rand__ = __and__
+
+	def __or__(self: _S, other: Iterable[Any]) -> Union[_S, FrozenSet[Any]]:  # type: ignore[override]
+		other, bits = self._members_bits(other)
+		if bits is None:
+			return frozenset(self).union(other)
+		return self._new(self._bits | bits)
+
+	__ror__ = __or__
+
+	def __xor__(self: _S, other: Iterable[Any]) -> Union[_S, FrozenSet[Any]]:  # type: ignore[override]
+		other, bits = self._members_bits(other)
+		if bits is None:
+			return frozenset(self).symmetric_difference(other)
+		return self._new(self._bits ^ bits)
+
+	__rxor__ = __xor__
+
+	def __sub__(self: _S, other: Iterable[Any]) -> _S:
+		bits = self._other_bits(other)
+		if bits is None:
+			bits = self._to_bits(m for m in other if id(m) in self._universe[2])
+		return self._new(self._bits & ~bits)
+
+	def __rsub__(self, other: Iterable[Any]) -> AbstractSet[Any]:
+		return frozenset(other) - frozenset(self)
+
+	def isdisjoint(self, other: Iterable[Any]) -> bool:  # noqa: D102
+		bits = self._other_bits(other)
+		if bits is None:
+			return super().isdisjoint(other)
+		return not self._bits & bits
+
+	def issubset(self, other: Iterable[Any]) -> bool:
+		"""
+		Returns whether every member of the set is in ``other``.
+
+		:param other:
+		"""
+
+		if self._other_bits(other) is None:
+			return frozenset(self).issubset(other)
+		return self <= other  # type: ignore[operator]
+
+	def issuperset(self, other: Iterable[Any]) -> bool:
+		"""
+		Returns whether every item in ``other`` is in the set.
+
+		:param other:
+		"""
+
+		bits = self._other_bits(other)
+		if bits is None:
+			return all(map(self.__contains__, other))
+		return bits & ~self._bits == 0
+
+	def union(self: _S, *others: Iterable[Any]) -> Union[_S, FrozenSet[Any]]:
+		"""
+		Returns a new set with the members of the set and all ``others``.
+
+		:param others:
+
+		:returns: An :class:`~.EnumSet`, or a :class:`frozenset` if ``others`` contain items
+			which are not members of the enum.
+		"""
+
+		bits = self._bits
+		collections = []
+
+		for other in others:
+			other, other_bits = self._members_bits(other)
+			collections.append(other)
+			if other_bits is None:
+				return frozenset(self).union(*collections, *others[len(collections):])
+			bits |= other_bits
+
+		return self._new(bits)
+
+	def intersection(self: _S, *others: Iterable[Any]) -> _S:
+		"""
+		Returns a new set with the members common to the set and all ``others``.
+
+		:param others:
+		"""
+
+		new = self
+		for other in others:
+			new = new & other
+		return self._new(new._bits)
+
+	def difference(self: _S, *others: Iterable[Any]) -> _S:
+		"""
+		Returns a new set with the members of the set which are not in any of ``others``.
+
+		:param others:
+		"""
+
+		new = self
+		for other in others:
+			new = new - other
+		return self._new(new._bits)
+
+	def symmetric_difference(self: _S, other: Iterable[Any]) -> Union[_S, FrozenSet[Any]]:
+		"""
+		Returns a new set with the members in either the set or ``other``, but not both.
+
+		:param other:
+
+		:returns: An :class:`~.EnumSet`, or a :class:`frozenset` if ``other`` contains items
+			which are not members of the enum.
+		"""
+
+		return self ^ other
+
+	def complement(self: _S) -> _S:
+		"""
+		Returns a new set with the members of the enum which are not in the set.
+		"""
+
+		return self._new(~self._bits & ((1 << len(self._universe[1])) - 1))
+
+	def copy(self: _S) -> _S:
+		"""
+		Returns a shallow copy of the set.
+		"""
+
+		return self._new(self._bits)
+
+	def __repr__(self) -> str:
+		members = ", ".join(map(repr, self))
+		return f"{self.__class__.__name__}({self.enum.__qualname__}, {{{members}}})"
+
+	def __reduce__(self) -> Tuple:
+		return self.__class__.from_bits, (self.enum, self._bits)
+
+
+class MutableEnumSet(EnumSet[_E], MutableSet[_E]):
+	"""
+	A mutable :class:`~.EnumSet`, which supports the same operations as :class:`set`.
+
+	:param enum:
+	:param members:
+
+	:raises ValueError: If ``members`` contains objects which are not canonical members of ``enum``.
+	"""
+
+	__slots__ = ()
+
+	__hash__ = None  # type: ignore[assignment]
+
+	def add(self, member: _E) -> None:
+		"""
+		Add ``member`` to the set.
+
+		:param member:
+
+		:raises ValueError: If ``member`` is not a canonical member of the enum.
+		"""
+
+		self._bits |= self._to_bits((member, ))
+
+	def discard(self, member: _E) -> None:
+		"""
+		Remove ``member`` from the set if it is present.
+
+		:param member:
+		"""
+
+		ordinal = self._universe[2].get(id(member))
+		if ordinal is not None:
+			self._bits &= ~(1 << ordinal)
+
+	def remove(self, member: _E) -> None:
+		"""
+		Remove ``member`` from the set.
+
+		:param member:
+
+		:raises KeyError: If ``member`` is not in the set.
+		"""
+
+		if member not in self:
+			raise KeyError(member)
+		self.discard(member)
+
+	def pop(self) -> _E:
+		"""
+		Remove and return the first member of the set, in definition order.
+
+		:raises KeyError: If the set is empty.
+		"""
+
+		if not self._bits:
+			raise KeyError("pop from an empty set")
+
+		lowest = self._bits & -self._bits
+		self._bits ^= lowest
+		return self._universe[1][lowest.bit_length() - 1]
+
+	def clear(self) -> None:
+		"""
+		Remove all members from the set.
+		"""
+
+		self._bits = 0
+
+	def update(self, *others: Iterable[_E]) -> None:
+		"""
+		Add the members of all ``others`` to the set.
+
+		:param others:
+		"""
+
+		self._bits = self.union(*others)._bits
+
+	def intersection_update(self, *others: Iterable[Any]) -> None:
+		"""
+		Remove members which are not in all ``others`` from the set.
+
+		:param others:
+		"""
+
+		self._bits = self.intersection(*others)._bits
+
+	def difference_update(self, *others: Iterable[Any]) -> None:
+		"""
+		Remove the members of all ``others`` from the set.
+
+		:param others:
+		"""
+
+		self._bits = self.difference(*others)._bits
+
+	def symmetric_difference_update(self, other: Iterable[_E]) -> None:
+		"""
+		Update the set to contain the members in either the set or ``other``, but not both.
+
+		:param other:
+		"""
+
+		self._bits = (self ^ other)._bits
+
+	def __ior__(self: _S, other: Iterable[_E]) -> _S:  # type: ignore[override,misc]
+		self._bits |= self._to_bits(other)
+		return self
+
+	def __iand__(self: _S, other: Iterable[Any]) -> _S:  # type: ignore[override,misc]
+		self._bits = (self & other)._bits
+		return self
+
+	def __ixor__(self: _S, other: Iterable[_E]) -> _S:  # type: ignore[override,misc]
+		self._bits ^= self._to_bits(other)
+		return self
+
+	def __isub__(self: _S, other: Iterable[Any]) -> _S:  # type: ignore[override,misc]
+		self._bits = (self - other)._bits
+		return self
+
+
+class EnumCounter(Mapping[_E, int]):
+	"""
+	Counts occurrences of members of ``enum``, in a list indexed by the members' ordinals.
+
+	Unlike :class:`collections.Counter`, the counts are kept in definition order,
+	and members are counted without being hashed.
+	Looking up a member which hasn't been counted returns ``0``;
+	iteration only includes members with non-zero counts.
+
+	:param enum:
+	:param members: An iterable of members, or a mapping of members to counts, to count.
+	"""
+
+	__slots__ = ("_enum", "_members", "_index", "_counts")
+
+	_enum: Type[_E]
+	_members: Tuple[_E, ...]
+	_index: Dict[int, int]
+	_counts: List[int]
+
+	def __init__(self, enum: Type[_E], members: Union[Iterable[_E], Mapping[_E, int]] = ()):
+		self._enum = enum
+		self._members = get_members(enum)  # type: ignore[assignment]
+		self._index = _get_id_ordinals(enum)
+		self._counts = [0] * len(self._members)
+
+		if members:
+			self.update(members)
+
+	@property
+	def enum(self) -> Type[_E]:
+		"""
+		The enum whose members are counted.
+		"""
+
+		return self._enum
+
+	@property
+	def counts(self) -> List[int]:
+		"""
+		The count for every member of the enum, in definition order.
+		"""
+
+		return self._counts.copy()
+
+	def __getitem__(self, member: _E) -> int:
+		try:
+			return self._counts[self._index[id(member)]]
+		except KeyError:
+			raise KeyError(member) from None
+
+	def __contains__(self, member: object) -> bool:
+		try:
+			return self._counts[self._index[id(member)]] != 0
+		except KeyError:
+			return False
+
+	def __iter__(self) -> Iterator[_E]:
+		return compress(self._members, self._counts)
+
+	def __len__(self) -> int:
+		return len(self._counts) - self._counts.count(0)
+
+	def add(self, member: _E, count: int = 1) -> None:
+		"""
+		Add ``count`` to the count for ``member``.
+
+		:param member:
+		:param count:
+
+		:raises ValueError: If ``member`` is not a canonical member of the enum.
+		"""
+
+		try:
+			self._counts[self._index[id(member)]] += count
+		except KeyError:
+			raise ValueError(f"{member!r} is not a canonical member of {self._enum.__qualname__}") from None
+
+	def update(self, members: Union[Iterable[_E], Mapping[_E, int]]) -> None:
+		"""
+		Count the members in ``members``.
+
+		:param members: An iterable of members, or a mapping of members to counts.
+			Counts from another :class:`~.EnumCounter` for the same enum are added without looking up any members.
+
+		:raises ValueError: If ``members`` contains objects which are not canonical members of the enum.
+		"""
+
+		if isinstance(members, EnumCounter) and members._enum is self._enum:
+			self._add_counts(members._counts)
+			return
+
+		counts = self._counts
+		index = self._index
+
+		if isinstance(members, Mapping):
+			items = list(members.items())
+
+			# Every member is looked up before any counts are changed, so an invalid member leaves them unchanged.
+			for member, _ in items:
+				if id(member) not in index:
+					raise ValueError(f"{member!r} is not a canonical member of {self._enum.__qualname__}")
+
+			for member, count in items:
+				counts[index[id(member)]] += count
+			return
+
+		# Counting ids is done in C, without calling Enum.__hash__
+		counted = Counter(map(id, members))
+
+		try:
+			ordinals = list(map(index.__getitem__, counted))
+		except KeyError:
+			raise ValueError(f"not all items are canonical members of {self._enum.__qualname__}") from None
+
+		for ordinal, count in zip(ordinals, counted.values()):
+			counts[ordinal] += count
+
+	def update_ordinals(self, ordinals: Iterable[int]) -> None:
+		"""
+		Count members by their ordinals.
+
+		:param ordinals: An iterable of ordinals, such as an :class:`array.array`,
+			the :class:`memoryview` returned by :func:`enum_tools.codec.decode_ordinals`, or a NumPy array.
+			NumPy arrays are counted with :func:`numpy.bincount`.
+
+		:raises ValueError: If an ordinal is out of range for the enum.
+		"""
+
+		member_count = len(self._counts)
+
+		if hasattr(ordinals, "dtype"):
+			# 3rd party
+			import numpy  # nodep
+
+			ordinals = numpy.ravel(ordinals)  # type: ignore[assignment]
+			if len(ordinals) and (ordinals.min() < 0 or ordinals.max() >= member_count):  # type: ignore[arg-type,attr-defined]
+				raise ValueError(f"ordinal out of range for {self._enum.__qualname__}")
+
+			self._add_counts(numpy.bincount(ordinals, minlength=member_count).tolist())  # type: ignore[call-overload]
+			return
+
+		counted = Counter(ordinals)
+		if counted and (min(counted) < 0 or max(counted) >= member_count):
+			raise ValueError(f"ordinal out of range for {self._enum.__qualname__}")
+
+		counts = self._counts
+		for ordinal, count in counted.items():
+			counts[ordinal] += count
+
+	def _add_counts(self, other: List[int]) -> None:
+		self._counts = [mine + theirs for mine, theirs in zip(self._counts, other)]
+
+	def total(self) -> int:
+		"""
+		Returns the sum of the counts.
+		"""
+
+		return sum(self._counts)
+
+	def most_common(self, n: Optional[int] = None) -> List[Tuple[_E, int]]:
+		"""
+		Returns the ``n`` most common members and their counts, from the most common to the least.
+
+		Members with equal counts are ordered by definition order.
+		Members which have not been counted are omitted.
+
+		:param n: The number of members to return. If :py:obj:`None`, all counted members are returned.
+		"""
+
+		counts = self._counts
+		ordinals = [ordinal for ordinal, count in enumerate(counts) if count]
+
+		if n is None:
+			ordinals.sort(key=counts.__getitem__, reverse=True)
+		else:
+			ordinals = nlargest(n, ordinals, key=counts.__getitem__)
+
+		return [(self._members[ordinal], counts[ordinal]) for ordinal in ordinals]
+
+	def elements(self) -> Iterator[_E]:
+		"""
+		Iterate over the members, in definition order, repeating each as many times as its count.
+		"""
+
+		for member, count in zip(self._members, self._counts):
+			yield from repeat(member, count)
+
+	def copy(self) -> "EnumCounter[_E]":
+		"""
+		Returns a copy of the counter.
+		"""
+
+		new = self.__class__(self._enum)
+		new._counts = self._counts.copy()
+		return new
+
+	@classmethod
+	def merge(cls, counters: Iterable["EnumCounter[_E]"]) -> "EnumCounter[_E]":
+		"""
+		Combine counters for the same enum, such as those from parallel workers, into a new counter.
+
+		:param counters:
+
+		:raises ValueError: If ``counters`` is empty, or the counters are for different enums.
+		"""
+
+		counters = iter(counters)
+
+		try:
+			merged = next(counters).copy()
+		except StopIteration:
+			raise ValueError("no counters to merge") from None
+
+		for counter in counters:
+			if counter._enum is not merged._enum:
+				raise ValueError(f"cannot merge counters for {merged._enum.__qualname__} and {counter._enum.__qualname__}")
+			merged._add_counts(counter._counts)
+
+		return merged
+
+	def __add__(self, other: "EnumCounter[_E]") -> "EnumCounter[_E]":
+		if not isinstance(other, EnumCounter):
+			return NotImplemented
+		return self.merge([self, other])
+
+	def __iadd__(self, other: "EnumCounter[_E]") -> "EnumCounter[_E]":
+		if not isinstance(other, EnumCounter):
+			return NotImplemented
+		self._counts = self.merge([self, other])._counts
+		return self
+
+	def __eq__(self, other: object) -> bool:
+		if isinstance(other, EnumCounter) and other._enum is self._enum:
+			return self._counts == other._counts
+		return super().__eq__(other)
+
+	def __repr__(self) -> str:
+		items = ", ".join(f"{member!r}: {count!r}" for member, count in self.items())
+		return f"{self.__class__.__name__}({self._enum.__qualname__}, {{{items}}})"
+
+	def __reduce__(self) -> Tuple:
+		return _restore_counter, (self.__class__, self._enum, self._counts)
+
+
+def _restore_counter(cls: Type[EnumCounter], enum: Type[Enum], counts: List[int]) -> EnumCounter:
+	counter = cls(enum)
+	counter._counts = list(counts)
+	return counter
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+#
+#  conversion.py
+"""
+Bulk conversion of raw values into enum members, reporting invalid values instead of raising exceptions.
+
+Converting values one at a time with ``Cls(value)`` raises an exception for each invalid value,
+and looks up repeated values again each time they occur.
+:func:`~.convert_values` looks up each distinct value once,
+and returns the members along with the positions of the values which could not be converted.
+NumPy arrays of values are converted to NumPy arrays of members, ordinals and positions.
+
+.. code-block:: python
+
+	result = convert_values(Status, [200, 404, 200, 999])
+	result.members  # [<Status.OK: 200>, <Status.NOT_FOUND: 404>, <Status.OK: 200>, None]
+	result.invalid  # [3]
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from collections.abc import Hashable
+from enum import Enum, Flag
+from functools import reduce
+from operator import itemgetter, or_
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+# this package
+from enum_tools.containers import _get_id_ordinals
+from enum_tools.utils import get_members
+
+if TYPE_CHECKING:
+	# 3rd party
+	import numpy  # nodep
+
+__all__ = ["ConversionResult", "convert_values"]
+
+# The result of converting a single distinct value: the member (or None), its ordinal, and any undefined flag bits.
+_Converted = Tuple[Optional[Enum], int, int]
+
+
+class ConversionResult(NamedTuple):
+	"""
+	The result of :func:`~.convert_values`.
+	"""
+
+	#: The member for each value, or :py:obj:`None` where the value is invalid.
+	#: An array of objects if the values were a NumPy array.
+	members: Union[List[Optional[Enum]], "numpy.ndarray"]
+
+	#: The ordinal of the member for each value (see :func:`enum_tools.utils.get_members`),
+	#: or ``-1`` where the value is invalid or is a composite of :class:`~enum.Flag` members.
+	#: An array of :class:`numpy.int64` if the values were a NumPy array.
+	ordinals: Union[List[int], "numpy.ndarray"]
+
+	#: The positions of the invalid values, in ascending order.
+	#: An array of :class:`numpy.intp` if the values were a NumPy array.
+	invalid: Union[List[int], "numpy.ndarray"]
+
+	#: For :class:`~enum.Flag` enums, a mapping of the positions of integers containing bits which are not
+	#: part of any member to those bits. Such values are also included in :attr:`~.invalid`.
+	undefined_bits: Dict[int, int]
+
+	@property
+	def ok(self) -> bool:
+		"""
+		Whether every value was converted.
+		"""
+
+		return len(self.invalid) == 0
+
+
+def _get_converter(enum: Type[Enum]) -> Callable[[Any], _Converted]:
+	"""
+	Returns a function which converts a single value to a member of ``enum``, without raising exceptions.
+	"""
+
+	value2member_map = enum._value2member_map_
+	ordinals = _get_id_ordinals(enum)
+	missing = enum._missing_
+
+	if issubclass(enum, Flag):
+		defined_bits = reduce(or_, (member._value_ for member in get_members(enum)), 0)
+
+		def convert(value: Any) -> _Converted:
+			if isinstance(value, int):
+				if value < 0:
+					return None, -1, 0
+
+				# Checked first, as pseudo-members with undefined bits may have been cached by the enum.
+				undefined = value & ~defined_bits
+				if undefined:
+					return None, -1, undefined
+
+			member = value2member_map.get(value)
+
+			if member is None:
+				if not isinstance(value, int):
+					return None, -1, 0
+
+				member = enum(value)
+
+			return member, ordinals.get(id(member), -1), 0
+
+	else:
+		overrides_missing = getattr(missing, "__func__", None) is not Enum._missing_.__func__  # type: ignore[attr-defined]
+
+		def convert(value: Any) -> _Converted:
+			member = value2member_map.get(value)
+
+			if member is None and overrides_missing:
+				try:
+					member = missing(value)
+				except Exception:  # pylint: disable=broad-except
+					# The enum would turn this into a ValueError.
+					member = None
+
+				if not isinstance(member, enum):
+					member = None
+
+			if member is None:
+				return None, -1, 0
+
+			return member, ordinals.get(id(member), -1), 0
+
+	return convert
+
+
+def _build_result(results: List[_Converted]) -> ConversionResult:
+	members = list(map(itemgetter(0), results))
+	ordinals = list(map(itemgetter(1), results))
+	invalid = [position for position, ordinal in enumerate(ordinals) if ordinal == -1 and members[position] is None]
+	undefined_bits = {position: results[position][2] for position in invalid if results[position][2]}
+
+	return ConversionResult(members, ordinals, invalid, undefined_bits)
+
+
+def convert_values(enum: Type[Enum], values: Iterable[Any]) -> ConversionResult:
+	"""
+	Convert each of ``values`` to the member of ``enum`` with that value.
+
+	Each distinct value is only looked up once.
+	Values which are not the value of a member, including unhashable values, are reported in the result.
+	For :class:`~enum.Flag` enums, integers made up of the values of several members are converted to
+	composite members, and integers with bits which are not part of any member are reported along with those bits.
+
+	If the enum defines a ``_missing_`` method it is called once for each distinct value which is not
+	the value of a member, and exceptions raised by it are treated as the value being invalid.
+
+	:param enum:
+	:param values: A sequence or iterable of values, or a NumPy array.
+		Multidimensional arrays are flattened, and positions refer to the flattened array.
+	"""
+
+	convert = _get_converter(enum)
+
+	if getattr(values, "dtype", None) is None:
+		return _convert_list(enum, convert, list(values))
+
+	# 3rd party
+	import numpy  # nodep
+
+	values = numpy.asarray(values).ravel()
+
+	try:
+		unique, inverse = _get_distinct(values)
+	except TypeError:
+		# Some of the values are unhashable.
+		result = _convert_list(enum, convert, values.tolist())
+
+		members = numpy.empty(len(result.members), dtype=object)
+		members[:] = result.members
+
+		return result._replace(
+				members=members,
+				ordinals=numpy.array(result.ordinals, dtype=numpy.int64),
+				invalid=numpy.array(result.invalid, dtype=numpy.intp),
+				)
+
+	converted = list(map(convert, unique))
+
+	members = numpy.empty(len(converted), dtype=object)
+	members[:] = list(map(itemgetter(0), converted))
+	ordinals = numpy.array(list(map(itemgetter(1), converted)), dtype=numpy.int64)
+	valid = numpy.array([result[0] is not None for result in converted], dtype=bool)
+
+	bits = list(map(itemgetter(2), converted))
+	undefined = numpy.flatnonzero(numpy.array(list(map(bool, bits)), dtype=bool).take(inverse))
+
+	return ConversionResult(
+			members=members.take(inverse),
+			ordinals=ordinals.take(inverse),
+			invalid=numpy.flatnonzero(~valid.take(inverse)),
+			undefined_bits=dict(zip(undefined.tolist(), map(bits.__getitem__, inverse.take(undefined).tolist()))),
+			)
+
+
+def _get_distinct(values: "numpy.ndarray") -> Tuple[List[Any], "numpy.ndarray"]:
+	"""
+	Returns the distinct items in the one-dimensional array ``values``, and the position of each value in them.
+
+	:raises TypeError: If ``values`` contains unhashable objects.
+	"""
+
+	# 3rd party
+	import numpy  # nodep
+
+	kind = values.dtype.kind
+
+	if values.size and (kind == 'i' or (kind == 'u' and values.dtype.itemsize < 8)):
+		low, high = int(values.min()), int(values.max())
+
+		if high - low <= len(values):
+			# Integers in a small range are used as indices into a table, which is faster than sorting them.
+			offsets = values.astype(numpy.int64) - low
+			present = numpy.zeros(high - low + 1, dtype=bool)
+			present[offsets] = True
+			positions = numpy.cumsum(present) - 1
+			return [low + offset for offset in numpy.flatnonzero(present).tolist()], positions.take(offsets)
+
+	if kind in "biufc":
+		unique, inverse = numpy.unique(values, return_inverse=True)
+		return unique.tolist(), inverse.ravel()
+
+	# Strings and objects are slow to sort, so are deduplicated by hashing instead.
+	items = values.tolist()
+	positions = {item: position for position, item in enumerate(dict.fromkeys(items))}
+	return list(positions), numpy.fromiter(map(positions.__getitem__, items), dtype=numpy.intp, count=len(items))
+
+
+def _convert_list(enum: Type[Enum], convert: Callable[[Any], _Converted], values: List[Any]) -> ConversionResult:
+	try:
+		distinct = dict.fromkeys(values)
+	except TypeError:
+		pass
+	else:
+		lookup = {value: convert(value) for value in distinct}
+		return _build_result(list(map(lookup.__getitem__, values)))
+
+	# Some of the values are unhashable, so can only be compared with the values of the members one at a time.
+	lookup = {}
+	results = []
+
+	for value in values:
+		if not _is_hashable(value):
+			results.append(_convert_unhashable(enum, value))
+		elif value in lookup:
+			results.append(lookup[value])
+		else:
+			results.append(lookup.setdefault(value, convert(value)))
+
+	return _build_result(results)
+
+
+def _is_hashable(value: Any) -> bool:
+	if not isinstance(value, Hashable):
+		return False
+
+	# Only reached when the values include unhashable ones, e.g. a tuple containing a list.
+	try:
+		hash(value)
+	except TypeError:
+		return False
+
+	return True
+
+
+def _convert_unhashable(enum: Type[Enum], value: Any) -> _Converted:
+	for ordinal, member in enumerate(get_members(enum)):
+		if member._value_ == value:
+			return member, ordinal, 0
+
+	return None, -1, 0
@@ -30,8 +30,21 @@ Custom subclasses of :class:`enum.Enum` and :class:`enum.Flag`.
 
 # stdlib
 import sys
-from enum import Enum, Flag, IntFlag
-from typing import Any, Iterator, List
+import threading
+from bisect import bisect_right
+from enum import Enum, EnumMeta, Flag, IntFlag
+from functools import _CacheInfo, lru_cache, reduce, wraps
+from operator import or_
+from types import DynamicClassAttribute
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
+
+# this package
+from enum_tools.utils import _popcount, get_members
+
+if TYPE_CHECKING:
+	# this package
+	from enum_tools.arrays import EnumArray
 
 __all__ = [
 		"MemberDirEnum",
@@ -40,6 +53,9 @@ __all__ = [
 		"AutoNumberEnum",
 		"OrderedEnum",
 		"DuplicateFreeEnum",
+		"IdentityHashEnum",
+		"MultiValueEnum",
+		"IntervalEnum",
 		"IterableFlag",
 		"IterableIntFlag",
 		]
@@ -55,6 +71,8 @@ if sys.version_info >= (3, 11):  # pragma: no cover
 			return False
 		return value == 2**_high_bit(value)
 
+	_FlagsToCheck = Tuple[Tuple[Flag, int], ...]
+
 	def _decompose(flag, value):  # noqa: MAN001,MAN002,PRM002
 		"""
 		Extract all members from the value.
@@ -65,22 +83,12 @@ if sys.version_info >= (3, 11):  # pragma: no cover
 		# _decompose is only called if the value is not named
 		not_covered = value
 
-		# issue29167: wrap accesses to _value2member_map_ in a list to avoid race
-		#             conditions between iterating over it and having more pseudo-
-		#             members added to it
+		value2member_map = flag._value2member_map_
+		named_flags, all_flags = _get_decompose_snapshot(flag, value2member_map)
 
-		flags_to_check = []
-
-		if value < 0:
-			# only check for named flags
-			for v, m in list(flag._value2member_map_.items()):
-				if m.name is not None:
-					flags_to_check.append((m, v))
-		else:
-			# check for named flags and powers-of-two flags
-			for v, m in list(flag._value2member_map_.items()):
-				if m.name is not None or _power_of_two(v):
-					flags_to_check.append((m, v))
+		# only check for named flags if the value is negative,
+		# otherwise check for named flags and powers-of-two flags
+		flags_to_check = named_flags if value < 0 else all_flags
 
 		members = []
 
@@ -89,8 +97,8 @@ if sys.version_info >= (3, 11):  # pragma: no cover
 				members.append(member)
 				not_covered &= ~member_value
 
-		if not members and value in flag._value2member_map_:
-			members.append(flag._value2member_map_[value])
+		if not members and value in value2member_map:
+			members.append(value2member_map[value])
 
 		members.sort(key=lambda m: m._value_, reverse=True)
 
@@ -100,13 +108,483 @@ if sys.version_info >= (3, 11):  # pragma: no cover
 
 		return members, not_covered
 
+	def _get_decompose_snapshot(
+			flag: Type[Flag],
+			value2member_map: Dict[Any, Flag],
+			) -> Tuple[_FlagsToCheck, _FlagsToCheck]:
+		"""
+		Returns the named flags of ``flag``, and the named and powers-of-two flags, as ``(member, value)`` pairs.
+		"""
+
+		# The snapshot is stored on the class, as it refers to the members and so would keep the class alive
+		# if it were stored elsewhere. Snapshots are immutable, and are replaced when pseudo-members are added
+		# to _value2member_map_. Members are only ever added to the map, so its size identifies its contents.
+		size = len(value2member_map)
+		snapshot = flag.__dict__.get("_decompose_snapshot_")
+
+		if snapshot is None or snapshot[0] != size:
+			# issue29167: copy _value2member_map_ to avoid race conditions between iterating over it
+			#             and having more pseudo-members added to it.
+			#             dict.copy() is atomic, even on free-threaded builds.
+			items = value2member_map.copy().items()
+
+			# Composite pseudo-members have names since Python 3.11, but are not in _member_map_.
+			member_map = flag._member_map_
+			named = [member_map.get(m._name_) is m for v, m in items]  # type: ignore[arg-type]
+
+			named_flags = tuple((m, v) for (v, m), is_named in zip(items, named) if is_named)
+			all_flags = tuple((m, v) for (v, m), is_named in zip(items, named) if is_named or _power_of_two(v))
+			snapshot = (len(items), named_flags, all_flags)
+			type.__setattr__(flag, "_decompose_snapshot_", snapshot)
+
+		return snapshot[1], snapshot[2]
+
 else:  # pragma: no cover (py310+)
 
 	# stdlib
 	from enum import _decompose  # type: ignore[attr-defined]
 
 
-class MemberDirEnum(Enum):
+_IE = TypeVar("_IE", bound=Enum)
+
+# The maximum number of strings and values remembered by each flag formatter.
+_FLAG_CACHE_SIZE = 1024
+
+_dir_cache: "WeakKeyDictionary[Type[Enum], Tuple[int, Dict[Tuple[str, ...], Tuple[str, ...]]]]"
+_dir_cache = WeakKeyDictionary()
+
+# Incremented whenever an attribute of a MemberDirEnum class is set or deleted, which invalidates _dir_cache.
+_dir_version = 0
+
+# Held while installing lookup tables on classes, so every thread uses the same table.
+_install_lock = threading.Lock()
+
+
+class _IntLookup(dict):
+	"""
+	Mapping of values to members, used by :meth:`IntEnum.from_int`.
+
+	Lookups which hit the mapping happen entirely in C. Misses fall back to calling the enum.
+
+	:param enum:
+	"""
+
+	__slots__ = ("enum", )
+
+	def __init__(self, enum: Type[Enum]):
+		super().__init__(enum._value2member_map_)
+		self.enum = enum
+
+	def __missing__(self, value: int) -> Enum:
+		member = self.enum(value)
+
+		if isinstance(member, Flag):
+			# Remember composite flags, as the enum itself does.
+			self[value] = member
+
+		return member
+
+
+def _get_int_lookup(cls: Type[Enum]) -> Optional[_IntLookup]:
+	"""
+	Returns the :class:`_IntLookup` for ``cls``, creating it if necessary.
+
+	The lookup's ``__getitem__`` method is installed as ``cls.from_int``,
+	so subsequent calls to that method go straight to the lookup.
+
+	:param cls:
+	"""
+
+	from_int = cls.__dict__.get("from_int")
+	if isinstance(getattr(from_int, "__self__", None), _IntLookup):
+		return from_int.__self__  # type: ignore[union-attr]
+
+	if not cls._member_map_:
+		# Don't install the lookup on a base class, as subclasses would inherit it.
+		return None
+
+	with _install_lock:
+		# Another thread may have installed the lookup while this one was waiting.
+		from_int = cls.__dict__.get("from_int")
+		if isinstance(getattr(from_int, "__self__", None), _IntLookup):
+			return from_int.__self__  # type: ignore[union-attr]
+
+		lookup = _IntLookup(cls)
+		type.__setattr__(cls, "from_int", lookup.__getitem__)
+
+	return lookup
+
+
+def _from_int(cls: Type[_IE], value: int) -> _IE:
+	lookup = _get_int_lookup(cls)
+
+	if lookup is None:
+		return cls(value)
+
+	return lookup[value]  # type: ignore[return-value]
+
+
+def _from_ints(cls: Type[_IE], values: Iterable[int]) -> List[_IE]:
+	lookup = _get_int_lookup(cls)
+
+	if hasattr(values, "dtype"):
+		# NumPy array
+		values = values.tolist()  # type: ignore[attr-defined]
+
+	if lookup is None:
+		return [cls(value) for value in values]
+
+	return list(map(lookup.__getitem__, values))
+
+
+class _IntervalTable:
+	"""
+	The intervals of an :class:`~.IntervalEnum`, sorted by their lower bounds.
+
+	:param enum:
+	"""
+
+	__slots__ = ("lowers", "uppers", "members", "ordinals")
+
+	def __init__(self, enum: Type[Enum]):
+		members = get_members(enum)
+
+		self.ordinals = sorted(range(len(members)), key=lambda ordinal: members[ordinal]._value_)
+		self.members = [members[ordinal] for ordinal in self.ordinals]
+		self.lowers = [member._value_[0] for member in self.members]
+		self.uppers = [member._value_[1] for member in self.members]
+
+	def lookup(self, value: Any) -> Optional[Enum]:
+		try:
+			index = bisect_right(self.lowers, value) - 1
+			if index >= 0 and value < self.uppers[index]:
+				return self.members[index]
+		except TypeError:
+			pass
+
+		return None
+
+
+def _get_interval_table(cls: Type[Enum]) -> _IntervalTable:
+	"""
+	Returns the :class:`_IntervalTable` for ``cls``, creating it if necessary.
+
+	The table's ``lookup`` method is installed as ``cls.lookup``,
+	so subsequent calls to that method go straight to the table.
+
+	:param cls:
+	"""
+
+	lookup = cls.__dict__.get("lookup")
+	if isinstance(getattr(lookup, "__self__", None), _IntervalTable):
+		return lookup.__self__  # type: ignore[union-attr]
+
+	# Don't install the table on a base class, as subclasses would inherit it,
+	# or over a member named "lookup".
+	if not cls._member_map_ or "lookup" in cls._member_map_:
+		return _IntervalTable(cls)
+
+	with _install_lock:
+		# Another thread may have installed the table while this one was waiting.
+		lookup = cls.__dict__.get("lookup")
+		if isinstance(getattr(lookup, "__self__", None), _IntervalTable):
+			return lookup.__self__  # type: ignore[union-attr]
+
+		table = _IntervalTable(cls)
+		type.__setattr__(cls, "lookup", table.lookup)
+
+	return table
+
+
+def _flag_value(flag: Flag) -> int:
+	value = flag._value_
+
+	if value < 0:  # pragma: no cover (py311+)
+		# Inverted IntFlags have negative values before Python 3.11
+		value &= reduce(or_, (member._value_ for member in flag.__class__.__members__.values()), 0)
+
+	return value
+
+
+def _other_value(flag: Flag, other: Any, operation: str) -> int:
+	"""
+	Returns the value of ``other``, which must be a flag of the same class as ``flag``, or an :class:`int`.
+	"""
+
+	if isinstance(other, flag.__class__):
+		return _flag_value(other)
+	elif isinstance(other, int) and not isinstance(other, Enum):
+		return other
+
+	raise TypeError(
+			f"unsupported operand type(s) for {operation!r}: "
+			f"{type(other).__qualname__!r} and {flag.__class__.__qualname__!r}"
+			)
+
+
+def _flag_contains(flag: Flag, other: Any) -> bool:
+	value = _other_value(flag, other, "in")
+	return value & _flag_value(flag) == value
+
+
+def _flag_issubset(flag: Flag, other: Any) -> bool:
+	return _flag_value(flag) & ~_other_value(flag, other, "issubset") == 0
+
+
+def _flag_issuperset(flag: Flag, other: Any) -> bool:
+	value = _other_value(flag, other, "issuperset")
+	return value & _flag_value(flag) == value
+
+
+class _FlagFormatter:
+	"""
+	Parses and formats the flags of ``enum`` as strings of member names separated by ``sep``.
+
+	:param enum:
+	:param sep:
+	"""
+
+	def __init__(self, enum: Type[Flag], sep: str):
+		self.enum = enum
+		self.sep = sep
+
+		self.names: Dict[str, int] = {name: member._value_ for name, member in enum.__members__.items()}
+		self.canonical_names: Dict[int, str] = {}
+		self.bits: List[int] = []
+
+		for member in get_members(enum):
+			value = member._value_
+			self.canonical_names.setdefault(value, member._name_)
+			if value > 0 and value & (value - 1) == 0:
+				self.bits.append(value)
+
+		self.parse = lru_cache(maxsize=_FLAG_CACHE_SIZE)(self._parse)
+		self.format = lru_cache(maxsize=_FLAG_CACHE_SIZE)(self._format)
+
+	def _parse(self, text: str) -> Flag:
+		value = 0
+
+		for token in text.split(self.sep):
+			token = token.strip()
+
+			if not token:
+				continue
+
+			try:
+				value |= self.names[token]
+			except KeyError:
+				try:
+					value |= int(token, 0)
+				except ValueError:
+					raise ValueError(f"{token!r} is not a valid {self.enum.__qualname__} member name") from None
+
+		return self.enum(value)
+
+	def _format(self, value: int) -> str:
+		if value < 0:  # pragma: no cover (py311+)
+			value = _flag_value(self.enum(value))
+
+		try:
+			return self.canonical_names[value]
+		except KeyError:
+			pass
+
+		names = []
+		for bit in self.bits:
+			if value & bit:
+				names.append(self.canonical_names[bit])
+				value &= ~bit
+
+		if value:
+			names.append(hex(value))
+
+		return self.sep.join(names)
+
+
+def _get_flag_formatter(cls: Type[Flag], sep: str) -> _FlagFormatter:
+	# The formatters are stored on the class, as they refer to it and so would keep it alive if stored elsewhere.
+	formatters = cls.__dict__.get("_flag_formatters_")
+
+	if formatters is None:
+		with _install_lock:
+			# Another thread may have installed the formatters while this one was waiting.
+			formatters = cls.__dict__.get("_flag_formatters_")
+			if formatters is None:
+				formatters = {}
+				type.__setattr__(cls, "_flag_formatters_", formatters)
+
+	try:
+		return formatters[sep]
+	except KeyError:
+		# setdefault is atomic, so concurrent callers all get the same formatter and share its caches.
+		return formatters.setdefault(sep, _FlagFormatter(cls, sep))
+
+
+def _flag_format(cls: Type[Flag], value: Union[Flag, int], sep: str) -> str:
+	if isinstance(value, cls):
+		value = value._value_
+	elif isinstance(value, Enum) or not isinstance(value, int):
+		raise TypeError(f"{value!r} is not a {cls.__qualname__} or an int")
+
+	return _get_flag_formatter(cls, sep).format(int(value))
+
+
+# Modules whose implementations of the attributes below only depend on the class, name and value of the member.
+_pure_modules = frozenset({"builtins", "enum", __name__})
+
+# The attributes used to produce the output of str(), repr() and format().
+_string_attributes = ("__str__", "__repr__", "__format__", "name", "value", "_value_repr_")
+
+
+def _is_pure(enum: Type[Enum], attribute: str) -> bool:
+	"""
+	Returns whether ``attribute`` of ``enum`` is defined by :mod:`enum`, :mod:`builtins` or this module.
+
+	The enum module copies some of these attributes onto new classes, so they are compared by identity.
+	"""
+
+	for klass in enum.__mro__:
+		if attribute in klass.__dict__:
+			found = klass.__dict__[attribute]
+			return any(
+					base.__module__ in _pure_modules and base.__dict__.get(attribute) is found
+					for base in enum.__mro__
+					)
+
+	return True
+
+
+class _StringCache:
+	"""
+	Records whether the output of ``str()``, ``repr()`` and ``format()`` can be cached for the members of ``enum``.
+
+	The output is stored on the members themselves.
+	Composite flags are created on demand, so only a limited number of them have their output stored.
+
+	:param enum:
+	"""
+
+	__slots__ = ("enabled", "composites")
+
+	def __init__(self, enum: Type[Enum]):
+		# If a subclass overrides how members are formatted it may return different output each time,
+		# for example by translating the names of the members.
+		self.enabled = all(_is_pure(enum, attribute) for attribute in _string_attributes)
+
+		# The number of strings stored on composite flags.
+		# This may be slightly out when several threads store strings at once, which does no harm.
+		self.composites = 0
+
+
+def _get_string_cache(cls: Type[Enum]) -> _StringCache:
+	"""
+	Returns the :class:`_StringCache` for ``cls``, creating it if necessary.
+
+	:param cls:
+	"""
+
+	cache = cls.__dict__.get("_string_cache_")
+	if cache is not None:
+		return cache
+
+	with _install_lock:
+		# Another thread may have installed the cache while this one was waiting.
+		cache = cls.__dict__.get("_string_cache_")
+		if cache is None:
+			cache = _StringCache(cls)
+			type.__setattr__(cls, "_string_cache_", cache)
+
+	return cache
+
+
+def _cached_string(member: Enum, attribute: str, function: Callable[..., str], *args: Any) -> str:
+	"""
+	Returns the output of ``function(member, *args)``, and stores it as ``attribute`` on ``member`` if possible.
+
+	:param member:
+	:param attribute:
+	:param function:
+	:param args:
+	"""
+
+	string = function(member, *args)
+	cls = member.__class__
+	cache = _get_string_cache(cls)
+
+	if not cache.enabled:
+		return string
+
+	if cls._member_map_.get(member._name_) is not member:  # type: ignore[arg-type]
+		if cache.composites >= _FLAG_CACHE_SIZE:
+			return string
+		cache.composites += 1
+
+	member.__dict__[attribute] = string
+	return string
+
+
+def _install_cached_strings(cls: Type[Enum], *names: str) -> None:
+	"""
+	Wrap the ``__str__``, ``__repr__`` and/or ``__format__`` methods of ``cls``,
+	so their output is only computed once for each member.
+
+	The methods are wrapped after the class is created, as the enum module may replace the methods defined on it.
+
+	:param cls:
+	:param names:
+	"""
+
+	for name in names:
+		function = getattr(cls, name)
+
+		if name == "__format__":
+			type.__setattr__(cls, name, _make_cached_format(function))
+		else:
+			type.__setattr__(cls, name, _make_cached_string(function, f"_{name.strip('_')}_"))
+
+
+def _make_cached_string(function: Callable[[Any], str], attribute: str) -> Callable[[Any], str]:
+
+	@wraps(function)
+	def wrapper(self: Enum) -> str:
+		return self.__dict__.get(attribute) or _cached_string(self, attribute, function)
+
+	return wrapper
+
+
+def _make_cached_format(function: Callable[[Any, str], str]) -> Callable[[Any, str], str]:
+
+	@wraps(function)
+	def wrapper(self: Enum, format_spec: str) -> str:
+		if format_spec:
+			# Only the default format is cached.
+			return function(self, format_spec)
+
+		return self.__dict__.get("_format_") or _cached_string(self, "_format_", function, '')
+
+	return wrapper
+
+
+class _MemberDirEnumMeta(EnumMeta):
+	"""
+	Metaclass for :class:`~.MemberDirEnum`, which invalidates the cached output of :func:`dir`
+	when attributes of the class are set or deleted.
+	"""
+
+	def __setattr__(cls, name: str, value: Any) -> None:
+		global _dir_version
+
+		super().__setattr__(name, value)
+		_dir_version += 1
+
+	def __delattr__(cls, name: str) -> None:
+		global _dir_version
+
+		super().__delattr__(name)
+		_dir_version += 1
+
+
+class MemberDirEnum(Enum, metaclass=_MemberDirEnumMeta):
 	"""
 	:class:`~enum.Enum` which includes attributes as well as methods.
 
@@ -115,17 +593,77 @@ class MemberDirEnum(Enum):
 	.. seealso:: Pull request :pull:`19219 <python/cpython>` by Angelin BOOZ, which added this to CPython.
 
 	.. versionadded:: 0.6.0
+
+	.. versionchanged:: 0.14.0
+
+		The class-level part of the output of :func:`dir` is cached,
+		and recomputed when attributes of a :class:`~.MemberDirEnum` class are set or deleted.
 	"""
 
 	def __dir__(self) -> List[str]:
-		return super().__dir__() + [m for m in self.__dict__ if m[0] != '_']
+		instance_names = tuple(self.__dict__)
+		cls = self.__class__
+
+		# Read before computing the result, so an attribute set meanwhile invalidates it.
+		version = _dir_version
+
+		entry = _dir_cache.get(cls)
+		if entry is None or entry[0] != version:
+			entry = _dir_cache[cls] = (version, {})
+
+		results = entry[1]
+
+		try:
+			class_names = results[instance_names]
+		except KeyError:
+			# Enum.__dir__ depends on the names in the instance __dict__, which are usually the same for every member.
+			class_names = results.setdefault(instance_names, tuple(super().__dir__()))
+
+		return [*class_names, *(name for name in instance_names if name[0] != '_')]
 
 
 class IntEnum(int, Enum):
 	"""
 	:class:`~enum.Enum` where members are also (and must be) ints.
+
+	.. versionchanged:: 0.14.0  The output of :func:`repr` and default :func:`format` is cached for each member.
 	"""
 
+	@classmethod
+	def from_int(cls: Type[_IE], value: int) -> _IE:
+		"""
+		Returns the member with the given value.
+
+		This is equivalent to ``cls(value)``, but faster.
+		The first call builds a lookup table for the class,
+		after which members are looked up without calling the enum or running any Python code.
+
+		.. versionadded:: 0.14.0
+
+		:param value:
+
+		:raises ValueError: If ``value`` is not the value of a member.
+		"""
+
+		return _from_int(cls, value)
+
+	@classmethod
+	def from_ints(cls: Type[_IE], values: Iterable[int]) -> List[_IE]:
+		"""
+		Returns the members with the given values, as a list.
+
+		This is equivalent to ``[cls(value) for value in values]``, but faster.
+		``values`` may be any iterable, including an :class:`array.array`, :class:`memoryview` or NumPy array.
+
+		.. versionadded:: 0.14.0
+
+		:param values:
+
+		:raises ValueError: If any of the values is not the value of a member.
+		"""
+
+		return _from_ints(cls, values)
+
 
 # 	def __int__(self):
 # 		return self.value
@@ -137,9 +675,18 @@ class IntEnum(int, Enum):
 # 			return super().__eq__(other)
 
 
+if sys.version_info >= (3, 11):  # pragma: no cover (<py311)
+	_install_cached_strings(IntEnum, "__str__", "__repr__", "__format__")
+else:  # pragma: no cover (py311+)
+	# Enum.__format__ uses the value's format() unless __str__ is overridden.
+	_install_cached_strings(IntEnum, "__repr__", "__format__")
+
+
 class StrEnum(str, Enum):
 	"""
 	:class:`~enum.Enum` where members are also (and must be) strings.
+
+	.. versionchanged:: 0.14.0  The output of :func:`str`, :func:`repr` and :func:`format` is cached for each member.
 	"""
 
 	def __str__(self) -> str:
@@ -175,6 +722,9 @@ class StrEnum(str, Enum):
 	# 		return super().__eq__(other)
 
 
+_install_cached_strings(StrEnum, "__str__", "__repr__", "__format__")
+
+
 class AutoNumberEnum(Enum):
 	"""
 	:class:`~enum.Enum` that automatically assigns increasing values to members.
@@ -226,6 +776,224 @@ class DuplicateFreeEnum(Enum):  # noqa: PRM002
 			raise ValueError(f"aliases are not allowed in DuplicateFreeEnum:  {a!r} --> {e!r}")
 
 
+class IdentityHashEnum(Enum):
+	"""
+	:class:`~enum.Enum` whose members are hashed by identity, for faster use as dictionary keys and set items.
+
+	:class:`~enum.Enum` hashes members by calling a Python method which hashes their name.
+	Members of an :class:`~.IdentityHashEnum` instead use :meth:`object.__hash__`,
+	which is fixed when the member is created and does not run any Python code.
+	This is consistent with equality, as members of a plain :class:`~enum.Enum` are only equal to themselves.
+
+	Enums with a mixin type which defines its own hash, such as :class:`int` or :class:`str`,
+	continue to hash like their values, so they still match their values in dictionaries and sets.
+
+	Hashes are not stable between processes, but nor are the hashes of strings.
+
+	.. versionadded:: 0.14.0
+	"""
+
+	__hash__ = object.__hash__
+
+	def __init_subclass__(cls, **kwargs) -> None:
+		super().__init_subclass__(**kwargs)
+
+		mro = cls.__mro__
+		position = mro.index(IdentityHashEnum)
+
+		if any("__hash__" in base.__dict__ for base in mro[:position]):
+			# The subclass or one of its other bases already overrides __hash__.
+			return
+
+		# The mixin type may come after this class in the MRO, e.g. ``class Code(IdentityHashEnum, IntEnum)``.
+		for base in mro[position + 1:]:
+			if "__hash__" in base.__dict__:
+				if base is not object and not issubclass(base, Enum):
+					type.__setattr__(cls, "__hash__", base.__dict__["__hash__"])
+				break
+
+
+class MultiValueEnum(Enum):
+	"""
+	:class:`~enum.Enum` whose members have several values, any of which can be used to look up the member.
+
+	Each member is assigned a tuple of values. The first is the member's :attr:`~enum.Enum.value`,
+	and is used when pickling and comparing members.
+	All of the values are added to the enum's lookup table when the class is created,
+	so ``Cls(value)`` takes constant time whichever value is used.
+
+	.. code-block:: python
+
+		class Country(MultiValueEnum):
+			UNITED_KINGDOM = 826, "GB", "GBR", "United Kingdom"
+			FRANCE = 250, "FR", "FRA", "France"
+
+		Country("GBR")  # <Country.UNITED_KINGDOM: 826>
+		Country.FRANCE.values  # (250, 'FR', 'FRA', 'France')
+
+	A member assigned a single value which is not a tuple has just that value.
+	Values must be hashable. A member assigned exactly the same values as an earlier member is an alias of it,
+	but a :exc:`ValueError` is raised if only some of a member's values are used by another member.
+
+	Mixin types such as :class:`int` are constructed from the first value.
+
+	.. versionadded:: 0.14.0
+	"""
+
+	_values_: Tuple[Any, ...]
+
+	def __new__(cls, *values):  # noqa: D102
+		if cls._member_type_ is object:
+			member = object.__new__(cls)
+		else:
+			member = cls._member_type_.__new__(cls, values[0])
+
+		member._value_ = values[0]
+		member._values_ = values
+		return member
+
+	def __init__(self, *values) -> None:
+		value2member_map = self.__class__._value2member_map_
+
+		try:
+			existing = [value2member_map.get(value) for value in values]
+		except TypeError:
+			raise ValueError(f"the values of {self._name_!r} must be hashable") from None
+
+		if existing[0] is not None and existing[0]._values_ == values:
+			# An alias, which the enum machinery handles.
+			return
+
+		for value, member in zip(values, existing):
+			if member is not None:
+				raise ValueError(f"{self._name_!r} has the value {value!r}, which is already used by {member._name_!r}")
+
+		if len(set(values)) != len(values):
+			raise ValueError(f"{self._name_!r} has duplicate values")
+
+		# The first value is added to the table by the enum machinery once the member is complete.
+		for value in values[1:]:
+			value2member_map[value] = self
+
+	@DynamicClassAttribute
+	def values(self) -> Tuple[Any, ...]:
+		"""
+		All of the values of the member, starting with its :attr:`~enum.Enum.value`.
+		"""
+
+		return self._values_
+
+
+class IntervalEnum(OrderedEnum):
+	"""
+	:class:`~.OrderedEnum` whose members cover half-open intervals of numbers.
+
+	Each member is assigned a ``(lower, upper)`` tuple, and covers the values ``lower <= value < upper``.
+	Calling the enum with a number returns the member whose interval contains it,
+	which is found by binary search over the sorted bounds.
+
+	.. code-block:: python
+
+		class StatusClass(IntervalEnum):
+			INFORMATIONAL = 100, 200
+			SUCCESS = 200, 300
+			REDIRECTION = 300, 400
+			CLIENT_ERROR = 400, 500
+			SERVER_ERROR = 500, 600
+
+		StatusClass(204)  # <StatusClass.SUCCESS: (200, 300)>
+
+	Intervals may not overlap, which is checked as each member is created,
+	but there may be gaps between them. Use :py:obj:`math.inf` for unbounded intervals.
+	Members are ordered by their intervals.
+
+	.. versionadded:: 0.14.0
+	"""
+
+	def __init__(self, *bounds) -> None:
+		if len(bounds) != 2:
+			raise ValueError(f"{self._name_!r} must be assigned a (lower, upper) tuple")
+
+		lower, upper = bounds
+		if not lower < upper:
+			raise ValueError(f"the lower bound of {self._name_!r} must be less than its upper bound")
+
+		for member in self.__class__._member_map_.values():
+			other_lower, other_upper = member._value_
+
+			if (lower, upper) == (other_lower, other_upper):
+				# An alias, which the enum machinery handles.
+				break
+
+			if lower < other_upper and other_lower < upper:
+				raise ValueError(f"the interval of {self._name_!r} overlaps with the interval of {member._name_!r}")
+
+	@DynamicClassAttribute
+	def lower(self) -> Any:
+		"""
+		The inclusive lower bound of the member's interval.
+		"""
+
+		return self._value_[0]
+
+	@DynamicClassAttribute
+	def upper(self) -> Any:
+		"""
+		The exclusive upper bound of the member's interval.
+		"""
+
+		return self._value_[1]
+
+	@classmethod
+	def _missing_(cls, value: Any) -> Optional["IntervalEnum"]:
+		return cls.lookup(value)
+
+	@classmethod
+	def lookup(cls: Type[_IE], value: Any) -> Optional[_IE]:
+		"""
+		Returns the member whose interval contains ``value``, or :py:obj:`None` if no interval contains it.
+
+		The first call builds a sorted table of the intervals for the class,
+		after which this method is replaced by a direct lookup in the table.
+
+		:param value:
+		"""
+
+		return _get_interval_table(cls).lookup(value)  # type: ignore[return-value]
+
+	@classmethod
+	def lookup_array(cls: Type[_IE], values: Any) -> "EnumArray[_IE]":
+		"""
+		Returns an :class:`~enum_tools.arrays.EnumArray` of the members whose intervals contain each of ``values``.
+
+		The whole array is classified at once with :func:`numpy.searchsorted`.
+		Requires NumPy.
+
+		:param values: A NumPy array or other sequence of numbers.
+
+		:raises ValueError: If any value is not contained by an interval.
+		"""
+
+		# 3rd party
+		import numpy  # nodep
+
+		# this package
+		from enum_tools.arrays import EnumArray, get_code_dtype
+
+		table = _get_interval_table(cls)
+		values = numpy.asarray(values).ravel()
+
+		indices = numpy.searchsorted(numpy.asarray(table.lowers), values, side="right") - 1
+		found = (indices >= 0) & (values < numpy.asarray(table.uppers).take(indices.clip(0)))
+
+		if not found.all():
+			bad = values[~found][:1].tolist()[0]
+			raise ValueError(f"{bad!r} is not in the interval of any member of {cls.__qualname__}")
+
+		codes = numpy.asarray(table.ordinals, dtype=get_code_dtype(cls)).take(indices)
+		return EnumArray._from_valid_codes(cls, codes)
+
+
 class IterableFlag(Flag):
 	"""
 	:class:`~enum.Flag` with support for iterating over members and member combinations.
@@ -233,6 +1001,8 @@ class IterableFlag(Flag):
 	This functionality was added to Python 3.10's :mod:`enum` module in :pull:`22221 <python/cpython>`.
 
 	.. versionadded:: 0.5.0
+
+	.. versionchanged:: 0.14.0  The output of :func:`str`, :func:`repr` and :func:`format` is cached for each member.
 	"""
 
 	def __iter__(self) -> Iterator[Flag]:
@@ -247,6 +1017,152 @@ class IterableFlag(Flag):
 		members, extra_flags = _decompose(self.__class__, self.value)
 		return (m for m in members if m._value_ != 0)
 
+	def __len__(self) -> int:
+		"""
+		Returns the number of bits set in the flag's value.
+
+		.. versionadded:: 0.14.0
+		"""
+
+		return _popcount(_flag_value(self))
+
+	def __contains__(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in ``other`` is also set in this flag.
+
+		``other`` may be a flag of the same class, or an :class:`int`.
+
+		.. versionadded:: 0.14.0
+
+		:param other:
+		"""
+
+		return _flag_contains(self, other)
+
+	def issubset(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in this flag is also set in ``other``.
+
+		.. versionadded:: 0.14.0
+
+		:param other: A flag of the same class, or an :class:`int`.
+		"""
+
+		return _flag_issubset(self, other)
+
+	def issuperset(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in ``other`` is also set in this flag.
+
+		.. versionadded:: 0.14.0
+
+		:param other: A flag of the same class, or an :class:`int`.
+		"""
+
+		return _flag_issuperset(self, other)
+
+	def __le__(self, other: Any) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return _flag_issubset(self, other)
+
+	def __lt__(self, other: Any) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return self._value_ != other._value_ and _flag_issubset(self, other)
+
+	def __ge__(self, other: Any) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return _flag_issuperset(self, other)
+
+	def __gt__(self, other: Any) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		return self._value_ != other._value_ and _flag_issuperset(self, other)
+
+	@classmethod
+	def parse(cls: Type[_IE], text: str, sep: str = '|') -> _IE:
+		"""
+		Returns the flag represented by ``text``, which contains member names separated by ``sep``.
+
+		Integers, in decimal or in hexadecimal with the ``0x`` prefix, may be given for bits without names.
+		The results are cached for recently parsed strings.
+
+		.. versionadded:: 0.14.0
+
+		:param text:
+		:param sep:
+
+		:raises ValueError: If ``text`` contains an unknown name.
+		"""
+
+		return _get_flag_formatter(cls, sep).parse(text)  # type: ignore[arg-type,return-value]
+
+	@classmethod
+	def format(cls, value: Union[Flag, int], sep: str = '|') -> str:
+		"""
+		Returns the names of the members in ``value`` separated by ``sep``; the inverse of :meth:`~.parse`.
+
+		Named members are given by their own name. Other values are given by the names of their single-bit members,
+		in definition order, followed by any remaining bits in hexadecimal.
+		The results are cached for recently formatted values.
+
+		.. versionadded:: 0.14.0
+
+		:param value: A flag of this class, or an :class:`int`.
+		:param sep:
+		"""
+
+		return _flag_format(cls, value, sep)  # type: ignore[arg-type]
+
+	@classmethod
+	def cache_info(cls, sep: str = '|') -> Dict[str, _CacheInfo]:
+		"""
+		Returns the statistics of the caches used by :meth:`~.parse` and :meth:`~.format` with the separator ``sep``.
+
+		.. versionadded:: 0.14.0
+
+		:param sep:
+
+		:returns: A mapping of ``'parse'`` and ``'format'`` to :func:`functools.lru_cache` statistics.
+		"""
+
+		formatter = _get_flag_formatter(cls, sep)  # type: ignore[arg-type]
+		return {"parse": formatter.parse.cache_info(), "format": formatter.format.cache_info()}
+
+	@classmethod
+	def from_int(cls: Type[_IE], value: int) -> _IE:
+		"""
+		Returns the flag with the given value.
+
+		This is equivalent to ``cls(value)``, but faster for the values of named members.
+
+		.. versionadded:: 0.14.0
+
+		:param value:
+		"""
+
+		return _from_int(cls, value)
+
+	@classmethod
+	def from_ints(cls: Type[_IE], values: Iterable[int]) -> List[_IE]:
+		"""
+		Returns the flags with the given values, as a list.
+
+		This is equivalent to ``[cls(value) for value in values]``, but faster.
+		``values`` may be any iterable, including an :class:`array.array`, :class:`memoryview` or NumPy array.
+
+		.. versionadded:: 0.14.0
+
+		:param values:
+		"""
+
+		return _from_ints(cls, values)
+
+
+_install_cached_strings(IterableFlag, "__str__", "__repr__", "__format__")
+
 
 class IterableIntFlag(IntFlag):
 	"""
@@ -255,6 +1171,8 @@ class IterableIntFlag(IntFlag):
 	This functionality was added to Python 3.10's :mod:`enum` module in :pull:`22221 <python/cpython>`.
 
 	.. versionadded:: 0.5.0
+
+	.. versionchanged:: 0.14.0  The output of :func:`repr` and default :func:`format` is cached for each member.
 	"""
 
 	def __iter__(self) -> Iterator[IntFlag]:
@@ -264,3 +1182,131 @@ class IterableIntFlag(IntFlag):
 
 		members, extra_flags = _decompose(self.__class__, self.value)
 		return (m for m in members if m._value_ != 0)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of bits set in the flag's value.
+
+		.. versionadded:: 0.14.0
+		"""
+
+		return _popcount(_flag_value(self))
+
+	def __contains__(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in ``other`` is also set in this flag.
+
+		``other`` may be a flag of the same class, or an :class:`int`.
+
+		.. versionadded:: 0.14.0
+
+		:param other:
+		"""
+
+		return _flag_contains(self, other)
+
+	def issubset(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in this flag is also set in ``other``.
+
+		.. versionadded:: 0.14.0
+
+		:param other: A flag of the same class, or an :class:`int`.
+		"""
+
+		return _flag_issubset(self, other)
+
+	def issuperset(self, other: Any) -> bool:
+		"""
+		Returns whether every bit set in ``other`` is also set in this flag.
+
+		.. versionadded:: 0.14.0
+
+		:param other: A flag of the same class, or an :class:`int`.
+		"""
+
+		return _flag_issuperset(self, other)
+
+	@classmethod
+	def parse(cls: Type[_IE], text: str, sep: str = '|') -> _IE:
+		"""
+		Returns the flag represented by ``text``, which contains member names separated by ``sep``.
+
+		Integers, in decimal or in hexadecimal with the ``0x`` prefix, may be given for bits without names.
+		The results are cached for recently parsed strings.
+
+		.. versionadded:: 0.14.0
+
+		:param text:
+		:param sep:
+
+		:raises ValueError: If ``text`` contains an unknown name.
+		"""
+
+		return _get_flag_formatter(cls, sep).parse(text)  # type: ignore[arg-type,return-value]
+
+	@classmethod
+	def format(cls, value: Union[Flag, int], sep: str = '|') -> str:
+		"""
+		Returns the names of the members in ``value`` separated by ``sep``; the inverse of :meth:`~.parse`.
+
+		Named members are given by their own name. Other values are given by the names of their single-bit members,
+		in definition order, followed by any remaining bits in hexadecimal.
+		The results are cached for recently formatted values.
+
+		.. versionadded:: 0.14.0
+
+		:param value: A flag of this class, or an :class:`int`.
+		:param sep:
+		"""
+
+		return _flag_format(cls, value, sep)  # type: ignore[arg-type]
+
+	@classmethod
+	def cache_info(cls, sep: str = '|') -> Dict[str, _CacheInfo]:
+		"""
+		Returns the statistics of the caches used by :meth:`~.parse` and :meth:`~.format` with the separator ``sep``.
+
+		.. versionadded:: 0.14.0
+
+		:param sep:
+
+		:returns: A mapping of ``'parse'`` and ``'format'`` to :func:`functools.lru_cache` statistics.
+		"""
+
+		formatter = _get_flag_formatter(cls, sep)  # type: ignore[arg-type]
+		return {"parse": formatter.parse.cache_info(), "format": formatter.format.cache_info()}
+
+	@classmethod
+	def from_int(cls: Type[_IE], value: int) -> _IE:
+		"""
+		Returns the flag with the given value.
+
+		This is equivalent to ``cls(value)``, but faster for the values of named members.
+
+		.. versionadded:: 0.14.0
+
+		:param value:
+		"""
+
+		return _from_int(cls, value)
+
+	@classmethod
+	def from_ints(cls: Type[_IE], values: Iterable[int]) -> List[_IE]:
+		"""
+		Returns the flags with the given values, as a list.
+
+		This is equivalent to ``[cls(value) for value in values]``, but faster.
+		``values`` may be any iterable, including an :class:`array.array`, :class:`memoryview` or NumPy array.
+
+		.. versionadded:: 0.14.0
+
+		:param values:
+		"""
+
+		return _from_ints(cls, values)
+
+
+# Before Python 3.11 Enum.__format__ uses the value's format() unless __str__ is overridden,
+# and afterwards str() of an IntFlag is the same as for an int.
+_install_cached_strings(IterableIntFlag, "__repr__", "__format__")
@@ -28,6 +28,7 @@ import ast
 import inspect
 import re
 import sys
+import threading
 import tokenize
 import warnings
 from enum import Enum, EnumMeta
@@ -49,10 +50,15 @@ __all__ = [
 		"MultipleDocstringsWarning",
 		]
 
+# The lexer keeps no state between calls to get_tokens, so can be shared between threads.
 _lexer = PythonLexer()
 
 INTERACTIVE = bool(getattr(sys, "ps1", sys.flags.interactive))
 
+# Held while parsing source code, and while setting the docstrings of members so enums documented from
+# several threads (for example by modules imported concurrently) never have a mixture of docstrings.
+_docstring_lock = threading.Lock()
+
 EnumType = TypeVar("EnumType", bound=EnumMeta)
 
 
@@ -231,13 +237,17 @@ def document_enum(an_enum: EnumType) -> EnumType:
 	if not INTERACTIVE:
 		return an_enum
 
-	func_source = dedent(inspect.getsource(an_enum))
-	func_source_tree = ast.parse(func_source)
+	with _docstring_lock:
+		# On some Python versions ast.parse, which inspect.getsource also uses for classes,
+		# can fail when called from several threads at once (python/cpython#106905).
+		func_source = dedent(inspect.getsource(an_enum))
+		func_source_tree = ast.parse(func_source)
 
 	assert len(func_source_tree.body) == 1
 	module_body = func_source_tree.body[0]
 	assert isinstance(module_body, ast.ClassDef)
 	class_body = module_body.body
+	docstrings = {}
 
 	for idx, node in enumerate(class_body):
 		targets = []
@@ -279,10 +289,12 @@ def document_enum(an_enum: EnumType) -> EnumType:
 			warnings.warn(MultipleDocstringsWarning(getattr(an_enum, targets[0]), docstring_candidates_nn))
 
 		if docstring_candidates_nn:
-			docstring = docstring_candidates_nn[0]
-
 			for target in targets:
-				getattr(an_enum, target).__doc__ = docstring
+				docstrings[target] = docstring_candidates_nn[0]
+
+	with _docstring_lock:
+		for target, docstring in docstrings.items():
+			getattr(an_enum, target).__doc__ = docstring
 
 	return an_enum
 
@@ -300,7 +312,8 @@ def document_member(enum_member: Enum) -> None:
 	if not INTERACTIVE:
 		return None
 
-	func_source = dedent(inspect.getsource(enum_member.__class__))
+	with _docstring_lock:
+		func_source = dedent(inspect.getsource(enum_member.__class__))
 
 	in_docstring = False
 	base_indent = None
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+#
+#  fingerprint.py
+"""
+Deterministic fingerprints of the structure of enum classes.
+
+A fingerprint changes whenever the members of an enum, their values or their order change,
+so it can be stored alongside caches and persisted data to detect that the enum they were created from has changed.
+Fingerprints are the same in every process and on every supported Python version.
+
+.. code-block:: python
+
+	header = {"enum": get_fingerprint(Status), "data": encode_members(statuses, Status)}
+
+	...
+
+	if header["enum"] != get_fingerprint(Status):
+		raise ValueError("Status has changed")
+
+:func:`~.check_compatibility` reports the members which were added, removed or renumbered between two versions of an enum.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import hashlib
+from datetime import date, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from pathlib import PurePath
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, Type, Union
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+# this package
+from enum_tools.utils import get_base_object, get_members, is_flag
+
+__all__ = ["Compatibility", "check_compatibility", "encode_value", "get_fingerprint"]
+
+# Bumped whenever the encoding below changes, so old fingerprints never match new ones.
+_VERSION = b"enum_tools.fingerprint:1"
+
+_fingerprints: "WeakKeyDictionary[Type[Enum], str]" = WeakKeyDictionary()
+
+# Types whose repr() only depends on the value, and so is the same in every process.
+_repr_types = (Decimal, Fraction, date, time, timedelta, timezone, UUID, PurePath, range)
+
+
+def _encode_bytes(tag: bytes, data: bytes) -> bytes:
+	return b"%s%d:%s" % (tag, len(data), data)
+
+
+def _encode_str(tag: bytes, string: str) -> bytes:
+	return _encode_bytes(tag, string.encode("UTF-8", "surrogatepass"))
+
+
+def _encode_items(tag: bytes, items: List[bytes]) -> bytes:
+	return b"%s%d:%s" % (tag, len(items), b''.join(items))
+
+
+def _get_identity(obj: Any) -> str:
+	return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def encode_value(value: Any) -> bytes:
+	"""
+	Returns the canonical encoding of ``value`` used in fingerprints.
+
+	:py:obj:`None`, booleans, numbers, strings, bytes, enum members, and tuples, lists, sets and dictionaries
+	of these are supported. Sets and dictionaries are encoded independently of their order.
+	:class:`~decimal.Decimal`, :class:`~fractions.Fraction`, :mod:`datetime` objects (naive,
+	or with a :class:`~datetime.timezone`), :class:`~uuid.UUID`, :mod:`pathlib` paths and :class:`range`
+	are encoded from their type and :func:`repr`.
+
+	:param value:
+
+	:raises TypeError: If ``value`` cannot be encoded deterministically.
+	"""
+
+	if value is None:
+		return b'N'
+	elif value is True:
+		return b'T'
+	elif value is False:
+		return b'F'
+	elif isinstance(value, Enum):
+		return _encode_str(b'e', f"{_get_identity(type(value))}.{value._name_}")
+	elif isinstance(value, int):
+		return b"i%d;" % value
+	elif isinstance(value, float):
+		return _encode_str(b'f', value.hex())
+	elif isinstance(value, complex):
+		return _encode_str(b'c', f"{value.real.hex()},{value.imag.hex()}")
+	elif isinstance(value, str):
+		return _encode_str(b's', value)
+	elif isinstance(value, (bytes, bytearray)):
+		return _encode_bytes(b'b', bytes(value))
+	elif isinstance(value, tuple):
+		return _encode_items(b't', [encode_value(item) for item in value])
+	elif isinstance(value, list):
+		return _encode_items(b'l', [encode_value(item) for item in value])
+	elif isinstance(value, (set, frozenset)):
+		return _encode_items(b'S', sorted(encode_value(item) for item in value))
+	elif isinstance(value, dict):
+		return _encode_items(b'd', sorted(encode_value(key) + encode_value(item) for key, item in value.items()))
+	elif isinstance(value, _repr_types) and _has_fixed_timezone(value):
+		return _encode_str(b'r', _get_identity(type(value))) + _encode_str(b'', repr(value))
+	else:
+		raise TypeError(f"cannot fingerprint values of type {type(value).__qualname__}")
+
+
+def _has_fixed_timezone(value: Any) -> bool:
+	# Other tzinfo classes may not define a repr() which only depends on the value.
+	tzinfo = getattr(value, "tzinfo", None)
+	return tzinfo is None or type(tzinfo) is timezone
+
+
+def get_fingerprint(enum: Type[Enum]) -> str:
+	"""
+	Returns a fingerprint of the structure of ``enum``, as a string of 32 hexadecimal digits.
+
+	The fingerprint covers the qualified name of the enum, the type of its members (see :func:`~.get_base_object`),
+	whether it is a :class:`~enum.Flag`, and the names and values of its members and aliases, in definition order.
+	Member values are encoded with :func:`~.encode_value`.
+	The module of the enum, its methods, and the docstrings of its members are not included.
+
+	The result is computed once per class and cached.
+
+	:param enum:
+
+	:raises TypeError: If ``enum`` is not an Enum, or has a member whose value cannot be encoded.
+	"""
+
+	try:
+		return _fingerprints[enum]
+	except KeyError:
+		pass
+	except TypeError:
+		raise TypeError("not an Enum")
+
+	members = get_members(enum)
+	parts = [
+			_VERSION,
+			_encode_str(b'n', enum.__qualname__),
+			_encode_str(b'o', _get_identity(get_base_object(enum))),
+			b'T' if is_flag(enum) else b'F',
+			_encode_items(b'm', [_encode_str(b'', member._name_) + encode_value(member._value_) for member in members]),
+			_encode_items(
+					b'a',
+					[
+							_encode_str(b'', name) + _encode_str(b'', member._name_)
+							for name, member in enum.__members__.items()
+							if member._name_ != name
+							],
+					),
+			]
+
+	fingerprint = hashlib.blake2b(b''.join(parts), digest_size=16).hexdigest()
+	return _fingerprints.setdefault(enum, fingerprint)
+
+
+class Compatibility(NamedTuple):
+	"""
+	The result of :func:`~.check_compatibility`.
+	"""
+
+	#: The names of the members which are only in the new enum, in order.
+	added: Tuple[str, ...]
+
+	#: The names of the members which are only in the old enum, in order.
+	removed: Tuple[str, ...]
+
+	#: A mapping of the names of the members whose ordinals changed to their old and new ordinals.
+	renumbered: Dict[str, Tuple[int, int]]
+
+	@property
+	def compatible(self) -> bool:
+		"""
+		Whether every ordinal of the old enum refers to the member with the same name in the new enum,
+		so that ordinals stored for the old enum can be read with the new one.
+		"""
+
+		return not (self.removed or self.renumbered)
+
+
+def _get_names(enum: Union[Type[Enum], Sequence[str]]) -> Sequence[str]:
+	if isinstance(enum, type):
+		return [member._name_ for member in get_members(enum)]
+	elif isinstance(enum, str):
+		raise TypeError("expected an Enum or a sequence of member names, not a string")
+	else:
+		return enum
+
+
+def check_compatibility(
+		old: Union[Type[Enum], Sequence[str]],
+		new: Union[Type[Enum], Sequence[str]],
+		) -> Compatibility:
+	"""
+	Compare the canonical members of two versions of an enum.
+
+	Members are matched by name.
+
+	:param old: The old enum, or the names of its canonical members in ordinal order,
+		as stored with data encoded from it.
+	:param new: The new enum, or the names of its canonical members in ordinal order.
+
+	:raises TypeError: If ``old`` or ``new`` is not an Enum.
+	"""
+
+	old_names = _get_names(old)
+	new_names = _get_names(new)
+	old_ordinals = {name: ordinal for ordinal, name in enumerate(old_names)}
+	new_ordinals = {name: ordinal for ordinal, name in enumerate(new_names)}
+
+	return Compatibility(
+			added=tuple(name for name in new_names if name not in old_ordinals),
+			removed=tuple(name for name in old_names if name not in new_ordinals),
+			renumbered={
+					name: (ordinal, new_ordinals[name])
+					for name, ordinal in old_ordinals.items()
+					if name in new_ordinals and new_ordinals[name] != ordinal
+					},
+			)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+#
+#  json_hooks.py
+"""
+Hooks for encoding enum members to, and decoding them from, JSON with the :mod:`json` module.
+
+Encoding and decoding use tables which are computed once per enum class,
+rather than inspecting each member as it is encountered.
+
+.. note::
+
+	Members of enums which are subclasses of :class:`str` or :class:`int`,
+	such as :class:`~enum_tools.custom_enums.StrEnum`, :class:`~enum_tools.custom_enums.IntEnum`
+	and :class:`~enum_tools.custom_enums.IterableIntFlag`, are encoded as their values
+	by the :mod:`json` module itself, and never reach the hooks in this module.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import json
+from enum import Enum, Flag
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+# 3rd party
+from typing_extensions import Literal
+
+# this package
+from enum_tools.utils import get_members, is_flag
+
+__all__ = ["EnumDecoder", "EnumEncoder", "EnumJSONEncoder", "make_object_hook"]
+
+# The maximum number of composite flag values, and of distinct lists of flag names, remembered by each decoder.
+_MAX_CACHED = 1024
+
+
+def _power_of_two(value: int) -> bool:
+	return value > 0 and value & (value - 1) == 0
+
+
+def _single_bit_members(enum: Type[Flag]) -> List[Tuple[int, str]]:
+	return [(member._value_, member._name_) for member in get_members(enum) if _power_of_two(member._value_)]
+
+
+class EnumEncoder:
+	"""
+	Encodes enum members into JSON-compatible values.
+
+	Instances are intended to be passed as the ``default`` argument to :func:`json.dumps` and :func:`json.dump`.
+
+	Members of :class:`~enum.Enum` are encoded as their values.
+	Members of :class:`~enum.Flag` are encoded as a list of member names, or as their integer values,
+	depending on ``flags_as``. Composite flags are listed as the names of the single-bit members they contain.
+	Any bits which do not correspond to a member are appended to the list as an integer.
+
+	:param flags_as: How to encode :class:`~enum.Flag` members.
+	:param fallback: A function to encode objects which are not enum members.
+		If not given, :exc:`TypeError` is raised for such objects.
+	"""
+
+	def __init__(
+			self,
+			flags_as: Literal["names", "int"] = "names",
+			fallback: Optional[Callable[[Any], Any]] = None,
+			):
+		if flags_as not in {"names", "int"}:
+			raise ValueError(f"'flags_as' must be 'names' or 'int', not {flags_as!r}")
+
+		self.flags_as = flags_as
+		self.fallback = fallback
+
+		# Keyed by the id of the member; members are kept alive by ``_enums``.
+		self._table: Dict[int, Any] = {}
+		self._enums: Dict[Type[Enum], List[Enum]] = {}
+
+	def __call__(self, obj: Any) -> Any:
+		try:
+			return self._table[id(obj)]
+		except KeyError:
+			return self._encode_slow(obj)
+
+	def _encode_slow(self, obj: Any) -> Any:
+		enum = type(obj)
+
+		if not isinstance(obj, Enum):
+			if self.fallback is None:
+				raise TypeError(f"Object of type {enum.__name__} is not JSON serializable")
+			return self.fallback(obj)
+
+		if enum not in self._enums:
+			self._enums[enum] = []
+			for member in enum.__members__.values():
+				self._add(member, self._encode_member(member))
+
+		if id(obj) not in self._table:
+			# A composite flag, which is cached by the enum itself.
+			self._add(obj, self._encode_member(obj))
+
+		return self._table[id(obj)]
+
+	def _add(self, member: Enum, encoded: Any) -> None:
+		self._enums[type(member)].append(member)
+		self._table[id(member)] = encoded
+
+	def _encode_member(self, member: Enum) -> Any:
+		if not isinstance(member, Flag):
+			return member._value_
+		elif self.flags_as == "int":
+			return member._value_
+		elif member._name_ in member.__class__.__members__:
+			return [member._name_]
+
+		value = member._value_
+		names: List[Any] = []
+		for bit, name in _single_bit_members(member.__class__):
+			if value & bit:
+				names.append(name)
+				value &= ~bit
+
+		if value:
+			names.append(value)
+
+		return names
+
+
+class EnumJSONEncoder(json.JSONEncoder):
+	"""
+	A :class:`json.JSONEncoder` which uses :class:`~.EnumEncoder` to encode enum members.
+
+	It can be passed as the ``cls`` argument to :func:`json.dumps` and :func:`json.dump`.
+
+	:param flags_as: How to encode :class:`~enum.Flag` members. See :class:`~.EnumEncoder`.
+
+	All other arguments are passed to :class:`json.JSONEncoder`.
+	"""
+
+	def __init__(self, *args, flags_as: Literal["names", "int"] = "names", **kwargs):
+		super().__init__(*args, **kwargs)
+		self._encoder = EnumEncoder(flags_as, fallback=super().default)
+
+	def default(self, o: Any) -> Any:  # noqa: D102
+		return self._encoder(o)
+
+
+class EnumDecoder:
+	"""
+	Decodes the JSON representation of members of ``enum``, as produced by :class:`~.EnumEncoder`.
+
+	Members of :class:`~enum.Flag` can be given as either a list of names and integers, or as an integer.
+
+	:param enum:
+	"""
+
+	def __init__(self, enum: Type[Enum]):
+		self.enum = enum
+		self._flag = is_flag(enum)
+		self._table: Dict[Any, Enum] = {}
+		self._names: Dict[str, int] = {}
+		self._lists: Dict[Tuple, Enum] = {}
+
+		for name, member in enum.__members__.items():
+			try:
+				self._table.setdefault(member._value_, member)
+			except TypeError:
+				pass  # unhashable values are looked up by the enum itself
+
+			if self._flag:
+				self._names[name] = member._value_
+
+		# Composite flags are added to the table as they are decoded, and it is reset to this when it grows too large.
+		self._members = dict(self._table)
+
+	def __call__(self, value: Any) -> Enum:
+		try:
+			return self._table[value]
+		except KeyError:
+			return self._decode_slow(value)
+		except TypeError:
+			pass
+
+		try:
+			return self._lists[tuple(value)]
+		except (KeyError, TypeError):
+			return self._decode_slow(value)
+
+	def _decode_slow(self, value: Any) -> Enum:
+		if isinstance(value, list):
+			if not self._flag:
+				# JSON doesn't distinguish lists and tuples
+				return self.enum(_to_tuple(value))
+
+			bits = 0
+			for item in value:
+				if isinstance(item, str):
+					try:
+						bits |= self._names[item]
+					except KeyError:
+						raise ValueError(f"{item!r} is not a valid {self.enum.__qualname__} member name") from None
+				else:
+					bits |= item
+
+			if len(self._lists) >= _MAX_CACHED:
+				self._lists.clear()
+
+			member = self._lists[tuple(value)] = self.enum(bits)
+			return member
+
+		member = self.enum(value)
+		if self._flag:
+			if len(self._table) - len(self._members) >= _MAX_CACHED:
+				self._table = self._members.copy()
+			self._table[value] = member
+		return member
+
+
+def _to_tuple(value: Any) -> Any:
+	if isinstance(value, list):
+		return tuple(map(_to_tuple, value))
+	return value
+
+
+def make_object_hook(
+		fields: Mapping[str, Type[Enum]],
+		object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+		) -> Callable[[Dict[str, Any]], Any]:
+	"""
+	Returns a function for the ``object_hook`` argument of :func:`json.loads` and :func:`json.load`
+	which decodes the values of the given fields into enum members.
+
+	:param fields: Mapping of field names to the enum their values are members of.
+	:param object_hook: A function to call with each object after its fields have been decoded.
+	"""
+
+	decoders = {field: EnumDecoder(enum) for field, enum in fields.items()}
+
+	def hook(obj: Dict[str, Any]) -> Any:
+		for field, decoder in decoders.items():
+			if field in obj:
+				obj[field] = decoder(obj[field])
+
+		if object_hook is None:
+			return obj
+		return object_hook(obj)
+
+	return hook
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+#
+#  lazy.py
+"""
+Enum-like classes whose members are created the first time they are accessed.
+
+Creating a :class:`~enum.Enum` creates every member when the class is defined,
+which dominates the import time of modules defining enums with tens of thousands of members.
+A :class:`~.LazyEnum` instead keeps the names and values of its members in a table,
+and creates each member the first time it is looked up by name or value, or iterated over.
+
+.. code-block:: python
+
+	class ErrorCode(LazyEnum):
+		_table_ = (
+			("NOT_FOUND", 404),
+			("TEAPOT", 418),
+			...
+			)
+
+	ErrorCode.TEAPOT  # <ErrorCode.TEAPOT: 418>
+	ErrorCode(404)  # <ErrorCode.NOT_FOUND: 404>
+	ErrorCode["TEAPOT"] is ErrorCode.TEAPOT  # True
+
+Members are created at most once, so they can be compared with ``is``,
+and they pickle by reference to their class and name, like :class:`~enum.Enum` members.
+
+:class:`~.LazyEnum`\\s are not subclasses of :class:`~enum.Enum`,
+and their members are not instances of it, but they support the most common parts of its API.
+Values must be unique and hashable; aliases are not supported.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+from functools import partial
+from operator import itemgetter
+from types import DynamicClassAttribute, MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar, Union
+
+__all__ = ["LazyEnum", "LazyEnumMeta"]
+
+_L = TypeVar("_L", bound="LazyEnum")
+
+
+class LazyEnumMeta(type):
+	"""
+	Metaclass for :class:`~.LazyEnum`.
+	"""
+
+	_names_: Tuple[str, ...]
+	_values_: Tuple[Any, ...]
+	_name_index_: Dict[str, int]
+	_value_index_: Optional[Dict[Any, int]]
+	_member_cache_: Dict[str, Any]
+
+	def __new__(mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs):  # noqa: D102
+		for base in bases:
+			if isinstance(base, LazyEnumMeta) and base._names_:
+				raise TypeError(f"{name}: cannot extend {base!r}")
+
+		table: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]] = namespace.pop("_table_", ())
+		if isinstance(table, Mapping):
+			table = table.items()
+
+		table = tuple(table)
+		names: Tuple[str, ...] = tuple(map(itemgetter(0), table))
+		values: Tuple[Any, ...] = tuple(map(itemgetter(1), table))
+		name_index = dict(zip(names, range(len(names))))
+
+		if len(name_index) != len(names):
+			raise TypeError(f"{name}: duplicate member names")
+		for member_name in names:
+			if member_name.startswith('_') or member_name in namespace:
+				raise ValueError(f"{name}: invalid member name {member_name!r}")
+		if len(set(values)) != len(values):
+			raise ValueError(f"{name}: duplicate values are not supported")
+
+		cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+		type.__setattr__(cls, "_names_", names)
+		type.__setattr__(cls, "_values_", values)
+		type.__setattr__(cls, "_name_index_", name_index)
+		type.__setattr__(cls, "_value_index_", None)
+		type.__setattr__(cls, "_member_cache_", {})
+		return cls
+
+	def _create_member_(cls: Type[_L], ordinal: int) -> _L:  # type: ignore[misc]
+		member_name = cls._names_[ordinal]
+		member = object.__new__(cls)
+		member._name_ = member_name
+		member._value_ = cls._values_[ordinal]
+
+		# setdefault is atomic, so concurrent lookups all get the same member.
+		member = cls._member_cache_.setdefault(member_name, member)
+
+		# Later lookups by attribute find the member directly,
+		# unless that would hide an attribute of the class, such as ``name`` or ``value``.
+		if not any(member_name in klass.__dict__ for klass in cls.__mro__):
+			type.__setattr__(cls, member_name, member)
+
+		return member
+
+	def _get_value_index_(cls) -> Dict[Any, int]:
+		value_index = cls._value_index_
+		if value_index is None:
+			value_index = {value: ordinal for ordinal, value in enumerate(cls._values_)}
+			type.__setattr__(cls, "_value_index_", value_index)
+		return value_index
+
+	def __getattr__(cls, name: str) -> Any:
+		if name.startswith('_'):
+			raise AttributeError(name)
+
+		try:
+			return cls[name]
+		except KeyError:
+			raise AttributeError(name) from None
+
+	def __getitem__(cls: Type[_L], name: str) -> _L:  # type: ignore[misc]
+		try:
+			return cls._member_cache_[name]
+		except KeyError:
+			return cls._create_member_(cls._name_index_[name])
+
+	def __call__(cls: Type[_L], value: Any, table: Any = None, **kwargs) -> _L:  # type: ignore[misc]
+		"""
+		Returns the member with the given value.
+
+		If ``table`` is given, instead creates a new :class:`~.LazyEnum`,
+		with ``value`` as its name.
+
+		:param value:
+		:param table:
+		:param kwargs: Keyword arguments for creating a new :class:`~.LazyEnum`: ``module`` and ``qualname``.
+		"""
+
+		if table is not None:
+			return cls._create_(value, table, **kwargs)
+
+		if isinstance(value, cls):
+			return value
+
+		try:
+			ordinal = cls._get_value_index_()[value]
+		except (KeyError, TypeError):
+			member = cls._missing_(value)
+			if member is None:
+				raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
+			return member
+
+		return cls[cls._names_[ordinal]]
+
+	def _create_(cls, name: str, table: Any, *, module: Optional[str] = None, qualname: Optional[str] = None):
+		if module is None:
+			try:
+				module = sys._getframe(2).f_globals["__name__"]
+			except (AttributeError, ValueError, KeyError):  # pragma: no cover
+				pass
+
+		namespace: Dict[str, Any] = {"_table_": table}
+		if module is not None:
+			namespace["__module__"] = module
+		if qualname is not None:
+			namespace["__qualname__"] = qualname
+
+		return type(cls)(name, (cls, ), namespace)
+
+	def __setattr__(cls, name: str, value: Any) -> None:
+		if name in cls.__dict__.get("_name_index_", ()):
+			raise AttributeError(f"cannot reassign member {name!r}")
+		super().__setattr__(name, value)
+
+	def __delattr__(cls, name: str) -> None:
+		if name in cls.__dict__.get("_name_index_", ()):
+			raise AttributeError(f"cannot delete member {name!r}")
+		super().__delattr__(name)
+
+	def __iter__(cls: Type[_L]) -> Iterator[_L]:  # type: ignore[misc]
+		"""
+		Returns members in definition order, creating any which have not been accessed yet.
+		"""
+
+		return map(partial(type(cls).__getitem__, cls), cls._names_)
+
+	def __reversed__(cls: Type[_L]) -> Iterator[_L]:  # type: ignore[misc]
+		return map(partial(type(cls).__getitem__, cls), reversed(cls._names_))
+
+	def __len__(cls) -> int:
+		return len(cls._names_)
+
+	def __bool__(cls) -> bool:
+		# Classes are always truthy, even if they have no members.
+		return True
+
+	def __contains__(cls, member: object) -> bool:
+		return isinstance(member, cls)
+
+	@property
+	def __members__(cls: Type[_L]) -> Mapping[str, _L]:  # type: ignore[misc]
+		"""
+		Returns a mapping of member names to members, creating any which have not been accessed yet.
+		"""
+
+		return MappingProxyType(dict(zip(cls._names_, cls)))
+
+	def __dir__(cls) -> List[str]:
+		return sorted({*super().__dir__(), *cls._names_})
+
+	def __repr__(cls) -> str:
+		return f"<lazy enum {cls.__name__!r}>"
+
+
+class LazyEnum(metaclass=LazyEnumMeta):
+	"""
+	Base class for enum-like classes whose members are created the first time they are accessed.
+
+	Members are defined by a ``_table_`` class attribute,
+	which is a sequence of ``(name, value)`` pairs or a mapping of names to values.
+	"""
+
+	__slots__ = ("_name_", "_value_", "__weakref__")
+
+	_name_: str
+	_value_: Any
+
+	@DynamicClassAttribute
+	def name(self) -> str:
+		"""
+		The name of the member.
+		"""
+
+		return self._name_
+
+	@DynamicClassAttribute
+	def value(self) -> Any:
+		"""
+		The value of the member.
+		"""
+
+		return self._value_
+
+	@classmethod
+	def _missing_(cls, value: Any) -> Optional["LazyEnum"]:
+		"""
+		Called when no member has the given value. Subclasses may override this to return a member.
+
+		:param value:
+		"""
+
+		return None
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__}.{self._name_}: {self._value_!r}>"
+
+	def __str__(self) -> str:
+		return f"{self.__class__.__name__}.{self._name_}"
+
+	def __format__(self, format_spec: str) -> str:
+		return format(str(self), format_spec)
+
+	def __reduce_ex__(self, protocol: int) -> Tuple:
+		return getattr, (self.__class__, self._name_)
+
+	def __copy__(self: _L) -> _L:
+		return self
+
+	def __deepcopy__(self: _L, memo: Any) -> _L:
+		return self
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+#
+#  pickling.py
+"""
+Compact pickling of enum members by (class key, ordinal).
+
+By default a member pickles as a reference to its class and its value,
+and members of enums created with the functional API cannot be pickled by reference at all.
+Enums registered with :func:`~.register` instead pickle their members as
+a registry key and the member's ordinal (see :func:`enum_tools.utils.get_members`).
+
+Enums defined at module level are resolved by importing their module.
+Enums created dynamically must be registered in every process which unpickles their members.
+This can be done by passing the output of :func:`~.export_registry` to :func:`~.install_registry`,
+for example with the ``initializer`` of a :class:`concurrent.futures.ProcessPoolExecutor`:
+
+.. code-block:: python
+
+	with ProcessPoolExecutor(initializer=install_registry, initargs=(export_registry(), )) as executor:
+		...
+
+Most of the size of a small pickle is the reference to the function which loads the member.
+:func:`~.set_extension_code` replaces that with a :mod:`copyreg` extension code,
+which is pickled in two bytes (see :pep:`307`).
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import copyreg
+import importlib
+import sys
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar, Union, overload
+
+# this package
+from enum_tools.utils import get_members, is_enum
+
+__all__ = ["export_registry", "get_key", "install_registry", "register", "resolve", "set_extension_code"]
+
+_E = TypeVar("_E", bound=Type[Enum])
+
+_registry: Dict[Hashable, Type[Enum]] = {}
+_keys: Dict[Type[Enum], Hashable] = {}
+_members: Dict[Hashable, Tuple[Enum, ...]] = {}
+_extension_code: Optional[int] = None
+
+# Held while changing the registry. Lookups read the dictionaries without it.
+_lock = threading.RLock()
+
+
+def _default_key(enum: Type[Enum]) -> str:
+	return f"{enum.__module__}:{enum.__qualname__}"
+
+
+def _is_importable(enum: Type[Enum]) -> bool:
+	obj: Any = sys.modules.get(enum.__module__)
+	for attr in enum.__qualname__.split('.'):
+		obj = getattr(obj, attr, None)
+	return obj is enum
+
+
+def _load_member(key: Hashable, ordinal: int) -> Enum:
+	try:
+		return _members[key][ordinal]
+	except KeyError:
+		return get_members(resolve(key))[ordinal]
+
+
+def _load_value(key: Hashable, value: Any) -> Enum:
+	return resolve(key)(value)
+
+
+def _make_reducer(enum: Type[Enum], key: Hashable) -> Callable[[Enum, int], Tuple]:
+	arguments = {member._name_: (key, ordinal) for ordinal, member in enumerate(get_members(enum))}
+
+	def __reduce_ex__(self: Enum, protocol: int) -> Tuple:
+		try:
+			return _load_member, arguments[self._name_]
+		except KeyError:
+			# Composite flags don't have an ordinal.
+			return _load_value, (key, self._value_)
+
+	return __reduce_ex__
+
+
+@overload
+def register(enum: _E, *, key: Optional[Hashable] = ...) -> _E: ...
+
+
+@overload
+def register(enum: None = ..., *, key: Optional[Hashable] = ...) -> Callable[[_E], _E]: ...
+
+
+def register(
+		enum: Optional[_E] = None,
+		*,
+		key: Optional[Hashable] = None,
+		) -> Union[_E, Callable[[_E], _E]]:
+	"""
+	Register ``enum`` so its members are pickled by key and ordinal.
+
+	Can be used as a function or as a class decorator, with or without arguments.
+
+	:param enum:
+	:param key: The key to register the enum under. This must be the same in every process.
+		Short strings or small integers give the smallest pickles.
+		Defaults to the enum's module and qualified name, separated by a colon.
+
+	:raises ValueError: If ``key`` is already used by a different enum,
+		or the enum is already registered under a different key.
+	"""
+
+	if enum is None:
+		return lambda enum: register(enum, key=key)
+
+	if not is_enum(enum):
+		raise TypeError(f"'enum' must be an 'Enum', not {type(enum)}!")
+
+	if key is None:
+		key = _default_key(enum)
+
+	with _lock:
+		if _registry.get(key, enum) is not enum:
+			raise ValueError(f"The key {key!r} is already registered for {_registry[key]!r}")
+		if _keys.get(enum, key) != key:
+			raise ValueError(f"{enum!r} is already registered with the key {_keys[enum]!r}")
+
+		_members[key] = get_members(enum)
+		type.__setattr__(enum, "__reduce_ex__", _make_reducer(enum, key))
+		_keys[enum] = key
+		_registry[key] = enum
+
+	return enum
+
+
+def get_key(enum: Type[Enum]) -> Hashable:
+	"""
+	Returns the key ``enum`` is registered under.
+
+	:param enum:
+
+	:raises KeyError: If the enum is not registered.
+	"""
+
+	return _keys[enum]
+
+
+def resolve(key: Hashable) -> Type[Enum]:
+	"""
+	Returns the enum registered under ``key``.
+
+	Enums registered under their default key are imported if necessary.
+
+	:param key:
+
+	:raises KeyError: If no enum is registered under ``key``.
+	"""
+
+	try:
+		return _registry[key]
+	except KeyError:
+		pass
+
+	if isinstance(key, str) and ':' in key:
+		module_name, qualname = key.split(':', 1)
+		obj: Any = importlib.import_module(module_name)
+
+		for attr in qualname.split('.'):
+			obj = getattr(obj, attr, None)
+
+		if is_enum(obj):
+			return register(obj)
+
+	raise KeyError(key)
+
+
+def set_extension_code(code: int) -> None:
+	"""
+	Register the functions which load pickled members as :mod:`copyreg` extensions,
+	using the codes ``code`` and ``code + 1``.
+
+	This must be done with the same code in every process, before unpickling any members.
+	Codes between 192 and 239 are reserved for use by third parties (see :pep:`307`)
+	and are pickled most compactly.
+
+	:param code:
+
+	:raises ValueError: If the extension codes are already registered for other functions.
+	"""
+
+	global _extension_code
+
+	with _lock:
+		if _extension_code == code:
+			return
+		elif _extension_code is not None:
+			raise ValueError(f"The extension code has already been set to {_extension_code}")
+
+		copyreg.add_extension(__name__, "_load_member", code)
+
+		try:
+			copyreg.add_extension(__name__, "_load_value", code + 1)
+		except ValueError:
+			copyreg.remove_extension(__name__, "_load_member", code)
+			raise
+
+		_extension_code = code
+
+
+def export_registry() -> Dict[str, Any]:
+	"""
+	Export the extension code and the definitions of registered enums which cannot be imported,
+	such as those created with the functional API.
+
+	The result can be pickled and passed to :func:`~.install_registry` in another process.
+	"""
+
+	enums = []
+
+	with _lock:
+		registry = _registry.copy()
+		extension_code = _extension_code
+
+	for key, enum in registry.items():
+		if _is_importable(enum):
+			continue
+
+		*mixins, base = enum.__bases__
+		members = [(name, member._value_) for name, member in enum.__members__.items()]
+		enums.append((key, base, mixins, enum.__name__, enum.__qualname__, enum.__module__, members))
+
+	return {"extension_code": extension_code, "enums": enums}
+
+
+def install_registry(state: Dict[str, Any]) -> None:
+	"""
+	Set the extension code and recreate and register the enums exported by :func:`~.export_registry`.
+
+	Enums which are already registered under the same key are left unchanged.
+
+	:param state:
+	"""
+
+	if state["extension_code"] is not None:
+		set_extension_code(state["extension_code"])
+
+	for key, base, mixins, name, qualname, module, members in state["enums"]:
+		with _lock:
+			# Held until the enum is registered, so concurrent installs don't create it twice.
+			if key in _registry:
+				continue
+
+			enum = base(name, members, module=module, qualname=qualname, type=mixins[0] if mixins else None)
+			register(enum, key=key)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+#
+#  shared.py
+"""
+Arrays of enum members in shared memory, for use by several processes without copying.
+
+A :class:`~.SharedEnumArray` copies the ordinals of an :class:`~enum_tools.arrays.EnumArray` into a
+:class:`multiprocessing.shared_memory.SharedMemory` block once,
+after which other processes attach to the block by name and read the ordinals in place.
+The block has the same layout as a file written by :class:`enum_tools.columnfile.ColumnWriter`,
+so processes check that they agree on the definition of the enum when they attach.
+
+.. code-block:: python
+
+	def count(shared: SharedEnumArray) -> EnumCounter:
+		with shared:
+			return shared.array[1000:2000].value_counts()
+
+	with SharedEnumArray.create(array) as shared, multiprocessing.Pool() as pool:
+		counts = pool.map(count, [shared] * 8)
+
+Pickling a :class:`~.SharedEnumArray` only pickles the name of the block and the enum,
+and unpickling it attaches to the block.
+The block is unlinked when the process which created it closes its :class:`~.SharedEnumArray`.
+
+Before Python 3.13, processes which attach to a block register it with their :mod:`multiprocessing` resource tracker.
+Create the block before starting the pool, as in the example above,
+so the workers share the creating process's resource tracker;
+otherwise the workers' trackers warn about and try to unlink the block when they exit.
+
+Requires Python 3.8 or later, and NumPy.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import sys
+from enum import Enum
+from multiprocessing.shared_memory import SharedMemory
+from typing import Generic, Optional, Tuple, Type, TypeVar
+
+# 3rd party
+import numpy  # nodep
+
+# this package
+from enum_tools.arrays import EnumArray
+from enum_tools.columnfile import _check_header, _header_bytes, read_column_header
+
+__all__ = ["SharedEnumArray"]
+
+_E = TypeVar("_E", bound=Enum)
+
+
+class SharedEnumArray(Generic[_E]):
+	"""
+	An array of members of ``enum`` stored in shared memory.
+
+	Use :meth:`~.create` to place an array in shared memory, and :meth:`~.attach` to use it from another process.
+
+	:param shm: The shared memory block.
+	:param enum:
+	:param owner: Whether this process created the block, and so unlinks it when closed.
+
+	:raises ValueError: If the block does not contain an array of members of ``enum``,
+		or was created with a different definition of it.
+	"""
+
+	__slots__ = ("_shm", "_enum", "_owner", "_array", "_dtype", "_offset", "_length")
+
+	_array: Optional[EnumArray[_E]]
+
+	def __init__(self, shm: SharedMemory, enum: Type[_E], owner: bool = False):
+		header = read_column_header(shm.buf)
+		_check_header(header, enum)
+
+		if header.offset + header.length * header.width > shm.size:
+			raise ValueError("truncated data")
+
+		self._shm = shm
+		self._enum = enum
+		self._owner = owner
+		self._array = None
+		self._dtype = numpy.dtype(f"<u{header.width}")
+		self._offset = header.offset
+		self._length = header.length
+
+	@classmethod
+	def create(cls, array: EnumArray[_E], name: Optional[str] = None) -> "SharedEnumArray[_E]":
+		"""
+		Copy the ordinals of ``array`` into a new shared memory block.
+
+		:param array:
+		:param name: The name of the block. By default a unique name is generated.
+		"""
+
+		enum = array.enum
+		header = _header_bytes(enum, len(array))
+		codes = array.codes
+
+		shm = SharedMemory(name=name, create=True, size=len(header) + codes.nbytes)
+
+		try:
+			shm.buf[:len(header)] = header
+			dtype = codes.dtype.newbyteorder('<')
+			target = numpy.frombuffer(shm.buf, dtype=dtype, count=len(codes), offset=len(header))
+			target[:] = codes
+			del target
+			return cls(shm, enum, owner=True)
+		except BaseException:
+			shm.close()
+			shm.unlink()
+			raise
+
+	@classmethod
+	def attach(cls, name: str, enum: Type[_E]) -> "SharedEnumArray[_E]":
+		"""
+		Attach to an existing shared memory block created by :meth:`~.create`.
+
+		:param name: The name of the block.
+		:param enum:
+
+		:raises ValueError: If the block does not contain an array of members of ``enum``,
+			or was created with a different definition of it.
+		"""
+
+		if sys.version_info >= (3, 13):  # pragma: no cover (<py313)
+			# Only the creating process should unlink the block.
+			shm = SharedMemory(name=name, track=False)
+		else:  # pragma: no cover (py313+)
+			shm = SharedMemory(name=name)
+
+		try:
+			return cls(shm, enum)
+		except BaseException:
+			shm.close()
+			raise
+
+	@property
+	def name(self) -> str:
+		"""
+		The name of the shared memory block.
+		"""
+
+		return self._shm.name
+
+	@property
+	def enum(self) -> Type[_E]:
+		"""
+		The enum whose members are in the array.
+		"""
+
+		return self._enum
+
+	@property
+	def owner(self) -> bool:
+		"""
+		Whether this process created the shared memory block, and so unlinks it when closed.
+		"""
+
+		return self._owner
+
+	@property
+	def array(self) -> EnumArray[_E]:
+		"""
+		An :class:`~enum_tools.arrays.EnumArray` whose ordinals are stored in the shared memory block, without copying.
+
+		The array, and any views of it, must be deleted before the :class:`~.SharedEnumArray` is closed.
+		"""
+
+		if self._array is None:
+			if self._shm.buf is None:
+				raise ValueError("the shared memory block has been closed")
+
+			codes = numpy.frombuffer(self._shm.buf, dtype=self._dtype, count=self._length, offset=self._offset)
+			codes.flags.writeable = False
+			self._array = EnumArray._from_valid_codes(self._enum, codes)
+
+		return self._array
+
+	def __len__(self) -> int:
+		return self._length
+
+	def close(self) -> None:
+		"""
+		Close this process's view of the shared memory block, and unlink it if this process created it.
+
+		:raises BufferError: If arrays returned by :attr:`~.array` still exist.
+			The block is still unlinked.
+		"""
+
+		self._array = None
+
+		try:
+			if self._shm.buf is not None:
+				self._shm.close()
+		finally:
+			if self._owner:
+				self._owner = False
+				self._shm.unlink()
+
+	def __enter__(self) -> "SharedEnumArray[_E]":
+		return self
+
+	def __exit__(self, *args) -> None:
+		self.close()
+
+	def __reduce__(self) -> Tuple:
+		return self.attach, (self.name, self._enum)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self.name!r} of {self._length} {self._enum.__qualname__} members>"
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+#
+#  snapshot.py
+"""
+Cache files which rebuild dynamically created enums quickly at startup.
+
+Creating an enum with :class:`~enum.EnumMeta` does a lot of work for each member,
+and on Python 3.9 and 3.10 takes time quadratic in the number of members.
+For enums created at runtime from configuration files or database tables, that work is repeated in every process.
+
+:func:`~.cached_enum` creates an enum with the functional API, and saves its members in a snapshot file.
+Later calls with the same arguments rebuild the enum from the snapshot,
+creating the class without members and then adding them all at once.
+
+.. code-block:: python
+
+	Product = cached_enum("products.enum-snapshot", "Product", load_products(), type=IntEnum)
+
+Snapshots are validated by a fingerprint of the arguments (see :func:`~.get_spec_fingerprint`),
+and rebuilt when it changes.
+Member values are stored with :mod:`pickle`, so snapshots must only be read from trusted locations.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from enum import Enum, Flag
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple, Type, TypeVar, Union
+
+# this package
+from enum_tools.fingerprint import encode_value
+
+__all__ = ["MAGIC", "cached_enum", "get_spec_fingerprint", "read_snapshot"]
+
+_E = TypeVar("_E", bound=Enum)
+
+#: The magic bytes at the start of every snapshot file.
+MAGIC = b"ETES"
+
+_VERSION = 1
+
+_PathLike = Union[str, "os.PathLike[str]"]
+_Members = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+
+class _Snapshot(NamedTuple):
+	# The arguments of cached_enum which identify the enum, and the fingerprint of the rest.
+	key: str
+	type: Type[Enum]
+	name: str
+	module: Optional[str]
+	qualname: Optional[str]
+
+	# Every name passed to cached_enum, including aliases, and the value each was given.
+	names: Tuple[str, ...]
+	values: Tuple[Any, ...]
+	docs: Dict[str, str]
+
+
+def _normalise_members(members: _Members) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+	if isinstance(members, Mapping):
+		members = members.items()
+
+	pairs = list(members)
+	if not pairs:
+		return (), ()
+
+	names, values = zip(*pairs)
+	return names, values
+
+
+def get_spec_fingerprint(
+		name: str,
+		members: _Members,
+		*,
+		type: Type[Enum] = Enum,  # noqa: A002  # pylint: disable=redefined-builtin
+		module: Optional[str] = None,
+		qualname: Optional[str] = None,
+		docs: Optional[Mapping[str, str]] = None,
+		) -> str:
+	"""
+	Returns a fingerprint of the arguments of :func:`~.cached_enum`, as a string of 32 hexadecimal digits.
+
+	Values are encoded with :func:`enum_tools.fingerprint.encode_value`.
+
+	:param name:
+	:param members:
+	:param type:
+	:param module:
+	:param qualname:
+	:param docs:
+
+	:raises TypeError: If a value cannot be encoded.
+	"""
+
+	names, values = _normalise_members(members)
+	return _get_spec_fingerprint(type, name, module, qualname, names, values, docs or {})
+
+
+def _get_spec_fingerprint(
+		type: Type[Enum],  # noqa: A002  # pylint: disable=redefined-builtin
+		name: str,
+		module: Optional[str],
+		qualname: Optional[str],
+		names: Tuple[str, ...],
+		values: Tuple[Any, ...],
+		docs: Mapping[str, str],
+		) -> str:
+	spec = (_VERSION, f"{type.__module__}.{type.__qualname__}", name, module, qualname, names, values, dict(docs))
+	return hashlib.blake2b(encode_value(spec), digest_size=16).hexdigest()
+
+
+def _write_snapshot(filename: _PathLike, snapshot: _Snapshot) -> None:
+	data = MAGIC + bytes([_VERSION]) + pickle.dumps(tuple(snapshot), protocol=4)
+
+	# Written to a temporary file first, so processes starting at the same time never read a partial snapshot.
+	directory = os.path.dirname(os.path.abspath(filename))
+	fd, temporary = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+
+	try:
+		with os.fdopen(fd, "wb") as fp:
+			fp.write(data)
+		os.replace(temporary, filename)
+	except BaseException:
+		os.unlink(temporary)
+		raise
+
+
+def _load_snapshot(filename: _PathLike) -> _Snapshot:
+	with open(filename, "rb") as fp:
+		data = fp.read()
+
+	if data[:len(MAGIC)] != MAGIC:
+		raise ValueError("not an enum snapshot")
+	if data[len(MAGIC):len(MAGIC) + 1] != bytes([_VERSION]):
+		raise ValueError("unsupported snapshot version")
+
+	return _Snapshot(*pickle.loads(data[len(MAGIC) + 1:]))
+
+
+def _new_member_hooks(enum: Type[Enum]) -> Tuple[Any, bool]:
+	"""
+	Returns the function which creates members of ``enum``, and whether it takes the member's value.
+	"""
+
+	if sys.version_info >= (3, 11):  # pragma: no cover (<py311)
+		return enum._new_member_, enum._use_args_  # type: ignore[attr-defined]
+	else:  # pragma: no cover (py311+)
+		metaclass = type(enum)
+		_, first_enum = metaclass._get_mixins_(enum.__name__, enum.__bases__)  # type: ignore[attr-defined]
+		member_type = enum._member_type_  # type: ignore[attr-defined]
+		new_member, _, use_args = metaclass._find_new_({}, member_type, first_enum)  # type: ignore[attr-defined]
+		return new_member, use_args
+
+
+def _add_members(enum: Type[Enum], names: Tuple[str, ...], values: Tuple[Any, ...]) -> bool:
+	"""
+	Add members to the memberless enum ``enum``, in the same way as :class:`~enum.EnumMeta`.
+
+	The checks made by :class:`~enum.EnumMeta` for each member are skipped,
+	as the names and values have already been used to create the enum.
+
+	:returns: :py:obj:`False` if the members need the extra handling done by :class:`~enum.EnumMeta`,
+		in which case ``enum`` must be discarded.
+	"""
+
+	if issubclass(enum, Flag):
+		# Flags track the bits of their members and treat multi-bit members specially.
+		return False
+
+	# Names which would shadow attributes of the enum are stored as descriptors, rather than in the class dict.
+	reserved = set().union(*(vars(base) for base in enum.__mro__))
+	if any(name.startswith('_') or name in reserved for name in names):
+		return False
+
+	new_member, use_args = _new_member_hooks(enum)
+	member_type = enum._member_type_  # type: ignore[attr-defined]
+	member_names = enum._member_names_
+	member_map = enum._member_map_
+	value2member_map = enum._value2member_map_
+	set_sort_order = sys.version_info >= (3, 11)
+
+	for name, value in zip(names, values):
+		args = value if isinstance(value, tuple) else (value, )
+		if member_type is tuple:
+			args = (args, )
+
+		member = new_member(enum, *args) if use_args else new_member(enum)
+		if not hasattr(member, "_value_"):
+			member._value_ = value if member_type is object else member_type(*args)
+
+		value = member._value_
+		member._name_ = name
+		member.__objclass__ = enum
+		member.__init__(*args)
+
+		try:
+			canonical = value2member_map.get(value)
+		except TypeError:
+			# Unhashable values are looked up by a linear search.
+			return False
+
+		if canonical is None:
+			if set_sort_order:  # pragma: no cover (<py311)
+				member._sort_order_ = len(member_names)
+			member_names.append(name)
+			value2member_map[value] = member
+		else:
+			member = canonical
+
+		member_map[name] = member
+
+	# Setting a class attribute clears the type's attribute cache, which would slow down creating the other
+	# members, so the members are only added to the class dict at the end.
+	set_attribute = type.__setattr__
+	for name, member in member_map.items():
+		set_attribute(enum, name, member)
+
+	return True
+
+
+def _rebuild(snapshot: _Snapshot) -> Type[Enum]:
+	enum_type = snapshot.type
+	metaclass = type(enum_type)
+	bases = (enum_type, )
+
+	classdict = metaclass.__prepare__(snapshot.name, bases)
+	if snapshot.module is not None:
+		classdict["__module__"] = snapshot.module
+
+	enum = metaclass.__new__(metaclass, snapshot.name, bases, classdict)  # type: ignore[call-overload]
+
+	if not _add_members(enum, snapshot.names, snapshot.values):
+		enum = _create(snapshot)
+	else:
+		if snapshot.qualname is not None:
+			enum.__qualname__ = snapshot.qualname
+
+	for name, doc in snapshot.docs.items():
+		enum[name].__doc__ = doc
+
+	return enum
+
+
+def _create(snapshot: _Snapshot) -> Type[Enum]:
+	return snapshot.type(  # type: ignore[call-overload]
+			snapshot.name,
+			list(zip(snapshot.names, snapshot.values)),
+			module=snapshot.module,
+			qualname=snapshot.qualname,
+			)
+
+
+def read_snapshot(filename: _PathLike, key: str) -> Type[Enum]:
+	"""
+	Rebuild an enum from the snapshot written by :func:`~.cached_enum`.
+
+	:param filename:
+	:param key: The fingerprint the snapshot must have been written with.
+
+	:raises ValueError: If the file is not a snapshot, or its fingerprint is not ``key``.
+	:raises FileNotFoundError: If the file does not exist.
+	"""
+
+	snapshot = _load_snapshot(filename)
+
+	if snapshot.key != key:
+		raise ValueError("snapshot is out of date")
+
+	return _rebuild(snapshot)
+
+
+def cached_enum(
+		filename: _PathLike,
+		name: str,
+		members: _Members,
+		*,
+		type: Type[_E] = Enum,  # type: ignore[assignment]  # noqa: A002  # pylint: disable=redefined-builtin
+		module: Optional[str] = None,
+		qualname: Optional[str] = None,
+		docs: Optional[Mapping[str, str]] = None,
+		key: Optional[str] = None,
+		) -> Type[_E]:
+	"""
+	Create an enum with the functional API, i.e. ``type(name, members, module=module, qualname=qualname)``,
+	using the snapshot in ``filename`` if it is up to date.
+
+	If the snapshot is missing or out of date, the enum is created normally and a new snapshot is written.
+
+	Flags, enums with unhashable values and enums with members whose names would shadow an attribute of the enum
+	are always created with the functional API, but the snapshot still saves the caller from
+	recomputing ``members``.
+
+	:param filename: The snapshot file.
+	:param name: The name of the enum.
+	:param members: The names and values of the members, as a mapping or an iterable of pairs.
+	:param type: The enum to subclass.
+	:param module: The module the enum is defined in. Defaults to the caller's module.
+	:param qualname: The qualified name of the enum.
+	:param docs: A mapping of member names to their docstrings.
+	:param key: The fingerprint of the other arguments.
+		Defaults to the result of :func:`~.get_spec_fingerprint`.
+		Anything which changes whenever they change, such as a hash of the configuration file they are read from,
+		can be used instead, in which case ``members`` is only iterated over if the snapshot is out of date.
+
+	:raises TypeError: If ``key`` is not given and the value of a member cannot be encoded.
+	"""
+
+	if module is None:
+		module = sys._getframe(1).f_globals.get("__name__")
+
+	if key is None:
+		names, values = _normalise_members(members)
+		key = _get_spec_fingerprint(type, name, module, qualname, names, values, docs or {})
+	else:
+		names = values = None  # type: ignore[assignment]
+
+	try:
+		snapshot = _load_snapshot(filename)
+	except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+		snapshot = None
+
+	if snapshot is not None and snapshot[:5] == (key, type, name, module, qualname):
+		return _rebuild(snapshot)  # type: ignore[return-value]
+
+	if names is None:
+		names, values = _normalise_members(members)
+
+	snapshot = _Snapshot(key, type, name, module, qualname, names, values, dict(docs or {}))
+	enum = _create(snapshot)
+
+	for member_name, doc in snapshot.docs.items():
+		enum[member_name].__doc__ = doc
+
+	_write_snapshot(filename, snapshot)
+	return enum  # type: ignore[return-value]
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+#
+#  streaming.py
+"""
+Decoding of streams of fixed-width binary records whose fields are enum members.
+
+Each field of a record is an unsigned little-endian integer of 1, 2 or 4 bytes,
+which is either the ordinal of a member (see :func:`enum_tools.utils.get_members`) or its value.
+Records are decoded in batches. Each column of a batch is copied out of the records at once,
+rather than unpacking each record, and is converted to members with a single table lookup per field.
+
+.. code-block:: python
+
+	layout = RecordLayout([(Method, 1), (Status, 2)], codes="values")
+
+	async for method, status in iter_records(reader, layout):
+		...
+
+Data is only read from the :class:`asyncio.StreamReader` when the consumer asks for the next batch,
+so a slow consumer causes the reader's buffer to fill and the transport to pause reading.
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+import asyncio
+import struct
+import sys
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Mapping, Sequence, Tuple, Type, Union
+
+# 3rd party
+from typing_extensions import Literal
+
+# this package
+from enum_tools.utils import get_members
+
+__all__ = ["RecordLayout", "iter_batches", "iter_column_batches", "iter_records"]
+
+_formats = {1: 'B', 2: 'H', 4: 'I'}
+
+_BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class RecordLayout:
+	"""
+	The layout of fixed-width records of enum fields.
+
+	:param fields: The enum of each field, and the width of the field in bytes (``1``, ``2`` or ``4``).
+	:param codes: Whether fields contain the ordinals or the values of members.
+		Values must be non-negative integers.
+	"""
+
+	#: The enum and width of each field.
+	fields: Tuple[Tuple[Type[Enum], int], ...]
+
+	#: Whether fields contain the ordinals or the values of members.
+	codes: Literal["ordinals", "values"]
+
+	def __init__(
+			self,
+			fields: Sequence[Tuple[Type[Enum], int]],
+			codes: Literal["ordinals", "values"] = "ordinals",
+			):
+		if codes not in {"ordinals", "values"}:
+			raise ValueError(f"'codes' must be 'ordinals' or 'values', not {codes!r}")
+		if not fields:
+			raise ValueError("a record must have at least one field")
+
+		for enum, width in fields:
+			if width not in _formats:
+				raise ValueError(f"invalid width {width} for {enum.__qualname__}; must be 1, 2 or 4")
+
+		self.fields = tuple(fields)
+		self.codes = codes
+		self._struct = struct.Struct('<' + ''.join(_formats[width] for _, width in fields))
+
+		# The offset of each field within a record.
+		self._offsets: List[int] = []
+		offset = 0
+
+		for _, width in fields:
+			self._offsets.append(offset)
+			offset += width
+
+		# Per-field tables mapping codes to members, looked up with __getitem__.
+		self._tables: List[Union[Sequence[Enum], Mapping[int, Enum]]] = []
+
+		for enum, _ in fields:
+			if codes == "ordinals":
+				self._tables.append(get_members(enum))
+			else:
+				table: Dict[Any, Enum] = {member._value_: member for member in get_members(enum)}
+				self._tables.append(table)
+
+	@property
+	def record_size(self) -> int:
+		"""
+		The size of each record, in bytes.
+		"""
+
+		return self._struct.size
+
+	def decode_columns(self, data: _BytesLike) -> Tuple[List[Enum], ...]:
+		"""
+		Decode whole records from ``data``, returning the members of each field as a separate list.
+
+		:param data: The encoded records. Its length must be a multiple of :attr:`~.record_size`.
+
+		:raises ValueError: If ``data`` contains a partial record, or a code which does not correspond to a member.
+		"""
+
+		if len(data) % self._struct.size:
+			raise ValueError(f"data is not a whole number of {self._struct.size}-byte records")
+
+		if not data:
+			return tuple([] for _ in self.fields)
+
+		view = memoryview(data).cast('B')
+		decoded = []
+
+		for (enum, width), offset, table in zip(self.fields, self._offsets, self._tables):
+			column = _get_column(view, offset, width, self._struct.size)
+
+			try:
+				decoded.append(list(map(table.__getitem__, column)))
+			except (IndexError, KeyError):
+				bad = next(code for code in column if code not in _valid_codes(table))
+				raise ValueError(f"{bad} is not a valid code for {enum.__qualname__}") from None
+
+		return tuple(decoded)
+
+	def decode(self, data: _BytesLike) -> List[Tuple[Enum, ...]]:
+		"""
+		Decode whole records from ``data``, returning a tuple of members for each record.
+
+		:param data: The encoded records. Its length must be a multiple of :attr:`~.record_size`.
+
+		:raises ValueError: If ``data`` contains a partial record, or a code which does not correspond to a member.
+		"""
+
+		return list(zip(*self.decode_columns(data)))
+
+	def encode(self, records: Sequence[Sequence[Enum]]) -> bytes:
+		"""
+		Encode records of members, in the format read by :meth:`~.decode`.
+
+		:param records:
+		"""
+
+		if self.codes == "ordinals":
+			tables = [{id(member): ordinal for ordinal, member in enumerate(table)} for table in self._tables]
+			return b''.join(
+					self._struct.pack(*(table[id(member)] for table, member in zip(tables, record)))
+					for record in records
+					)
+
+		return b''.join(self._struct.pack(*(member._value_ for member in record)) for record in records)
+
+
+def _get_column(view: memoryview, offset: int, width: int, record_size: int) -> Sequence[int]:
+	"""
+	Returns the codes in the field at ``offset`` in each of the records in ``view``.
+	"""
+
+	if width == 1:
+		return bytes(view[offset::record_size])
+
+	column = bytearray(len(view) // record_size * width)
+
+	for byte in range(width):
+		# Codes are little-endian, so their bytes are reversed on big-endian platforms.
+		position = byte if sys.byteorder == "little" else width - 1 - byte
+		column[position::width] = view[offset + byte::record_size]
+
+	return memoryview(column).cast(_formats[width]).tolist()
+
+
+def _valid_codes(table: Union[Sequence[Enum], Mapping[int, Enum]]) -> Any:
+	if isinstance(table, Mapping):
+		return table
+	return range(len(table))
+
+
+async def _iter_chunks(reader: asyncio.StreamReader, layout: RecordLayout, batch_size: int) -> AsyncIterator[bytes]:
+	"""
+	Read chunks of whole records from ``reader``, of at most ``batch_size`` records.
+	"""
+
+	if batch_size < 1:
+		raise ValueError("'batch_size' must be at least 1")
+
+	record_size = layout.record_size
+	chunk_size = batch_size * record_size
+	pending = b''
+
+	while True:
+		data = await reader.read(chunk_size - len(pending))
+
+		if not data:
+			if pending:
+				raise ValueError(f"stream ended with a partial record of {len(pending)} bytes")
+			return
+
+		pending += data
+		whole = len(pending) - len(pending) % record_size
+
+		if whole:
+			chunk, pending = pending[:whole], pending[whole:]
+			yield chunk
+
+
+async def iter_column_batches(
+		reader: asyncio.StreamReader,
+		layout: RecordLayout,
+		batch_size: int = 4096,
+		) -> AsyncIterator[Tuple[List[Enum], ...]]:
+	"""
+	Read records from ``reader`` in batches, yielding a list of members for each field of the batch.
+
+	:param reader:
+	:param layout:
+	:param batch_size: The maximum number of records in each batch.
+
+	:raises ValueError: If the stream ends with a partial record, or contains a code which does not correspond to a member.
+	"""
+
+	async for chunk in _iter_chunks(reader, layout, batch_size):
+		yield layout.decode_columns(chunk)
+
+
+async def iter_batches(
+		reader: asyncio.StreamReader,
+		layout: RecordLayout,
+		batch_size: int = 4096,
+		) -> AsyncIterator[List[Tuple[Enum, ...]]]:
+	"""
+	Read records from ``reader`` in batches, yielding a list of tuples of members for each batch.
+
+	:param reader:
+	:param layout:
+	:param batch_size: The maximum number of records in each batch.
+
+	:raises ValueError: If the stream ends with a partial record, or contains a code which does not correspond to a member.
+	"""
+
+	async for chunk in _iter_chunks(reader, layout, batch_size):
+		yield layout.decode(chunk)
+
+
+async def iter_records(
+		reader: asyncio.StreamReader,
+		layout: RecordLayout,
+		batch_size: int = 4096,
+		) -> AsyncIterator[Tuple[Enum, ...]]:
+	"""
+	Read records from ``reader``, yielding a tuple of members for each record.
+
+	Records are still read and decoded in batches, but each record costs a step of the async iteration.
+	When records can be processed a batch at a time, :func:`~.iter_batches` and :func:`~.iter_column_batches`
+	are faster.
+
+	:param reader:
+	:param layout:
+	:param batch_size: The maximum number of records in each batch.
+
+	:raises ValueError: If the stream ends with a partial record, or contains a code which does not correspond to a member.
+	"""
+
+	async for batch in iter_batches(reader, layout, batch_size):
+		for record in batch:
+			yield record
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+#
+#  translation.py
+"""
+Translation between the members of related enums, such as an internal enum and its counterpart in an external API.
+
+An :class:`~.EnumTranslator` maps the ordinal of each member of the source enum
+(see :func:`enum_tools.utils.get_members`) to the ordinal of a member of the target enum.
+The mapping is built once, by name, by value or from an explicit table,
+and is checked to cover every member of the source enum.
+
+.. code-block:: python
+
+	to_api = EnumTranslator.by_name(Status, ApiStatus)
+	to_api.translate(Status.OK)  # <ApiStatus.OK: 'ok'>
+	to_api.translate_array(statuses)  # EnumArray(ApiStatus, [...])
+
+.. versionadded:: 0.14.0
+"""
+#
+#  Copyright (c) 2026 Dominic Davis-Foster <dominic@davis-foster.co.uk>
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+#
+
+# stdlib
+from enum import Enum
+from typing import (
+		TYPE_CHECKING,
+		Any,
+		Dict,
+		Generic,
+		Iterable,
+		List,
+		Mapping,
+		Optional,
+		Tuple,
+		Type,
+		TypeVar,
+		Union
+		)
+
+# this package
+from enum_tools.containers import _get_id_ordinals
+from enum_tools.utils import get_members
+
+if TYPE_CHECKING:
+	# 3rd party
+	import numpy  # nodep
+
+	# this package
+	from enum_tools.arrays import EnumArray
+
+__all__ = ["EnumTranslator"]
+
+_S = TypeVar("_S", bound=Enum)
+_T = TypeVar("_T", bound=Enum)
+
+_Table = Union[Mapping[_S, Optional[_T]], Iterable[Tuple[_S, Optional[_T]]]]
+
+
+class EnumTranslator(Generic[_S, _T]):
+	"""
+	Translates members of ``source`` into members of ``target``.
+
+	Use :meth:`~.by_name` or :meth:`~.by_value` to match members with the same name or value.
+
+	:param source:
+	:param target:
+	:param table: A mapping, or iterable of pairs, of members of ``source`` to the members of ``target``
+		they translate to, or :py:obj:`None` if they have no translation.
+	:param complete: If :py:obj:`True`, every member of ``source`` must have a translation.
+
+	:raises ValueError: If ``table`` contains objects which are not canonical members of ``source`` and ``target``,
+		or ``complete`` is :py:obj:`True` and some members of ``source`` have no translation.
+	"""
+
+	__slots__ = ("_source", "_target", "_ordinals", "_lookup", "_numpy_table")
+
+	_source: Type[_S]
+	_target: Type[_T]
+	_ordinals: Tuple[int, ...]
+	_lookup: Dict[int, _T]
+	_numpy_table: Optional["numpy.ndarray"]
+
+	def __init__(self, source: Type[_S], target: Type[_T], table: _Table, *, complete: bool = True):
+		source_index = _get_id_ordinals(source)
+		target_index = _get_id_ordinals(target)
+		ordinals = [-1] * len(get_members(source))
+
+		if isinstance(table, Mapping):
+			table = table.items()
+
+		for source_member, target_member in table:
+			try:
+				source_ordinal = source_index[id(source_member)]
+			except KeyError:
+				raise ValueError(f"{source_member!r} is not a canonical member of {source.__qualname__}") from None
+
+			if target_member is None:
+				ordinals[source_ordinal] = -1
+				continue
+
+			try:
+				ordinals[source_ordinal] = target_index[id(target_member)]
+			except KeyError:
+				raise ValueError(f"{target_member!r} is not a canonical member of {target.__qualname__}") from None
+
+		self._source = source
+		self._target = target
+		self._ordinals = tuple(ordinals)
+		self._numpy_table = None
+
+		source_members = get_members(source)
+		target_members = get_members(target)
+		self._lookup = {
+				id(source_members[source_ordinal]): target_members[target_ordinal]  # type: ignore[misc]
+				for source_ordinal, target_ordinal in enumerate(ordinals)
+				if target_ordinal >= 0
+				}
+
+		if complete and self.missing:
+			names = ", ".join(member._name_ for member in self.missing)
+			raise ValueError(f"no translation to {target.__qualname__} for {source.__qualname__} members: {names}")
+
+	@classmethod
+	def by_name(
+			cls,
+			source: Type[_S],
+			target: Type[_T],
+			overrides: Optional[_Table] = None,
+			*,
+			complete: bool = True,
+			) -> "EnumTranslator[_S, _T]":
+		"""
+		Translate each member of ``source`` to the member of ``target`` with the same name.
+
+		The names of aliases in ``target`` are also matched.
+
+		:param source:
+		:param target:
+		:param overrides: Translations which take precedence over matching by name,
+			in the same form as the ``table`` argument of :class:`~.EnumTranslator`.
+		:param complete: If :py:obj:`True`, every member of ``source`` must have a translation.
+
+		:raises ValueError: If ``complete`` is :py:obj:`True` and some members of ``source`` have no translation.
+		"""
+
+		target_members = target.__members__
+		table: Dict[_S, Optional[_T]] = {
+				member: target_members.get(member._name_)  # type: ignore[misc]
+				for member in get_members(source)
+				}
+
+		if overrides is not None:
+			table.update(overrides)
+
+		return cls(source, target, table, complete=complete)
+
+	@classmethod
+	def by_value(
+			cls,
+			source: Type[_S],
+			target: Type[_T],
+			overrides: Optional[_Table] = None,
+			*,
+			complete: bool = True,
+			) -> "EnumTranslator[_S, _T]":
+		"""
+		Translate each member of ``source`` to the member of ``target`` with the same value.
+
+		Values are looked up as with ``target(value)``, so ``target._missing_`` is used if it is defined.
+
+		:param source:
+		:param target:
+		:param overrides: Translations which take precedence over matching by value,
+			in the same form as the ``table`` argument of :class:`~.EnumTranslator`.
+		:param complete: If :py:obj:`True`, every member of ``source`` must have a translation.
+
+		:raises ValueError: If ``complete`` is :py:obj:`True` and some members of ``source`` have no translation.
+		"""
+
+		table: Dict[_S, Optional[_T]] = {}
+
+		for member in get_members(source):
+			try:
+				table[member] = target(member._value_)  # type: ignore[assignment]
+			except ValueError:
+				table[member] = None
+
+		if overrides is not None:
+			table.update(overrides)
+
+		return cls(source, target, table, complete=complete)
+
+	@property
+	def source(self) -> Type[_S]:
+		"""
+		The enum whose members are translated.
+		"""
+
+		return self._source
+
+	@property
+	def target(self) -> Type[_T]:
+		"""
+		The enum whose members they are translated to.
+		"""
+
+		return self._target
+
+	@property
+	def ordinals(self) -> Tuple[int, ...]:
+		"""
+		The ordinal of the translation of each member of :attr:`~.source`, indexed by its ordinal,
+		or ``-1`` where the member has no translation.
+		"""
+
+		return self._ordinals
+
+	@property
+	def missing(self) -> Tuple[_S, ...]:
+		"""
+		The members of :attr:`~.source` which have no translation.
+		"""
+
+		members = get_members(self._source)
+		return tuple(members[ordinal] for ordinal, target in enumerate(self._ordinals) if target < 0)  # type: ignore[misc]
+
+	@property
+	def unused(self) -> Tuple[_T, ...]:
+		"""
+		The members of :attr:`~.target` which no member of :attr:`~.source` translates to.
+		"""
+
+		used = set(self._ordinals)
+		members = get_members(self._target)
+		return tuple(member for ordinal, member in enumerate(members) if ordinal not in used)  # type: ignore[misc]
+
+	def translate(self, member: _S) -> _T:
+		"""
+		Returns the translation of ``member``.
+
+		:param member:
+
+		:raises ValueError: If ``member`` is not a canonical member of :attr:`~.source`, or has no translation.
+		"""
+
+		try:
+			return self._lookup[id(member)]
+		except KeyError:
+			raise self._error(member) from None
+
+	def translate_members(self, members: Iterable[_S]) -> List[_T]:
+		"""
+		Returns the translations of ``members``, as a list.
+
+		:param members:
+
+		:raises ValueError: If ``members`` contains objects which are not canonical members of :attr:`~.source`,
+			or members with no translation.
+		"""
+
+		members = list(members)
+
+		try:
+			return list(map(self._lookup.__getitem__, map(id, members)))
+		except KeyError:
+			for member in members:
+				if id(member) not in self._lookup:
+					raise self._error(member) from None
+			raise  # pragma: no cover
+
+	def translate_ordinals(self, ordinals: Union["numpy.ndarray", Iterable[int]]) -> Union["numpy.ndarray", List[int]]:
+		"""
+		Returns the ordinals of the translations of the members of :attr:`~.source` with the given ordinals.
+
+		:param ordinals: An iterable of ordinals, or a NumPy array.
+
+		:returns: A list, or a NumPy array of the dtype returned by :func:`enum_tools.arrays.get_code_dtype`
+			if ``ordinals`` is a NumPy array.
+
+		:raises ValueError: If an ordinal is out of range for :attr:`~.source`, or its member has no translation.
+		"""
+
+		if hasattr(ordinals, "dtype"):
+			return self._translate_codes(ordinals)  # type: ignore[arg-type]
+
+		ordinals = list(ordinals)
+
+		if ordinals and min(ordinals) < 0:
+			raise ValueError(f"ordinal out of range for {self._source.__qualname__}")
+
+		try:
+			translated = list(map(self._ordinals.__getitem__, ordinals))
+		except IndexError:
+			raise ValueError(f"ordinal {max(ordinals)} out of range for {self._source.__qualname__}") from None
+
+		if -1 in translated:
+			raise self._error(get_members(self._source)[ordinals[translated.index(-1)]])
+
+		return translated
+
+	def translate_array(self, array: "EnumArray[_S]") -> "EnumArray[_T]":
+		"""
+		Returns an :class:`~enum_tools.arrays.EnumArray` of the translations of the members in ``array``.
+
+		:param array: An array of members of :attr:`~.source`.
+
+		:raises ValueError: If ``array`` is not an array of members of :attr:`~.source`,
+			or contains members with no translation.
+		"""
+
+		# this package
+		from enum_tools.arrays import EnumArray
+
+		if array.enum is not self._source:
+			raise ValueError(f"expected an array of {self._source.__qualname__} members, not {array.enum.__qualname__}")
+
+		return EnumArray._from_valid_codes(self._target, self._translate_codes(array.codes))
+
+	def _translate_codes(self, codes: "numpy.ndarray") -> "numpy.ndarray":
+		# 3rd party
+		import numpy  # nodep
+
+		# this package
+		from enum_tools.arrays import get_code_dtype
+
+		if self._numpy_table is None:
+			self._numpy_table = numpy.array(self._ordinals, dtype=numpy.int64)
+
+		codes = numpy.asarray(codes)
+
+		if codes.size:
+			if codes.dtype.kind not in "iu":
+				raise TypeError(f"ordinals must be integers, not {codes.dtype}")
+			if codes.min() < 0 or codes.max() >= len(self._ordinals):
+				raise ValueError(f"ordinal out of range for {self._source.__qualname__}")
+
+		translated = self._numpy_table.take(codes)
+
+		if translated.size and translated.min() < 0:
+			position = numpy.flatnonzero(translated.ravel() < 0)[0]
+			raise self._error(get_members(self._source)[codes.ravel()[position]])
+
+		return translated.astype(get_code_dtype(self._target))
+
+	def inverse(self, *, complete: bool = True) -> "EnumTranslator[_T, _S]":
+		"""
+		Returns a translator from :attr:`~.target` back to :attr:`~.source`.
+
+		:param complete: If :py:obj:`True`, every member of :attr:`~.target` must be the translation of a member.
+
+		:raises ValueError: If several members translate to the same member,
+			or ``complete`` is :py:obj:`True` and some members of :attr:`~.target` are not translations of any member.
+		"""
+
+		source_members = get_members(self._source)
+		target_members = get_members(self._target)
+		table: Dict[_T, _S] = {}
+
+		for source_ordinal, target_ordinal in enumerate(self._ordinals):
+			if target_ordinal < 0:
+				continue
+
+			target_member = target_members[target_ordinal]
+
+			if target_member in table:
+				raise ValueError(
+						f"{table[target_member]!r} and {source_members[source_ordinal]!r} "  # type: ignore[index]
+						f"both translate to {target_member!r}"
+						)
+
+			table[target_member] = source_members[source_ordinal]  # type: ignore[index,assignment]
+
+		return EnumTranslator(self._target, self._source, table, complete=complete)
+
+	def _error(self, member: Any) -> ValueError:
+		if id(member) not in _get_id_ordinals(self._source):
+			return ValueError(f"{member!r} is not a canonical member of {self._source.__qualname__}")
+
+		return ValueError(f"{member!r} has no translation to {self._target.__qualname__}")
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self._source.__qualname__} -> {self._target.__qualname__}>"
@@ -25,13 +25,34 @@ General utility functions.
 
 # stdlib
 import inspect
+import sys
+import threading
 from enum import Enum, EnumMeta, Flag
-from typing import Tuple, Type
+from typing import Dict, Tuple, Type
 
 # 3rd party
 from typing_extensions import Protocol, runtime_checkable
 
-__all__ = ["HasMRO", "is_enum", "is_enum_member", "is_flag", "get_base_object"]
+__all__ = [
+		"HasMRO",
+		"is_enum",
+		"is_enum_member",
+		"is_flag",
+		"get_base_object",
+		"get_members",
+		"get_ordinals",
+		]
+
+if sys.version_info >= (3, 10):  # pragma: no cover (<py310)
+	_popcount = int.bit_count
+else:  # pragma: no cover (py310+)
+
+	def _popcount(value: int) -> int:
+		return bin(value).count('1')
+
+
+# Held while storing member tables on enums, so every thread uses the same table.
+_table_lock = threading.Lock()
 
 
 @runtime_checkable
@@ -112,3 +133,69 @@ def get_base_object(enum: Type[HasMRO]) -> Type:
 			return obj
 
 	return object
+
+
+def _get_member_table(enum: Type[Enum]) -> Tuple[Tuple[Enum, ...], Dict[str, int]]:
+	"""
+	Returns the (cached) tuple of canonical members of ``enum``, and the mapping of their names to ordinals.
+
+	:param enum:
+	"""
+
+	# The table is stored on the class, as it refers to the members and so would keep the class alive
+	# if it were stored elsewhere.
+	try:
+		return enum.__dict__["_member_table_"]
+	except (AttributeError, KeyError):
+		pass
+
+	if not is_enum(enum):
+		raise TypeError("not an Enum")
+
+	with _table_lock:
+		# Another thread may have stored the table while this one was waiting.
+		table = enum.__dict__.get("_member_table_")
+		if table is None:
+			members = tuple(member for name, member in enum.__members__.items() if member._name_ == name)
+			ordinals = {member._name_: ordinal for ordinal, member in enumerate(members)}
+			table = (members, ordinals)
+			type.__setattr__(enum, "_member_table_", table)
+
+	return table
+
+
+def get_members(enum: Type[Enum]) -> Tuple[Enum, ...]:
+	"""
+	Returns the canonical members of ``enum`` in definition order.
+
+	Aliases are excluded, but named :class:`~enum.Flag` members with zero or multiple bits set are included,
+	so the result is the same on all supported Python versions.
+	The position of a member in this tuple is its *ordinal*.
+
+	The result is computed once per class and cached.
+
+	.. versionadded:: 0.14.0
+
+	:param enum:
+
+	:raises TypeError: If ``enum`` is not an Enum.
+	"""
+
+	return _get_member_table(enum)[0]
+
+
+def get_ordinals(enum: Type[Enum]) -> Dict[str, int]:
+	"""
+	Returns a mapping of the names of the canonical members of ``enum`` to their ordinals.
+
+	The ordinal of a member can be found with ``get_ordinals(enum)[member.name]``.
+	The returned dictionary is shared, and must not be modified.
+
+	.. versionadded:: 0.14.0
+
+	:param enum:
+
+	:raises TypeError: If ``enum`` is not an Enum.
+	"""
+
+	return _get_member_table(enum)[1]
@@ -10,6 +10,9 @@ import sphinx
 from bs4 import BeautifulSoup
 from sphinx.application import Sphinx
 
+# this package
+from enum_tools import pickling
+
 if sys.version_info >= (3, 10):
 	types.Union = types.UnionType
 
@@ -50,3 +53,19 @@ def page(content, request) -> BeautifulSoup:  # noqa: MAN001
 			meta.extract()  # type: ignore[attr-defined]
 
 	return soup
+
+
+@pytest.fixture()
+def pickling_registry() -> Iterator[None]:
+	"""
+	Restores the registry of :mod:`enum_tools.pickling` after the test, removing any enums it registered.
+	"""
+
+	registries = (pickling._registry, pickling._keys, pickling._members)
+	saved = [registry.copy() for registry in registries]
+
+	yield
+
+	for registry, contents in zip(registries, saved):
+		registry.clear()
+		registry.update(contents)  # type: ignore[arg-type]
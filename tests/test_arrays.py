@@ -0,0 +1,148 @@
+# stdlib
+import pickle
+from enum import Enum
+
+# 3rd party
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+# this package
+from enum_tools.arrays import EnumArray, get_code_dtype  # noqa: E402
+from enum_tools.containers import EnumCounter  # noqa: E402
+from enum_tools.utils import get_members  # noqa: E402
+
+
+class Colour(Enum):
+	Red = 1
+	Green = 2
+	Blue = 3
+	Rouge = 1
+
+
+class Point(Enum):
+	Origin = (0, 0)
+	Unit = (1, 1)
+
+
+Mixed = Enum("Mixed", [("Int", 1), ("Str", 'x'), ("Float", 2.5), ("Nothing", None)])  # type: ignore[misc]
+
+Large = Enum("Large", [f"M{idx}" for idx in range(300)])  # type: ignore[misc]
+
+
+def test_get_code_dtype():
+	assert get_code_dtype(Colour) == numpy.uint8
+	assert get_code_dtype(Large) == numpy.uint16
+
+
+def test_construction():
+	members = [Colour.Red, Colour.Blue, Colour.Rouge, Colour.Green]
+
+	array = EnumArray.from_members(Colour, members)
+	assert array.enum is Colour
+	assert array.codes.dtype == numpy.uint8
+	assert array.codes.tolist() == [0, 2, 0, 1]
+	assert array.nbytes == 4
+	assert len(array) == 4
+	assert list(array) == [Colour.Red, Colour.Blue, Colour.Red, Colour.Green]
+
+	assert EnumArray.from_values(Colour, [1, 3, 1, 2]).codes.tolist() == [0, 2, 0, 1]
+	assert EnumArray.from_values(Colour, numpy.array([1, 3, 1, 2])).codes.tolist() == [0, 2, 0, 1]
+	assert EnumArray.from_names(Colour, ["Red", "Blue", "Rouge", "Green"]).codes.tolist() == [0, 2, 0, 1]
+	assert EnumArray.from_values(Point, [(1, 1), (0, 0)]).tolist() == [Point.Unit, Point.Origin]
+	assert EnumArray(Colour, [2, 1]).tolist() == [Colour.Blue, Colour.Green]
+	assert EnumArray(Large, numpy.array([299], dtype=numpy.int64)).codes.dtype == numpy.uint16
+	assert EnumArray.from_members(Colour, []).tolist() == []
+
+	with pytest.raises(ValueError, match="not all items are canonical members of Colour"):
+		EnumArray.from_members(Colour, [Colour.Red, Point.Unit])  # type: ignore[list-item]
+
+	with pytest.raises(ValueError, match="4 is not a valid Colour"):
+		EnumArray.from_values(Colour, [1, 4])
+
+	with pytest.raises(ValueError, match="'Purple' is not the name of a canonical member of Colour"):
+		EnumArray.from_names(Colour, ["Red", "Purple"])
+
+	with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+		EnumArray(Colour, [0, 3])
+
+	with pytest.raises(TypeError, match="codes must be integers, not float64"):
+		EnumArray(Colour, [0.0])
+
+	with pytest.raises(ValueError, match="codes must be one-dimensional"):
+		EnumArray(Colour, [[0]])
+
+
+def test_mixed_values():
+	array = EnumArray.from_values(Mixed, [1, 'x', None, 2.5, 1])
+	assert array.tolist() == [Mixed.Int, Mixed.Str, Mixed.Nothing, Mixed.Float, Mixed.Int]
+	assert array.values().dtype == object
+	assert array.values().tolist() == [1, 'x', None, 2.5, 1]
+	assert array.names().tolist() == ["Int", "Str", "Nothing", "Float", "Int"]
+
+	values = numpy.array([None, 'x', None], dtype=object)
+	assert EnumArray.from_values(Mixed, values).tolist() == [Mixed.Nothing, Mixed.Str, Mixed.Nothing]
+
+	with pytest.raises(ValueError, match="'1' is not a valid Mixed"):
+		EnumArray.from_values(Mixed, ['1', 'x'])
+
+
+def test_indexing():
+	array = EnumArray.from_values(Colour, [1, 2, 3, 1, 2, 3])
+
+	assert array[0] is Colour.Red
+	assert array[-1] is Colour.Blue
+
+	sliced = array[1:4]
+	assert isinstance(sliced, EnumArray)
+	assert sliced.tolist() == [Colour.Green, Colour.Blue, Colour.Red]
+	assert numpy.shares_memory(sliced.codes, array.codes)
+
+	assert array[array == Colour.Blue].tolist() == [Colour.Blue, Colour.Blue]
+	assert array[[0, 0]].tolist() == [Colour.Red, Colour.Red]
+
+	with pytest.raises(ValueError, match="read-only"):
+		array.codes[0] = 1
+
+	copy = array.copy()
+	assert not numpy.shares_memory(copy.codes, array.codes)
+
+
+def test_vectorised_operations():
+	array = EnumArray.from_values(Colour, [1, 2, 3, 1])
+
+	assert (array == Colour.Red).tolist() == [True, False, False, True]
+	assert (array == Colour.Rouge).tolist() == [True, False, False, True]
+	assert (array != Colour.Red).tolist() == [False, True, True, False]
+	assert (array == Point.Origin).tolist() == [False, False, False, False]
+	assert (array == EnumArray.from_values(Colour, [1, 1, 3, 3])).tolist() == [True, False, True, False]
+	assert (array == EnumArray.from_values(Point, [(0, 0)] * 4)).tolist() == [False] * 4
+
+	assert array.isin([Colour.Red, Colour.Blue]).tolist() == [True, False, True, True]
+	assert array.isin([Point.Origin]).tolist() == [False] * 4
+	assert array.isin([]).tolist() == [False] * 4
+
+	counts = array.value_counts()
+	assert isinstance(counts, EnumCounter)
+	assert counts.most_common() == [(Colour.Red, 2), (Colour.Green, 1), (Colour.Blue, 1)]
+
+	assert array.values().tolist() == [1, 2, 3, 1]
+	assert array.names().tolist() == ["Red", "Green", "Blue", "Red"]
+	assert EnumArray.from_members(Point, [Point.Unit]).values().tolist() == [(1, 1)]
+
+
+def test_repr_pickle():
+	array = EnumArray.from_values(Colour, [1, 2, 3])
+	assert repr(array) == "EnumArray(Colour, ['Red', 'Green', 'Blue'])"
+
+	long = EnumArray(Large, numpy.arange(300))
+	assert repr(long) == "EnumArray(Large, ['M0', 'M1', 'M2', 'M3', 'M4', ..., 'M295', 'M296', 'M297', 'M298', 'M299'])"
+
+	unpickled = pickle.loads(pickle.dumps(array))
+	assert unpickled.enum is Colour
+	assert unpickled.tolist() == array.tolist()
+
+	with pytest.raises(TypeError, match="unhashable"):
+		hash(array)
+
+	assert get_members(Colour)[array.codes[2]] is Colour.Blue
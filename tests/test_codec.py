@@ -0,0 +1,115 @@
+# stdlib
+from enum import Enum, Flag
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.codec import (
+		decode_members,
+		decode_ordinals,
+		encode_members,
+		encode_ordinals,
+		get_identity,
+		get_ordinal_width,
+		read_header
+		)
+from enum_tools.utils import get_members, get_ordinals
+
+
+class Colour(StrEnum):
+	Red = "red"
+	Green = "green"
+	Blue = "blue"
+	Rouge = "red"
+
+
+class Permissions(Flag):
+	Read = 4
+	Write = 2
+	Execute = 1
+	All = 7
+
+
+Large = IntEnum("Large", [(f"member_{idx}", idx) for idx in range(300)])  # type: ignore[misc]
+Huge = Enum("Huge", [(f"member_{idx}", idx) for idx in range(70000)])  # type: ignore[misc]
+
+
+def test_get_members():
+	assert get_members(Colour) == (Colour.Red, Colour.Green, Colour.Blue)
+	assert get_members(Permissions) == (Permissions.Read, Permissions.Write, Permissions.Execute, Permissions.All)
+	assert get_ordinals(Colour) == {"Red": 0, "Green": 1, "Blue": 2}
+	assert get_members(Colour) is get_members(Colour)
+
+	with pytest.raises(TypeError, match="not an Enum"):
+		get_members(str)  # type: ignore[arg-type]
+
+	with pytest.raises(TypeError, match="not an Enum"):
+		get_members("abc")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("enum, width", [(Colour, 1), (Large, 2), (Huge, 4)])
+def test_roundtrip(enum, width: int):
+	members = list(enum) * 3
+	data = encode_members(members, enum)
+
+	assert get_ordinal_width(enum) == width
+	assert read_header(data).width == width
+	assert read_header(data).length == len(members)
+	assert read_header(data).identity == get_identity(enum)
+	assert decode_members(data, enum) == members
+
+
+def test_decode_ordinals():
+	data = encode_members([Colour.Blue, Colour.Red, Colour.Rouge, Colour.Green], Colour)
+	ordinals = decode_ordinals(data, Colour)
+
+	assert ordinals.obj is data
+	assert ordinals.tolist() == [2, 0, 0, 1]
+	assert encode_ordinals(ordinals, Colour) == data
+	assert decode_members(bytearray(data), Colour) == [Colour.Blue, Colour.Red, Colour.Red, Colour.Green]
+
+
+def test_encode_empty():
+	assert decode_members(encode_members([], Colour), Colour) == []
+
+
+def test_encode_errors():
+	with pytest.raises(ValueError, match="Permissions.Read: 4> is not a member of Colour"):
+		encode_members([Colour.Red, Permissions.Read], Colour)  # type: ignore[list-item]
+
+	with pytest.raises(ValueError, match="is not a canonical member of Permissions"):
+		encode_members([Permissions.Read | Permissions.Write], Permissions)
+
+	with pytest.raises(ValueError, match="ordinal 3 out of range for Colour"):
+		encode_ordinals([0, 3], Colour)
+
+	with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+		encode_ordinals([-1], Colour)
+
+
+def test_decode_mismatch():
+	data = encode_members([Colour.Red], Colour)
+
+	with pytest.raises(ValueError, match="data was encoded from 'tests.test_codec.Colour', not"):
+		decode_members(data, Permissions)
+
+	class Colour2(StrEnum):
+		Red = "red"
+		Green = "green"
+
+	Colour2.__qualname__ = Colour.__qualname__
+	Colour2.__module__ = Colour.__module__
+
+	with pytest.raises(ValueError, match="data was encoded from an enum with 3 members, but Colour has 2"):
+		decode_members(data, Colour2)
+
+	with pytest.raises(ValueError, match="truncated data"):
+		decode_members(data[:-1], Colour)
+
+	with pytest.raises(ValueError, match="truncated header"):
+		decode_members(data[:10], Colour)
+
+	with pytest.raises(ValueError, match="not an encoded sequence of enum members"):
+		decode_members(b"\x00" * 64, Colour)
@@ -0,0 +1,193 @@
+# stdlib
+import json
+import pathlib
+from enum import Enum
+from typing import Any, Dict
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.__main__ import main
+from enum_tools.codegen import EnumSpec, MemberSpec, generate_module, load_spec, parse_spec
+from enum_tools.custom_enums import IterableFlag
+from enum_tools.lazy import LazyEnum
+
+CURRENCIES = """\
+name,value,doc
+GBP,GBP,Pound sterling
+USD,USD,"United States dollar
+(the dollar)"
+EUR,EUR,
+"""
+
+
+def run_module(source: str) -> Dict[str, Any]:
+	namespace: Dict[str, Any] = {"__name__": "generated"}
+	exec(compile(source, "generated.py", "exec"), namespace)  # noqa: DUO105
+	return namespace
+
+
+def test_generate_module():
+	spec = parse_spec(
+			"Status",
+			[("OK", 200, "Success"), ("NOT_FOUND", 404, ''), ("MISSING", 404, "Alias of NOT_FOUND")],
+			base="IntEnum",
+			doc="HTTP status codes.",
+			)
+	source = generate_module(spec, source="/path/to/status.json")
+
+	assert source.startswith("# This module was generated by ``python -m enum_tools generate`` from status.json.\n")
+	assert "\t#: Success\n\tOK = 200\n" in source
+	assert "\tNOT_FOUND = 404\n\t#: Alias of NOT_FOUND\n\tMISSING = 404\n" in source
+
+	namespace = run_module(source)
+	Status = namespace["Status"]
+	assert issubclass(Status, IntEnum)
+	assert Status.__doc__.strip() == "HTTP status codes."
+	assert list(Status) == [Status.OK, Status.NOT_FOUND]
+	assert Status.MISSING is Status.NOT_FOUND
+	assert namespace["NAMES"] == ("OK", "NOT_FOUND")
+	assert namespace["VALUES"] == (200, 404)
+	assert namespace["VALUE_TO_NAME"] == {200: "OK", 404: "NOT_FOUND"}
+
+
+def test_generate_lazy_module():
+	spec = parse_spec("Country", [("GB", "United Kingdom", "Doc"), ("FR", "France", '')])
+	source = generate_module(spec, lazy=True)
+	assert "\t\t\t# Doc\n\t\t\t('GB', 'United Kingdom'),\n" in source
+
+	namespace = run_module(source)
+	Country = namespace["Country"]
+	assert issubclass(Country, LazyEnum)
+	assert Country("France") is Country.FR
+	assert namespace["VALUE_TO_NAME"] == {"United Kingdom": "GB", "France": "FR"}
+
+	with pytest.raises(ValueError, match="lazy enums do not support aliases"):
+		generate_module(parse_spec("Country", [("GB", 1, ''), ("UK", 1, '')]), lazy=True)
+
+	with pytest.raises(ValueError, match="lazy enums cannot have the base IntEnum"):
+		generate_module(parse_spec("Country", [("GB", 1, '')], base="IntEnum"), lazy=True)
+
+
+@pytest.mark.parametrize("name", ["NAMES", "VALUES", "VALUE_TO_NAME", "Dict", "Tuple", "IntEnum"])
+def test_generate_module_reserved_names(name: str):
+	spec = parse_spec(name, [("A", 1, '')], base="IntEnum")
+
+	with pytest.raises(ValueError, match=f"the enum cannot be named '{name}', as the generated module defines"):
+		generate_module(spec)
+
+
+def test_generate_module_other_names():
+	with pytest.raises(ValueError, match="the enum cannot be named 'LazyEnum'"):
+		generate_module(parse_spec("LazyEnum", [("A", 1, '')]), lazy=True)
+
+	# Only the enum's own base class is imported, and members are defined in the class namespace.
+	namespace = run_module(generate_module(parse_spec("Enum", [("NAMES", 1, '')], base="IntEnum")))
+	assert namespace["Enum"].NAMES.value == 1
+	assert namespace["NAMES"] == ("NAMES", )
+
+
+def test_generate_docstring_escaping():
+	spec = parse_spec("Quoted", [("A", "a\"\"\"b", '')], doc='Contains """ and \\.')
+	Quoted = run_module(generate_module(spec))["Quoted"]
+	assert Quoted.__doc__.strip() == 'Contains """ and \\.'
+	assert Quoted.A.value == 'a"""b'
+
+
+def test_load_spec_csv(tmp_path: pathlib.Path):
+	(tmp_path / "currencies.csv").write_text(CURRENCIES)
+	spec = load_spec(str(tmp_path / "currencies.csv"), name="Currency", base="StrEnum")
+
+	assert spec == EnumSpec(
+			"Currency",
+			"StrEnum",
+			(
+					MemberSpec("GBP", "GBP", "Pound sterling"),
+					MemberSpec("USD", "USD", "United States dollar\n(the dollar)"),
+					MemberSpec("EUR", "EUR", ''),
+					),
+			)
+
+	Currency = run_module(generate_module(spec))["Currency"]
+	assert issubclass(Currency, StrEnum)
+	assert str(Currency.USD) == "USD"
+
+	with pytest.raises(ValueError, match="the name of the enum must be given for CSV files"):
+		load_spec(str(tmp_path / "currencies.csv"))
+
+
+def test_load_spec_csv_integers(tmp_path: pathlib.Path):
+	(tmp_path / "permissions.csv").write_text("name,value\nREAD,0x4\nWRITE,0b10\nEXECUTE,1\n")
+	spec = load_spec(str(tmp_path / "permissions.csv"), name="Permission", base="IterableFlag")
+	assert [member.value for member in spec.members] == [4, 2, 1]
+
+	Permission = run_module(generate_module(spec))["Permission"]
+	assert issubclass(Permission, IterableFlag)
+	assert list(Permission.READ | Permission.WRITE) == [Permission.READ, Permission.WRITE]
+
+	(tmp_path / "bad.csv").write_text("name,value\nREAD,four\n")
+	with pytest.raises(ValueError, match="invalid integer 'four' for 'READ'"):
+		load_spec(str(tmp_path / "bad.csv"), name="Permission", base="IterableFlag")
+
+
+def test_load_spec_json(tmp_path: pathlib.Path):
+	data = {
+			"name": "Colour",
+			"doc": "Colours.",
+			"members": [{"name": "RED", "value": 1, "doc": "Red"}, {"name": "GREEN", "value": 2}],
+			}
+	(tmp_path / "colour.json").write_text(json.dumps(data))
+
+	spec = load_spec(str(tmp_path / "colour.json"))
+	assert spec == EnumSpec("Colour", "Enum", (MemberSpec("RED", 1, "Red"), MemberSpec("GREEN", 2)), "Colours.")
+	assert load_spec(str(tmp_path / "colour.json"), name="Color", base="IntEnum").name == "Color"
+
+	Colour = run_module(generate_module(spec))["Colour"]
+	assert issubclass(Colour, Enum)
+	assert Colour(2) is Colour.GREEN
+
+	(tmp_path / "list.json").write_text("[]")
+	with pytest.raises(ValueError, match="expected an object with a list of 'members'"):
+		load_spec(str(tmp_path / "list.json"))
+
+	with pytest.raises(ValueError, match="unsupported specification format '.txt'"):
+		load_spec(str(tmp_path / "colour.txt"))
+
+
+@pytest.mark.parametrize(
+		"name, members, base, message",
+		[
+				("1Bad", [], "Enum", "'1Bad' is not a valid enum name"),
+				("Good", [], "Flag", "unknown base 'Flag'"),
+				("Good", [("class", 1, '')], "Enum", "'class' is not a valid member name"),
+				("Good", [("_private", 1, '')], "Enum", "must not start with an underscore"),
+				("Good", [("A", 1, ''), ("A", 2, '')], "Enum", "duplicate member name 'A'"),
+				("Good", [("A", [1], '')], "Enum", r"unsupported value \[1\] for 'A'"),
+				("Good", [("A", float("nan"), '')], "Enum", "unsupported value nan for 'A'"),
+				("Good", [("A", "1", '')], "IntEnum", "the value of 'A' must be an integer for IntEnum"),
+				("Good", [("A", True, '')], "IterableFlag", "the value of 'A' must be an integer for IterableFlag"),
+				("Good", [("A", 1, '')], "StrEnum", "the value of 'A' must be a string for StrEnum"),
+				],
+		)
+def test_parse_spec_errors(name: str, members, base: str, message: str):
+	with pytest.raises(ValueError, match=message):
+		parse_spec(name, members, base=base)
+
+
+def test_main(tmp_path: pathlib.Path, capsys):
+	(tmp_path / "currencies.csv").write_text(CURRENCIES)
+	output = tmp_path / "currency.py"
+
+	assert main(["generate", str(tmp_path / "currencies.csv"), "--name", "Currency", "-o", str(output)]) == 0
+	assert "class Currency(Enum):" in output.read_text()
+
+	assert main(["generate", str(tmp_path / "currencies.csv"), "--name", "Currency", "--lazy"]) == 0
+	assert "class Currency(LazyEnum):" in capsys.readouterr().out
+
+	assert main(["generate", str(tmp_path / "currencies.csv")]) == 1
+	assert capsys.readouterr().err == "error: the name of the enum must be given for CSV files\n"
+
+	assert main(["generate", str(tmp_path / "missing.json")]) == 1
+	assert "No such file or directory" in capsys.readouterr().err
@@ -0,0 +1,230 @@
+# stdlib
+import pathlib
+import pickle
+import sys
+from enum import Enum
+from typing import Type
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.columnfile import MAGIC, ColumnReader, ColumnWriter, read_column_header
+from enum_tools.utils import get_ordinals
+
+
+class Colour(StrEnum):
+	Red = "red"
+	Green = "green"
+	Blue = "blue"
+	Rouge = "red"
+
+
+class Shape(Enum):
+	Circle = (0, "round")
+	Square = (4, "square")
+
+
+Large = IntEnum("Large", [(f"member_{idx}", idx) for idx in range(300)])  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("enum, width", [(Colour, 1), (Shape, 1), (Large, 2)])
+def test_roundtrip(tmp_path: pathlib.Path, enum: Type[Enum], width: int):
+	members = list(enum) * 1000
+
+	with ColumnWriter(tmp_path / "column.etcf", enum) as writer:
+		writer.extend(members[:10])
+		for member in members[10:20]:
+			writer.append(member)
+		writer.extend(members[20:])
+		assert len(writer) == len(members)
+
+	with ColumnReader(tmp_path / "column.etcf", enum) as reader:
+		assert len(reader) == len(members)
+		assert reader.header.width == width
+		assert reader.header.identity == f"{__name__}.{enum.__qualname__}"
+		assert reader.header.offset % 8 == 0
+		assert list(reader) == members
+		assert reader.ordinals.itemsize == width
+		assert reader.ordinals.readonly
+		assert reader.ordinals.tolist() == [get_ordinals(enum)[member.name] for member in members]
+
+	header = read_column_header((tmp_path / "column.etcf").read_bytes())
+	assert header.length == len(members)
+	assert header.members[0] == [list(enum)[0].name, list(enum)[0].value if enum is not Shape else "(0, 'round')"]
+
+
+def test_iter_chunks(tmp_path: pathlib.Path):
+	members = [Colour.Red, Colour.Green, Colour.Blue] * 5
+
+	with ColumnWriter(tmp_path / "column.etcf", Colour) as writer:
+		writer.extend(members)
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		chunks = list(reader.iter_chunks(4))
+		assert [len(chunk) for chunk in chunks] == [4, 4, 4, 3]
+		assert sum(chunks, []) == members
+
+		with pytest.raises(ValueError, match="'chunk_size' must be at least 1"):
+			next(reader.iter_chunks(0))
+
+
+def test_to_array(tmp_path: pathlib.Path):
+	numpy = pytest.importorskip("numpy")
+	members = [Colour.Red, Colour.Blue, Colour.Blue]
+
+	with ColumnWriter(tmp_path / "column.etcf", Colour) as writer:
+		writer.extend(members)
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		array = reader.to_array()
+		assert array.tolist() == members
+		assert numpy.shares_memory(array.codes, numpy.frombuffer(reader._mmap, dtype="u1"))
+		assert not array.codes.flags.writeable
+
+	# The array keeps the memory map open after the reader is closed.
+	assert array.tolist() == members
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="pickle.PickleBuffer requires Python 3.8")
+def test_close_with_exported_ordinals(tmp_path: pathlib.Path):
+	with ColumnWriter(tmp_path / "column.etcf", Colour) as writer:
+		writer.extend([Colour.Red, Colour.Blue])
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		exported = pickle.PickleBuffer(reader.ordinals)  # type: ignore[attr-defined]
+		chunk = reader.ordinals[1:]
+
+	assert reader._view is None
+	assert bytes(exported) == b"\x00\x02"
+	assert chunk.tolist() == [2]
+
+	del exported, chunk
+	reader.close()
+	assert reader._mmap.closed
+
+
+def test_append(tmp_path: pathlib.Path):
+	with ColumnWriter(tmp_path / "column.etcf", Colour) as writer:
+		writer.extend([Colour.Red, Colour.Green])
+
+	with ColumnWriter(tmp_path / "column.etcf", Colour, append=True) as writer:
+		assert len(writer) == 2
+		writer.append(Colour.Blue)
+		writer.extend_ordinals([0, 1])
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		assert list(reader) == [Colour.Red, Colour.Green, Colour.Blue, Colour.Red, Colour.Green]
+
+	with ColumnWriter(tmp_path / "new.etcf", Colour, append=True) as writer:
+		writer.append(Colour.Blue)
+
+	with ColumnReader(tmp_path / "new.etcf", Colour) as reader:
+		assert list(reader) == [Colour.Blue]
+
+
+def test_unclosed_writer(tmp_path: pathlib.Path):
+	writer = ColumnWriter(tmp_path / "column.etcf", Colour)
+	writer.extend([Colour.Red, Colour.Green])
+	writer.flush()
+	writer.append(Colour.Blue)
+
+	# Only the flushed members are visible.
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		assert list(reader) == [Colour.Red, Colour.Green]
+
+	writer.close()
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		assert list(reader) == [Colour.Red, Colour.Green, Colour.Blue]
+
+
+def test_writer_errors(tmp_path: pathlib.Path):
+	with ColumnWriter(tmp_path / "column.etcf", Colour) as writer:
+		with pytest.raises(ValueError, match="<Shape.Circle: .*> is not a canonical member of Colour"):
+			writer.append(Shape.Circle)  # type: ignore[arg-type]
+
+		with pytest.raises(ValueError, match="'red' is not a canonical member of Colour"):
+			writer.extend([Colour.Blue, "red"])  # type: ignore[list-item]
+
+		with pytest.raises(ValueError, match="ordinal 3 out of range for Colour"):
+			writer.extend_ordinals([0, 3])
+
+		with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+			writer.extend_ordinals([-1])
+
+	with ColumnReader(tmp_path / "column.etcf", Colour) as reader:
+		assert list(reader) == [Colour.Blue]
+
+
+def test_stale_files(tmp_path: pathlib.Path):
+	filename = tmp_path / "column.etcf"
+
+	Status = Enum("Status", ["OK", "ERROR"], module=__name__)  # type: ignore[misc]
+
+	with ColumnWriter(filename, Status) as writer:
+		writer.extend(Status)
+
+	Reordered = Enum("Status", ["ERROR", "OK"], module=__name__)  # type: ignore[misc]
+	message = "Status has changed since the file was written: member 0 was OK=1, but is now ERROR=1"
+	with pytest.raises(ValueError, match=message):
+		ColumnReader(filename, Reordered)
+
+	Revalued = Enum("Status", [("OK", 1), ("ERROR", 3)], module=__name__)  # type: ignore[misc]
+	with pytest.raises(ValueError, match="member 1 was ERROR=2, but is now ERROR=3"):
+		ColumnReader(filename, Revalued)
+
+	Extended = Enum("Status", ["OK", "ERROR", "UNKNOWN"], module=__name__)  # type: ignore[misc]
+	with pytest.raises(ValueError, match="it had 2 members, but now has 3"):
+		ColumnReader(filename, Extended)
+
+	with pytest.raises(ValueError, match="it had 2 members, but now has 3"):
+		ColumnWriter(filename, Extended, append=True)
+
+	with pytest.raises(ValueError, match=f"file was written for '{__name__}.Status', not '{__name__}.Colour'"):
+		ColumnReader(filename, Colour)
+
+
+def test_float_values(tmp_path: pathlib.Path):
+	filename = tmp_path / "column.etcf"
+
+	members = [("Missing", float("nan")), ("High", float("inf")), ("Zero", 0.0)]
+	Reading = Enum("Reading", members)  # type: ignore[misc]
+
+	with ColumnWriter(filename, Reading) as writer:
+		writer.extend([Reading.Missing, Reading.Zero, Reading.High])
+
+	with ColumnReader(filename, Reading) as reader:
+		assert list(reader) == [Reading.Missing, Reading.Zero, Reading.High]
+
+	Retyped = Enum("Reading", [*members[:2], ("Zero", 0)])  # type: ignore[misc]
+	with pytest.raises(ValueError, match="member 2 was Zero=0.0, but is now Zero=0"):
+		ColumnReader(filename, Retyped)
+
+
+def test_corrupt_files(tmp_path: pathlib.Path):
+	filename = tmp_path / "column.etcf"
+
+	with ColumnWriter(filename, Colour) as writer:
+		writer.extend([Colour.Red] * 10)
+
+	data = filename.read_bytes()
+	assert data.startswith(MAGIC)
+
+	filename.write_bytes(data[:-1])
+	with pytest.raises(ValueError, match="truncated data"):
+		ColumnReader(filename, Colour)
+
+	filename.write_bytes(data[:30])
+	with pytest.raises(ValueError, match="truncated header"):
+		ColumnReader(filename, Colour)
+
+	filename.write_bytes(b"XXXX" + data[4:])
+	with pytest.raises(ValueError, match="not a column file"):
+		ColumnReader(filename, Colour)
+
+	filename.write_bytes(data[:-1] + b"\x09")
+	with ColumnReader(filename, Colour) as reader:
+		with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+			list(reader)
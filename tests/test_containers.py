@@ -0,0 +1,368 @@
+# stdlib
+import gc
+import pickle
+import weakref
+from array import array
+from enum import Enum, Flag
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools.codec import decode_ordinals, encode_members
+from enum_tools.containers import EnumCounter, EnumMap, EnumSet, MutableEnumSet
+from enum_tools.custom_enums import IterableFlag
+from enum_tools.utils import get_members
+
+
+class Colour(Enum):
+	Red = 1
+	Green = 2
+	Blue = 3
+	Rouge = 1
+
+
+class Fruit(Enum):
+	Red = 1
+	Apple = 2
+
+
+class Permissions(Flag):
+	Read = 4
+	Write = 2
+	Execute = 1
+
+
+def test_enum_map():
+	mapping: EnumMap[Colour, str] = EnumMap(Colour)
+	assert len(mapping) == 0
+	assert not mapping
+	assert mapping.enum is Colour
+
+	mapping[Colour.Blue] = "blue"
+	mapping[Colour.Rouge] = "red"
+
+	assert len(mapping) == 2
+	assert list(mapping) == [Colour.Red, Colour.Blue]
+	assert list(mapping.items()) == [(Colour.Red, "red"), (Colour.Blue, "blue")]
+	assert mapping[Colour.Red] == "red"
+	assert Colour.Red in mapping
+	assert Colour.Green not in mapping
+	assert mapping.get(Colour.Green) is None
+	assert mapping.get(Colour.Green, "green") == "green"
+	assert mapping.get(Colour.Blue, "green") == "blue"
+
+	mapping[Colour.Red] = "rouge"
+	assert len(mapping) == 2
+
+	del mapping[Colour.Red]
+	assert list(mapping) == [Colour.Blue]
+	assert len(mapping) == 1
+
+	assert mapping.pop(Colour.Blue) == "blue"
+	assert mapping == {}
+
+	with pytest.raises(KeyError, match="Colour.Green"):
+		mapping[Colour.Green]  # pylint: disable=pointless-statement
+
+	with pytest.raises(KeyError, match="Colour.Green"):
+		del mapping[Colour.Green]
+
+
+def test_enum_map_foreign_keys():
+	mapping: EnumMap[Colour, int] = EnumMap(Colour, {Colour.Red: 1})
+
+	assert Fruit.Red not in mapping
+	assert "Red" not in mapping
+	assert mapping.get(Fruit.Red) is None  # type: ignore[call-overload]
+
+	with pytest.raises(KeyError, match="Fruit.Red"):
+		mapping[Fruit.Red] = 1  # type: ignore[index]
+
+	with pytest.raises(KeyError, match="Fruit.Red"):
+		mapping[Fruit.Red]  # type: ignore[index]  # pylint: disable=pointless-statement
+
+	flags: EnumMap[Permissions, int] = EnumMap(Permissions)
+
+	with pytest.raises(KeyError):
+		flags[Permissions.Read | Permissions.Write] = 1
+
+
+def test_enum_map_bulk():
+	mapping: EnumMap[Colour, int] = EnumMap(Colour, [(Colour.Green, 2)])
+	mapping.fill(0)
+	assert dict(mapping) == {Colour.Red: 0, Colour.Green: 0, Colour.Blue: 0}
+
+	other: EnumMap[Colour, int] = EnumMap(Colour, {Colour.Blue: 3})
+	mapping.update(other, Red=1)
+	assert dict(mapping) == {Colour.Red: 1, Colour.Green: 0, Colour.Blue: 3}
+
+	mapping.clear()
+	mapping.update(other)
+	assert len(mapping) == 1
+	assert mapping == other
+	assert mapping == {Colour.Blue: 3}
+	assert mapping != EnumMap(Fruit)
+
+	copy = mapping.copy()
+	copy[Colour.Red] = 1
+	assert len(mapping) == 1
+	assert len(copy) == 2
+
+	with pytest.raises(TypeError, match="update expected at most 1 argument, got 2"):
+		mapping.update({}, {})
+
+
+def test_enum_map_repr_pickle():
+	mapping: EnumMap[Colour, str] = EnumMap(Colour, {Colour.Blue: "blue", Colour.Red: "red"})
+	assert repr(mapping) == "EnumMap(Colour, {<Colour.Red: 1>: 'red', <Colour.Blue: 3>: 'blue'})"
+	assert pickle.loads(pickle.dumps(mapping)) == mapping
+
+
+def test_enum_set():
+	empty: EnumSet[Colour] = EnumSet(Colour)
+	assert not empty
+	assert len(empty) == 0
+	assert empty.bits == 0
+	assert empty.enum is Colour
+
+	primary = EnumSet(Colour, [Colour.Blue, Colour.Rouge])
+	assert len(primary) == 2
+	assert primary.bits == 0b101
+	assert list(primary) == [Colour.Red, Colour.Blue]
+	assert Colour.Red in primary
+	assert Colour.Green not in primary
+	assert Fruit.Red not in primary
+	assert "Red" not in primary
+
+	full = EnumSet.full(Colour)
+	assert list(full) == [Colour.Red, Colour.Green, Colour.Blue]
+	assert primary.complement() == EnumSet(Colour, [Colour.Green])
+	assert EnumSet.from_bits(Colour, 0b101) == primary
+
+	with pytest.raises(ValueError, match="invalid bitmask 0x8 for Colour"):
+		EnumSet.from_bits(Colour, 0b1000)
+
+	with pytest.raises(ValueError, match="<Fruit.Red: 1> is not a canonical member of Colour"):
+		EnumSet(Colour, [Colour.Red, Fruit.Red])  # type: ignore[list-item]
+
+	with pytest.raises(ValueError, match="is not a canonical member of Permissions"):
+		EnumSet(Permissions, [Permissions.Read | Permissions.Write])
+
+
+def test_enum_set_operations():
+	red_green = EnumSet(Colour, [Colour.Red, Colour.Green])
+	green_blue = EnumSet(Colour, [Colour.Green, Colour.Blue])
+
+	assert red_green | green_blue == EnumSet.full(Colour)
+	assert red_green & green_blue == {Colour.Green}
+	assert red_green - green_blue == {Colour.Red}
+	assert red_green ^ green_blue == {Colour.Red, Colour.Blue}
+	assert isinstance(red_green | green_blue, EnumSet)
+
+	# With other iterables
+	assert red_green | {Colour.Blue} == EnumSet.full(Colour)
+	assert red_green & {Colour.Red, Fruit.Red} == {Colour.Red}
+	assert red_green - {Fruit.Red, Colour.Green} == {Colour.Red}
+	assert {Colour.Red, Fruit.Red} - red_green == {Fruit.Red}
+	assert red_green.union([Colour.Blue], green_blue) == EnumSet.full(Colour)
+	assert red_green.intersection(green_blue, [Colour.Green]) == {Colour.Green}
+	assert red_green.difference([Colour.Red], ()) == {Colour.Green}
+	assert red_green.symmetric_difference(green_blue) == {Colour.Red, Colour.Blue}
+
+	# Items which aren't members give frozensets
+	assert red_green | {1} == {Colour.Red, Colour.Green, 1}
+	assert {1} | red_green == {Colour.Red, Colour.Green, 1}
+	assert type(red_green | {1}) is frozenset
+	assert red_green ^ [Colour.Red, Fruit.Red] == {Colour.Green, Fruit.Red}
+	assert red_green.union([Colour.Blue], iter([Fruit.Red]), [2]) == {*Colour, Fruit.Red, 2}
+	assert red_green.symmetric_difference(iter([1])) == {Colour.Red, Colour.Green, 1}
+
+	# Comparisons
+	assert red_green & green_blue < red_green
+	assert red_green & green_blue <= red_green
+	assert not red_green < red_green
+	assert red_green <= red_green
+	assert red_green > {Colour.Red}
+	assert red_green >= {Colour.Red, Colour.Green}
+	assert red_green < {Colour.Red, Colour.Green, Fruit.Red}
+	assert red_green.issubset([Colour.Red, Colour.Green, Colour.Blue])
+	assert red_green.issuperset([Colour.Red])
+	assert not red_green.issuperset([Fruit.Red])
+	assert red_green.issuperset(red_green & green_blue)
+	assert not red_green.issuperset(green_blue)
+	assert red_green.isdisjoint(EnumSet(Colour, [Colour.Blue]))
+	assert not red_green.isdisjoint(green_blue)
+	assert red_green.isdisjoint([Fruit.Red])
+
+	# Equality and hashing across set types
+	assert red_green == frozenset({Colour.Red, Colour.Green})
+	assert hash(red_green) == hash(frozenset({Colour.Red, Colour.Green}))
+	assert {red_green: 1}[frozenset({Colour.Red, Colour.Green})] == 1
+	assert EnumSet(Colour) == EnumSet(Fruit)
+	assert EnumSet(Colour, [Colour.Red]) != EnumSet(Fruit, [Fruit.Red])
+
+
+def test_mutable_enum_set():
+	colours: MutableEnumSet[Colour] = MutableEnumSet(Colour)
+	colours.add(Colour.Blue)
+	colours.add(Colour.Rouge)
+	assert list(colours) == [Colour.Red, Colour.Blue]
+
+	colours.discard(Colour.Green)
+	colours.discard(Fruit.Red)  # type: ignore[arg-type]
+	colours.remove(Colour.Blue)
+	assert colours == {Colour.Red}
+
+	with pytest.raises(KeyError, match="Colour.Blue"):
+		colours.remove(Colour.Blue)
+
+	with pytest.raises(ValueError, match="is not a canonical member of Colour"):
+		colours.add(Fruit.Red)  # type: ignore[arg-type]
+
+	colours |= {Colour.Green}
+	assert colours == {Colour.Red, Colour.Green}
+	colours &= EnumSet(Colour, [Colour.Green, Colour.Blue])
+	assert colours == {Colour.Green}
+	colours ^= [Colour.Green, Colour.Blue]
+	assert colours == {Colour.Blue}
+	colours -= {Colour.Blue, Fruit.Red}
+	assert colours == set()
+
+	colours.update([Colour.Red], [Colour.Green, Colour.Blue])
+	colours.intersection_update([Colour.Red, Colour.Green])
+	colours.difference_update([Colour.Green])
+	colours.symmetric_difference_update([Colour.Blue])
+	assert colours == {Colour.Red, Colour.Blue}
+
+	assert colours.pop() is Colour.Red
+	assert colours.pop() is Colour.Blue
+
+	with pytest.raises(KeyError, match="pop from an empty set"):
+		colours.pop()
+
+	colours.update(EnumSet.full(Colour))
+	copy = colours.copy()
+	colours.clear()
+	assert not colours
+	assert copy == EnumSet.full(Colour)
+
+	with pytest.raises(TypeError, match="unhashable"):
+		hash(copy)
+
+
+def test_enum_set_repr_pickle():
+	colours = EnumSet(Colour, [Colour.Blue, Colour.Red])
+	assert repr(colours) == "EnumSet(Colour, {<Colour.Red: 1>, <Colour.Blue: 3>})"
+	assert pickle.loads(pickle.dumps(colours)) == colours
+	assert type(pickle.loads(pickle.dumps(MutableEnumSet(Colour, colours)))) is MutableEnumSet
+
+
+def test_enum_counter():
+	counter: EnumCounter[Colour] = EnumCounter(Colour, [Colour.Blue, Colour.Rouge, Colour.Blue])
+	assert counter.enum is Colour
+	assert counter[Colour.Blue] == 2
+	assert counter[Colour.Red] == 1
+	assert counter[Colour.Green] == 0
+	assert Colour.Green not in counter
+	assert Colour.Blue in counter
+	assert Fruit.Red not in counter
+	assert list(counter) == [Colour.Red, Colour.Blue]
+	assert len(counter) == 2
+	assert counter.counts == [1, 0, 2]
+	assert counter.total() == 3
+	assert list(counter.elements()) == [Colour.Red, Colour.Blue, Colour.Blue]
+
+	counter.add(Colour.Green, 2)
+	counter.update({Colour.Red: 1})
+	assert counter.most_common() == [(Colour.Red, 2), (Colour.Green, 2), (Colour.Blue, 2)]
+	counter.add(Colour.Blue)
+	assert counter.most_common(2) == [(Colour.Blue, 3), (Colour.Red, 2)]
+	assert counter.most_common(0) == []
+	assert EnumCounter(Colour).most_common() == []
+
+	with pytest.raises(KeyError, match="Fruit.Red"):
+		counter[Fruit.Red]  # type: ignore[index]  # pylint: disable=pointless-statement
+
+	with pytest.raises(ValueError, match="<Fruit.Red: 1> is not a canonical member of Colour"):
+		counter.add(Fruit.Red)  # type: ignore[arg-type]
+
+	with pytest.raises(ValueError, match="<Fruit.Red: 1> is not a canonical member of Colour"):
+		counter.update({Colour.Red: 1, Fruit.Red: 1})  # type: ignore[dict-item]
+
+	with pytest.raises(ValueError, match="not all items are canonical members of Colour"):
+		counter.update([Colour.Red, Fruit.Red])  # type: ignore[list-item]
+
+	# Failed updates don't change the counts
+	assert counter.counts == [2, 2, 3]
+
+
+def test_enum_counter_ordinals():
+	counter: EnumCounter[Colour] = EnumCounter(Colour)
+	counter.update_ordinals(array('B', [0, 2, 2]))
+	counter.update_ordinals(decode_ordinals(encode_members([Colour.Green], Colour), Colour))
+	assert counter.counts == [1, 1, 2]
+
+	with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+		counter.update_ordinals([3])
+
+	with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+		counter.update_ordinals([-1])
+
+	assert counter.counts == [1, 1, 2]
+
+
+def test_enum_counter_numpy():
+	numpy = pytest.importorskip("numpy")
+
+	counter: EnumCounter[Colour] = EnumCounter(Colour)
+	counter.update_ordinals(numpy.array([[0, 2], [2, 2]], dtype=numpy.uint8))
+	counter.update_ordinals(numpy.array([], dtype=numpy.intp))
+	assert counter.counts == [1, 0, 3]
+
+	with pytest.raises(ValueError, match="ordinal out of range for Colour"):
+		counter.update_ordinals(numpy.array([0, 3]))
+
+
+def test_enum_counter_merge():
+	first = EnumCounter(Colour, [Colour.Red, Colour.Green])
+	second = EnumCounter(Colour, [Colour.Green, Colour.Blue])
+
+	assert (first + second).counts == [1, 2, 1]
+	assert EnumCounter.merge([first, second, second]).counts == [1, 3, 2]
+	assert first.counts == [1, 1, 0]
+
+	first += second
+	first.update(second)
+	assert first.counts == [1, 3, 2]
+
+	with pytest.raises(ValueError, match="no counters to merge"):
+		EnumCounter.merge([])
+
+	with pytest.raises(ValueError, match="cannot merge counters for Colour and Fruit"):
+		first + EnumCounter(Fruit)  # type: ignore[operator]  # pylint: disable=expression-not-assigned
+
+	with pytest.raises(ValueError, match="cannot merge counters for Colour and Fruit"):
+		first += EnumCounter(Fruit)  # type: ignore[arg-type]
+
+	assert first == {Colour.Red: 1, Colour.Green: 3, Colour.Blue: 2}
+	assert repr(first) == "EnumCounter(Colour, {<Colour.Red: 1>: 1, <Colour.Green: 2>: 3, <Colour.Blue: 3>: 2})"
+
+	unpickled = pickle.loads(pickle.dumps(first))
+	assert unpickled == first
+	assert unpickled.counts == first.counts
+
+
+def test_caches_do_not_keep_enums_alive():
+	Shade = IterableFlag("Shade", [("Light", 1), ("Dark", 2), ("Muted", 4)])  # type: ignore[call-arg,misc]
+
+	# Fill the caches of get_members(), flag iteration, flag formatting and enum sets.
+	assert get_members(Shade) == (Shade.Light, Shade.Dark, Shade.Muted)
+	assert list(Shade(5)) == [Shade.Muted, Shade.Light]
+	assert Shade.format(3) == "Light|Dark"
+	assert EnumSet(Shade, [Shade.Dark]) <= EnumSet(Shade, [Shade.Dark, Shade.Muted])
+
+	reference = weakref.ref(Shade)
+	del Shade
+	gc.collect()
+	assert reference() is None
@@ -0,0 +1,132 @@
+# stdlib
+from enum import Enum, Flag
+from typing import Any, Optional
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.conversion import ConversionResult, convert_values
+from enum_tools.custom_enums import IterableIntFlag
+
+
+class Status(IntEnum):
+	OK = 200
+	NOT_FOUND = 404
+	MISSING = 404
+
+
+class Colour(StrEnum):
+	RED = "red"
+	GREEN = "green"
+
+	@classmethod
+	def _missing_(cls, value: Any) -> Optional["Colour"]:
+		if isinstance(value, str) and value.islower():
+			return None
+		if value == "boom":
+			raise RuntimeError(value)
+		return cls._value2member_map_.get(value.lower())  # type: ignore[return-value]
+
+
+class Permission(IterableIntFlag):
+	READ = 4
+	WRITE = 2
+	EXECUTE = 1
+
+
+class Access(Flag):
+	READ = 4
+	WRITE = 2
+
+
+def test_convert_values():
+	result = convert_values(Status, [200, 404, 200, 999, "200", 404.0])
+
+	assert result == ConversionResult(
+			members=[Status.OK, Status.NOT_FOUND, Status.OK, None, None, Status.NOT_FOUND],
+			ordinals=[0, 1, 0, -1, -1, 1],
+			invalid=[3, 4],
+			undefined_bits={},
+			)
+	assert not result.ok
+	assert convert_values(Status, iter([200, 404])).ok
+	assert convert_values(Status, []) == ([], [], [], {})
+
+
+def test_convert_values_unhashable():
+	result = convert_values(Status, [200, [200], (200, [1]), 404])
+	assert result.members == [Status.OK, None, None, Status.NOT_FOUND]
+	assert result.invalid == [1, 2]
+
+
+def test_convert_values_missing():
+	result = convert_values(Colour, ["red", "GREEN", "blue", "boom", "Red"])
+	assert result.members == [Colour.RED, Colour.GREEN, None, None, Colour.RED]
+	assert result.invalid == [2, 3]
+
+
+def test_convert_values_flags():
+	result = convert_values(Permission, [4, 6, 0, 9, 8, -1, "4", 7])
+
+	assert result.members[:3] == [Permission.READ, Permission.READ | Permission.WRITE, Permission(0)]
+	assert result.members[-1] == Permission.READ | Permission.WRITE | Permission.EXECUTE
+	assert result.ordinals == [0, -1, -1, -1, -1, -1, -1, -1]
+	assert result.invalid == [3, 4, 5, 6]
+	assert result.undefined_bits == {3: 8, 4: 8}
+
+	# Pseudo-members with undefined bits which the enum has created are still reported.
+	Permission(9)
+	assert convert_values(Permission, [9]).undefined_bits == {0: 8}
+
+	result = convert_values(Access, [6, 1])
+	assert result.members == [Access.READ | Access.WRITE, None]
+	assert result.undefined_bits == {1: 1}
+
+
+def test_convert_values_numpy():
+	numpy = pytest.importorskip("numpy")
+
+	result = convert_values(Status, numpy.array([404, 200, 999, 404]))
+	assert result.members.tolist() == [Status.NOT_FOUND, Status.OK, None, Status.NOT_FOUND]
+	assert result.ordinals.dtype == numpy.int64
+	assert result.ordinals.tolist() == [1, 0, -1, 1]
+	assert result.invalid.dtype == numpy.intp
+	assert result.invalid.tolist() == [2]
+	assert not result.ok
+	assert convert_values(Status, numpy.array([404, 200])).ok
+
+	for dtype in (numpy.int16, numpy.uint64, numpy.float64):
+		result = convert_values(Status, numpy.array([404, 200, 999, 404], dtype=dtype))
+		assert result.members.tolist() == [Status.NOT_FOUND, Status.OK, None, Status.NOT_FOUND]
+
+	result = convert_values(Status, numpy.array([-5, 200, 1_000_000], dtype=numpy.int64))
+	assert result.invalid.tolist() == [0, 2]
+
+	result = convert_values(Colour, numpy.array(["red", "GREEN", "blue"]))
+	assert result.members.tolist() == [Colour.RED, Colour.GREEN, None]
+
+	result = convert_values(Permission, numpy.array([[4, 16], [3, 4]], dtype=numpy.uint8))
+	assert result.members.tolist() == [
+			Permission.READ,
+			None,
+			Permission.WRITE | Permission.EXECUTE,
+			Permission.READ,
+			]
+	assert result.undefined_bits == {1: 16}
+
+	result = convert_values(Status, numpy.array([200, "x", None], dtype=object))
+	assert result.members.tolist() == [Status.OK, None, None]
+	assert result.ordinals.tolist() == [0, -1, -1]
+	assert result.invalid.tolist() == [1, 2]
+
+
+class Plain(Enum):
+	A = [1, 2]
+
+
+def test_convert_values_unhashable_member_values():
+	result = convert_values(Plain, [[1, 2], [1], [1, 2]])
+	assert result.members == [Plain.A, None, Plain.A]
+	assert result.invalid == [1]
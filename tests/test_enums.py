@@ -4,15 +4,31 @@ test_enums
 """
 
 # stdlib
+import gc
+import pickle
 import sys
-from enum import Enum
+import weakref
+from array import array
+from enum import Enum, Flag, IntFlag
+from math import inf
+from typing import List, Tuple, Type
 
 # 3rd party
 import pytest
 
 # this package
 from enum_tools import IntEnum, StrEnum
-from enum_tools.custom_enums import AutoNumberEnum, IterableFlag, IterableIntFlag, MemberDirEnum, OrderedEnum
+from enum_tools.custom_enums import (
+		_FLAG_CACHE_SIZE,
+		AutoNumberEnum,
+		IdentityHashEnum,
+		IntervalEnum,
+		IterableFlag,
+		IterableIntFlag,
+		MemberDirEnum,
+		MultiValueEnum,
+		OrderedEnum
+		)
 
 NEW_ENUM_REPR = sys.version_info >= (3, 14)
 
@@ -92,6 +108,27 @@ def test_member_iter_flag():
 	assert list(Color.GREEN) == [Color.GREEN]
 
 
+@pytest.mark.parametrize("base", [IterableFlag, IterableIntFlag])
+def test_member_iter_after_composites(base: Type[Flag]):
+	Color = base("Color", [("RED", 1), ("GREEN", 2), ("BLUE", 4)])  # type: ignore[call-arg,operator]
+
+	# Composite members which have already been created are not part of the iteration.
+	assert list(Color(3)) == [Color.GREEN, Color.RED]
+	assert list(Color(7)) == [Color.BLUE, Color.GREEN, Color.RED]
+	assert list(Color(6)) == [Color.BLUE, Color.GREEN]
+
+
+@pytest.mark.parametrize("base", [IterableFlag, IterableIntFlag])
+def test_member_iter_does_not_keep_class_alive(base: Type[Flag]):
+	Color = base("Color", [("RED", 1), ("GREEN", 2), ("BLUE", 4)])  # type: ignore[call-arg,operator]
+	assert list(Color(5)) == [Color.BLUE, Color.RED]
+
+	reference = weakref.ref(Color)
+	del Color
+	gc.collect()
+	assert reference() is None
+
+
 def test_strenum():
 	# From https://github.com/python/cpython/pull/22337
 	# PSF License
@@ -234,6 +271,110 @@ def test_member_dir_enum():
 		assert dir(MyEnum) == expected_dir
 
 
+def test_member_dir_enum_members():
+
+	class Planet(MemberDirEnum):
+		Mercury = (3.303e+23, 2.4397e6)
+		Venus = (4.869e+24, 6.0518e6)
+
+		def __init__(self, mass, radius):  # noqa: MAN001
+			self.mass = mass
+			self.radius = radius
+
+	def uncached_dir(member: Planet) -> List[str]:
+		return Enum.__dir__(member) + [m for m in member.__dict__ if m[0] != '_']
+
+	assert Planet.Mercury.__dir__() == uncached_dir(Planet.Mercury)
+	assert Planet.Venus.__dir__() == uncached_dir(Planet.Venus)
+	assert Planet.Mercury.__dir__() == uncached_dir(Planet.Mercury)
+	assert "mass" in dir(Planet.Venus)
+
+	# The result is a new list each time
+	dir(Planet.Mercury).append("spam")
+	assert "spam" not in dir(Planet.Mercury)
+
+	# Members with other attributes
+	Planet.Venus.moons = 0
+	assert Planet.Venus.__dir__() == uncached_dir(Planet.Venus)
+	assert "moons" in dir(Planet.Venus)
+	assert "moons" not in dir(Planet.Mercury)
+
+	# Modifying the class invalidates the cache
+	Planet.surface_gravity = property(lambda self: 6.673e-11 * self.mass / (self.radius * self.radius))
+	assert "surface_gravity" in dir(Planet.Mercury)
+	assert Planet.Mercury.__dir__() == uncached_dir(Planet.Mercury)
+
+	del Planet.surface_gravity
+	assert "surface_gravity" not in dir(Planet.Mercury)
+
+	# Replacing one attribute with another leaves the number of attributes unchanged
+	Planet.escape_velocity = 1
+	assert "escape_velocity" in dir(Planet.Mercury)
+	del Planet.escape_velocity
+	Planet.orbital_period = 2
+	assert "escape_velocity" not in dir(Planet.Mercury)
+	assert "orbital_period" in dir(Planet.Mercury)
+
+	# Modifying a base class invalidates the cache of its subclasses
+	class Base(MemberDirEnum):
+		pass
+
+	class Moon(Base):
+		Luna = 1
+
+	assert "phase" not in dir(Moon.Luna)
+	Base.phase = 0  # type: ignore[attr-defined]
+	assert "phase" in dir(Moon.Luna)
+
+
+def test_identity_hash_enum():
+
+	class Planet(IdentityHashEnum):
+		MERCURY = 1
+		VENUS = 2
+
+	assert hash(Planet.MERCURY) == object.__hash__(Planet.MERCURY)
+	assert {Planet.MERCURY: 'a', Planet.VENUS: 'b'}[Planet.VENUS] == 'b'
+	assert Planet.MERCURY == Planet.MERCURY
+	assert Planet.MERCURY != 1
+	assert Planet(1) is Planet.MERCURY
+
+
+class IntFirst(int, IdentityHashEnum):
+	ONE = 1
+
+
+class IntLast(IdentityHashEnum, IntEnum):
+	ONE = 1
+
+
+class StrFirst(str, IdentityHashEnum):
+	ONE = "one"
+
+
+class StrLast(IdentityHashEnum, StrEnum):
+	ONE = "one"
+
+
+@pytest.mark.parametrize("enum", [IntFirst, IntLast, StrFirst, StrLast])
+def test_identity_hash_enum_mixins(enum):
+	value = enum.ONE.value
+	assert hash(enum.ONE) == hash(value)
+	assert {value: 'a'}[enum.ONE] == 'a'
+	assert enum.ONE in {value}
+
+
+def test_identity_hash_enum_override():
+
+	class Custom(IdentityHashEnum, IntEnum):
+		ONE = 1
+
+		def __hash__(self) -> int:
+			return 42
+
+	assert hash(Custom.ONE) == 42
+
+
 def test_auto_number_enum():
 
 	class MyEnum(AutoNumberEnum):
@@ -244,6 +385,133 @@ def test_auto_number_enum():
 	assert MyEnum.orange._value_ == 2
 
 
+class Country(MultiValueEnum):
+	UNITED_KINGDOM = 826, "GB", "GBR", "United Kingdom"
+	FRANCE = 250, "FR", "FRA", "France"
+	UK = 826, "GB", "GBR", "United Kingdom"
+	ANTARCTICA = 10
+
+
+def test_multi_value_enum():
+	assert list(Country) == [Country.UNITED_KINGDOM, Country.FRANCE, Country.ANTARCTICA]
+	assert Country.UK is Country.UNITED_KINGDOM
+
+	for value in Country.UNITED_KINGDOM.values:
+		assert Country(value) is Country.UNITED_KINGDOM
+
+	assert Country.FRANCE.value == 250
+	assert Country.FRANCE.values == (250, "FR", "FRA", "France")
+	assert Country.ANTARCTICA.values == (10, )
+	assert pickle.loads(pickle.dumps(Country.FRANCE)) is Country.FRANCE
+
+	with pytest.raises(ValueError, match="'DE' is not a valid Country"):
+		Country("DE")
+
+
+def test_multi_value_enum_mixin():
+
+	class Code(int, MultiValueEnum):
+		OK = 200, "ok"
+
+	assert Code("ok") is Code.OK
+	assert Code.OK == 200
+	assert Code.OK.values == (200, "ok")
+
+
+def test_multi_value_enum_conflicts():
+	with pytest.raises(ValueError, match="'B' has the value 'x', which is already used by 'A'"):
+
+		class Shared(MultiValueEnum):
+			A = 1, 'x'
+			B = 2, 'x'
+
+	with pytest.raises(ValueError, match="'B' has the value 1, which is already used by 'A'"):
+
+		class Partial(MultiValueEnum):
+			A = 1, 2
+			B = 1, 3
+
+	with pytest.raises(ValueError, match="'A' has duplicate values"):
+
+		class Duplicate(MultiValueEnum):
+			A = 1, 1
+
+	with pytest.raises(ValueError, match="the values of 'A' must be hashable"):
+
+		class Unhashable(MultiValueEnum):
+			A = 1, []
+
+
+class StatusClass(IntervalEnum):
+	INFORMATIONAL = 100, 200
+	SERVER_ERROR = 500, inf
+	SUCCESS = 200, 300
+	REDIRECTION = 300, 400
+	CLIENT_ERROR = 400, 500
+	OK = 200, 300
+
+
+def test_interval_enum():
+	assert StatusClass(100) is StatusClass.INFORMATIONAL
+	assert StatusClass(204) is StatusClass.SUCCESS
+	assert StatusClass(299.5) is StatusClass.SUCCESS
+	assert StatusClass(300) is StatusClass.REDIRECTION
+	assert StatusClass(10**6) is StatusClass.SERVER_ERROR
+	assert StatusClass((200, 300)) is StatusClass.SUCCESS
+	assert StatusClass.OK is StatusClass.SUCCESS
+
+	assert StatusClass.lookup(404) is StatusClass.CLIENT_ERROR
+	assert StatusClass.lookup(99) is None
+	assert StatusClass.lookup("404") is None
+
+	with pytest.raises(ValueError, match="99 is not a valid StatusClass"):
+		StatusClass(99)
+
+	assert (StatusClass.SUCCESS.lower, StatusClass.SUCCESS.upper) == (200, 300)
+	assert StatusClass.SUCCESS < StatusClass.SERVER_ERROR
+	assert max(StatusClass) is StatusClass.SERVER_ERROR
+
+
+def test_interval_enum_lookup_array():
+	pytest.importorskip("numpy")
+
+	array = StatusClass.lookup_array([100, 204, 599, 1000, 404])
+	assert array.tolist() == [
+			StatusClass.INFORMATIONAL,
+			StatusClass.SUCCESS,
+			StatusClass.SERVER_ERROR,
+			StatusClass.SERVER_ERROR,
+			StatusClass.CLIENT_ERROR,
+			]
+
+	with pytest.raises(ValueError, match="50 is not in the interval of any member of StatusClass"):
+		StatusClass.lookup_array([100, 50])
+
+
+def test_interval_enum_validation():
+	with pytest.raises(ValueError, match="the interval of 'B' overlaps with the interval of 'A'"):
+
+		class Overlapping(IntervalEnum):
+			A = 0, 10
+			B = 5, 15
+
+	with pytest.raises(ValueError, match="the interval of 'B' overlaps with the interval of 'A'"):
+
+		class Containing(IntervalEnum):
+			A = 0, 10
+			B = -5, 15
+
+	with pytest.raises(ValueError, match="the lower bound of 'A' must be less than its upper bound"):
+
+		class Empty(IntervalEnum):
+			A = 10, 10
+
+	with pytest.raises(ValueError, match=r"'A' must be assigned a \(lower, upper\) tuple"):
+
+		class Scalar(IntervalEnum):
+			A = 10
+
+
 def test_ordered_enum():
 
 	class MyEnum(OrderedEnum):
@@ -262,3 +530,288 @@ def test_ordered_enum():
 
 	with pytest.raises(TypeError, match="'<' not supported between instances of 'MyEnum2' and 'MyEnum2'"):
 		MyEnum2.apple < MyEnum2.orange  # type: ignore[operator]  # pylint: disable=pointless-statement
+
+
+class StatusCode(IntEnum):
+	Continue = 100
+	OK = 200
+	Created = 201
+	Accepted = 202
+	NotFound = 404
+	Okay = 200
+
+
+class Sparse(IntEnum):
+	Small = -5
+	Large = 1_000_000
+
+
+@pytest.mark.parametrize("enum", [StatusCode, Sparse, Numbers])
+def test_from_int(enum):
+	for member in enum.__members__.values():
+		assert enum.from_int(member.value) is member
+
+	assert enum.from_ints([member.value for member in enum]) == list(enum)
+	assert enum.from_ints(array('i', [member.value for member in enum])) == list(enum)
+	assert enum.from_ints(member.value for member in enum) == list(enum)
+	assert enum.from_ints([]) == []
+
+	with pytest.raises(ValueError, match=f"7 is not a valid {enum.__qualname__}"):
+		enum.from_int(7)
+
+	with pytest.raises(ValueError, match=f"7 is not a valid {enum.__qualname__}"):
+		enum.from_ints([member.value for member in enum] + [7])
+
+	with pytest.raises(ValueError, match=f"1000000000 is not a valid {enum.__qualname__}"):
+		enum.from_ints([member.value for member in enum] + [1_000_000_000])
+
+
+def test_from_int_base_class():
+	# The exception depends on the Python version
+	with pytest.raises((ValueError, TypeError)):
+		IntEnum.from_int(1)
+
+	assert IntEnum.from_ints([]) == []
+	assert "from_int" not in IntEnum.__dict__ or isinstance(IntEnum.__dict__["from_int"], classmethod)
+
+
+def test_from_int_numpy():
+	numpy = pytest.importorskip("numpy")
+	assert StatusCode.from_ints(numpy.array([200, 404, 100])) == [StatusCode.OK, StatusCode.NotFound, StatusCode.Continue]
+
+
+def test_from_int_flag():
+
+	class Permissions(IterableIntFlag):
+		Read = 4
+		Write = 2
+		Execute = 1
+
+	assert Permissions.from_int(4) is Permissions.Read
+	assert Permissions.from_int(6) is Permissions.Read | Permissions.Write
+	assert Permissions.from_ints([1, 2, 3]) == [Permissions.Execute, Permissions.Write, Permissions(3)]
+
+
+class Access(Flag):
+	Read = 4
+	Write = 2
+
+
+class Colour(IterableFlag):
+	BLACK = 0
+	RED = 1
+	GREEN = 2
+	BLUE = 4
+	PURPLE = RED | BLUE
+
+
+class IntColour(IterableIntFlag):
+	BLACK = 0
+	RED = 1
+	GREEN = 2
+	BLUE = 4
+	PURPLE = RED | BLUE
+
+
+@pytest.mark.parametrize("enum", [Colour, IntColour])
+def test_flag_len_contains(enum):
+	assert len(enum.BLACK) == 0
+	assert len(enum.RED) == 1
+	assert len(enum.PURPLE) == 2
+	assert len(enum.PURPLE | enum.GREEN) == 3
+
+	assert enum.RED in enum.PURPLE
+	assert enum.BLUE in enum.PURPLE
+	assert enum.PURPLE in enum.PURPLE
+	assert enum.BLACK in enum.PURPLE
+	assert enum.GREEN not in enum.PURPLE
+	assert enum.RED | enum.GREEN not in enum.PURPLE
+	assert 4 in enum.PURPLE
+	assert 5 in enum.PURPLE
+	assert 2 not in enum.PURPLE
+
+	with pytest.raises(TypeError, match="unsupported operand type"):
+		"RED" in enum.PURPLE  # pylint: disable=pointless-statement
+
+	with pytest.raises(TypeError, match="unsupported operand type"):
+		Access.Read in enum.PURPLE  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("enum", [Colour, IntColour])
+def test_flag_subset(enum):
+	assert enum.RED.issubset(enum.PURPLE)
+	assert enum.PURPLE.issubset(enum.PURPLE)
+	assert enum.PURPLE.issubset(7)
+	assert not enum.PURPLE.issubset(enum.RED)
+	assert enum.PURPLE.issuperset(enum.RED)
+	assert enum.PURPLE.issuperset(1)
+	assert not enum.RED.issuperset(enum.PURPLE)
+	assert enum.BLACK.issubset(enum.RED)
+
+	with pytest.raises(TypeError, match="unsupported operand type"):
+		enum.RED.issubset(Access.Read)
+
+
+def test_flag_comparison():
+	assert Colour.RED <= Colour.PURPLE
+	assert Colour.RED < Colour.PURPLE
+	assert Colour.PURPLE <= Colour.PURPLE
+	assert not Colour.PURPLE < Colour.PURPLE
+	assert Colour.PURPLE >= Colour.BLUE
+	assert Colour.PURPLE > Colour.BLUE
+	assert not Colour.PURPLE > Colour.PURPLE
+	assert not Colour.GREEN <= Colour.PURPLE
+	assert not Colour.GREEN >= Colour.PURPLE
+
+	with pytest.raises(TypeError):
+		Colour.RED <= 1  # pylint: disable=pointless-statement
+
+	# IterableIntFlag keeps the ordering of int
+	assert IntColour.GREEN < IntColour.PURPLE
+	assert not IntColour.GREEN.issubset(IntColour.PURPLE)
+
+
+@pytest.mark.parametrize("enum", [Colour, IntColour])
+def test_flag_parse_format(enum):
+	assert enum.parse("RED|BLUE") is enum.PURPLE
+	assert enum.parse(" GREEN | RED ") == enum.RED | enum.GREEN
+	assert enum.parse("PURPLE|GREEN") == enum.RED | enum.GREEN | enum.BLUE
+	assert enum.parse("") is enum.BLACK
+	assert enum.parse("RED,0x2", sep=',') == enum.RED | enum.GREEN
+	assert enum.parse("RED|2") == enum.RED | enum.GREEN
+
+	with pytest.raises(ValueError, match=f"'ORANGE' is not a valid {enum.__qualname__} member name"):
+		enum.parse("RED|ORANGE")
+
+	assert enum.format(enum.PURPLE) == "PURPLE"
+	assert enum.format(enum.RED | enum.GREEN) == "RED|GREEN"
+	assert enum.format(enum.RED | enum.GREEN | enum.BLUE, sep=", ") == "RED, GREEN, BLUE"
+	assert enum.format(enum.BLACK) == "BLACK"
+	assert enum.format(3) == "RED|GREEN"
+
+	for value in range(8):
+		assert enum.parse(enum.format(value)) is enum(value)
+
+	with pytest.raises(TypeError, match=f"'RED' is not a {enum.__qualname__} or an int"):
+		enum.format("RED")
+
+	with pytest.raises(TypeError, match=f"is not a {enum.__qualname__} or an int"):
+		enum.format(Access.Read)
+
+
+def test_flag_format_unnamed_bits():
+	assert IntColour.format(IntColour.RED | 8) == "RED|0x8"
+	assert IntColour.parse("RED|0x8") == 9
+
+
+def test_flag_cache_info():
+
+	class Mode(IterableFlag):
+		Read = 4
+		Write = 2
+
+	assert Mode.cache_info()["parse"].currsize == 0
+
+	for _ in range(3):
+		Mode.parse("Read|Write")
+		Mode.format(Mode.Read | Mode.Write)
+
+	info = Mode.cache_info()
+	assert (info["parse"].hits, info["parse"].misses) == (2, 1)
+	assert (info["format"].hits, info["format"].misses) == (2, 1)
+	assert Mode.cache_info(sep=',')["parse"].currsize == 0
+
+
+class PlainIntEnum(int, Enum):
+	pass
+
+
+class PlainStrEnum(str, Enum):
+
+	def __str__(self) -> str:
+		return self.value
+
+
+def _string_enums(int_enum: Type[Enum], str_enum: Type[Enum], flag: Type[Flag], int_flag: Type[Flag]) -> List[Enum]:
+	"""
+	Returns members and composite flags of enums with the given bases, whose output can be compared.
+	"""
+
+	class Number(int_enum):  # type: ignore[valid-type,misc]
+		One = 1
+		Two = 2
+		Uno = 1
+
+	class Text(str_enum):  # type: ignore[valid-type,misc]
+		A = "alpha"
+		B = "beta"
+
+	class Mode(flag):  # type: ignore[valid-type,misc]
+		Read = 4
+		Write = 2
+		ReadWrite = 6
+
+	class Colour(int_flag):  # type: ignore[valid-type,misc]
+		RED = 1
+		GREEN = 2
+		BLUE = 4
+
+	return [
+			*Number,
+			Number.Uno,
+			*Text,
+			*Mode,
+			Mode(0),
+			Mode.Read | Mode.Write,
+			*Colour,
+			Colour(0),
+			Colour.RED | Colour.BLUE,
+			Colour(9),
+			]
+
+
+def _outputs(members: List[Enum]) -> List[Tuple[str, ...]]:
+	return [(str(m), repr(m), format(m), f"{m}", f"{m:>20}", "%s" % m, f"{m!r:>30}") for m in members]
+
+
+def test_cached_strings():
+	expected = _outputs(_string_enums(PlainIntEnum, PlainStrEnum, Flag, IntFlag))
+	members = _string_enums(IntEnum, StrEnum, IterableFlag, IterableIntFlag)
+
+	# The output is the same as without caching, both the first time and once it has been cached.
+	assert _outputs(members) == expected
+	assert _outputs(members) == expected
+
+	number, text = members[0], members[3]
+	assert number.__dict__["_repr_"] == repr(number)
+	assert number.__dict__["_format_"] == format(number)
+	assert text.__dict__["_str_"] == str(text)
+
+
+def test_cached_strings_overridden():
+	count = 0
+
+	class Counted(StrEnum):
+		A = "alpha"
+
+		def __str__(self) -> str:
+			nonlocal count
+			count += 1
+			return f"{self.value} {count}"
+
+	# Output which depends on an overridden method is not cached, as it may change.
+	assert [f"{Counted.A}", f"{Counted.A}", str(Counted.A)] == ["alpha 1", "alpha 2", "alpha 3"]
+	assert "_format_" not in Counted.A.__dict__
+
+
+def test_cached_strings_composites():
+	Wide = IterableFlag("Wide", [(f"BIT_{idx}", 1 << idx) for idx in range(12)])  # type: ignore[call-arg,misc]
+
+	for value in range(_FLAG_CACHE_SIZE + 100):
+		assert str(Wide(value)) == Flag.__str__(Wide(value))
+		assert repr(Wide(value)) == Flag.__repr__(Wide(value))
+
+	# Only a limited number of strings are stored on composite flags.
+	assert (Wide.BIT_0 | Wide.BIT_1).__dict__["_str_"] == str(Wide.BIT_0 | Wide.BIT_1)
+	assert Wide._string_cache_.composites == _FLAG_CACHE_SIZE  # type: ignore[attr-defined]
+	assert sum("_str_" in Wide(value).__dict__ for value in range(1 << 12)) <= _FLAG_CACHE_SIZE + 12
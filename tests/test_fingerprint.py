@@ -0,0 +1,113 @@
+# stdlib
+from datetime import datetime, timedelta, timezone, tzinfo
+from decimal import Decimal
+from enum import Enum, Flag, IntEnum
+from pathlib import PurePosixPath
+from typing import Optional
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import StrEnum
+from enum_tools.fingerprint import Compatibility, check_compatibility, encode_value, get_fingerprint
+
+
+class Colour(Enum):
+	RED = 1
+	GREEN = (2, "green")
+	BLUE = frozenset({3, 4})
+	CRIMSON = 1
+
+
+class _Zone(tzinfo):
+
+	def utcoffset(self, dt: Optional[datetime]) -> timedelta:
+		return timedelta(hours=1)
+
+
+def make_colour(members, name: str = "Colour", type=Enum):  # noqa: MAN001,MAN002
+	return type(name, members, module="somewhere.else")  # type: ignore[call-overload]
+
+
+def test_get_fingerprint():
+	fingerprint = get_fingerprint(Colour)
+	assert len(fingerprint) == 32
+	assert get_fingerprint(Colour) is fingerprint
+
+	# Fingerprints don't depend on the module, or the order of set elements.
+	assert get_fingerprint(
+			make_colour([("RED", 1), ("GREEN", (2, "green")), ("BLUE", frozenset({4, 3})), ("CRIMSON", 1)])
+			) == fingerprint
+
+	# The encoding is stable across processes and versions.
+	assert get_fingerprint(make_colour([("RED", 1), ("GREEN", 2)])) == "ef3b383543ba0a4e81a93444d7cf62fb"
+
+
+@pytest.mark.parametrize(
+		"members, name, type",
+		[
+				pytest.param([("RED", 1), ("GREEN", 2)], "Colour", Enum, id="removed alias"),
+				pytest.param([("GREEN", 2), ("RED", 1)], "Colour", Enum, id="reordered"),
+				pytest.param([("RED", 1), ("GREEN", 3)], "Colour", Enum, id="value"),
+				pytest.param([("RED", 1), ("GREEN", "2")], "Colour", Enum, id="value type"),
+				pytest.param([("RED", 1), ("GREN", 2)], "Colour", Enum, id="name"),
+				pytest.param([("RED", 1), ("GREEN", 2)], "Color", Enum, id="enum name"),
+				pytest.param([("RED", 1), ("GREEN", 2)], "Colour", IntEnum, id="base type"),
+				pytest.param([("RED", 1), ("GREEN", 2)], "Colour", Flag, id="flag"),
+				],
+		)
+def test_get_fingerprint_changes(members, name: str, type):  # noqa: MAN001
+	original = make_colour([("RED", 1), ("GREEN", 2), ("CRIMSON", 1)])
+	assert get_fingerprint(make_colour(members, name, type)) != get_fingerprint(original)
+
+
+def test_encode_value():
+	assert encode_value({"a": 1, "b": [None, 1.5]}) == encode_value({"b": [None, 1.5], "a": 1})
+	assert encode_value((1, 2)) != encode_value([1, 2])
+	assert encode_value(1) != encode_value(True) != encode_value(1.0)
+	assert encode_value(("ab", "c")) != encode_value(("a", "bc"))
+	assert encode_value(Colour.RED) == encode_value(Colour.CRIMSON)
+	assert encode_value(b"ab") != encode_value("ab")
+
+	assert encode_value(Decimal("1.5")) == encode_value(Decimal("1.5")) != encode_value(Decimal("1.50"))
+	assert encode_value(datetime(2020, 1, 1, tzinfo=timezone.utc)) != encode_value(datetime(2020, 1, 1))
+	assert encode_value(PurePosixPath("a/b")) != encode_value("a/b")
+
+	with pytest.raises(TypeError, match="cannot fingerprint values of type object"):
+		encode_value(object())
+
+	# The repr() of these includes their address, so would change in every process.
+	with pytest.raises(TypeError, match="cannot fingerprint values of type function"):
+		encode_value(lambda: None)
+
+	with pytest.raises(TypeError, match="cannot fingerprint values of type _Zone"):
+		encode_value(_Zone())
+
+	with pytest.raises(TypeError, match="cannot fingerprint values of type datetime"):
+		encode_value(datetime(2020, 1, 1, tzinfo=_Zone()))
+
+	with pytest.raises(TypeError, match="cannot fingerprint values of type object"):
+		get_fingerprint(make_colour([("A", object())]))
+
+	with pytest.raises(TypeError, match="not an Enum"):
+		get_fingerprint(int)  # type: ignore[arg-type]
+
+
+def test_check_compatibility():
+	class Level(StrEnum):
+		DEBUG = "debug"
+		INFO = "info"
+		ERROR = "error"
+
+	assert check_compatibility(Level, Level) == Compatibility((), (), {})
+	assert check_compatibility(["DEBUG", "INFO"], Level).compatible
+
+	result = check_compatibility(["INFO", "WARNING", "ERROR"], Level)
+	assert result == Compatibility(added=("DEBUG", ), removed=("WARNING", ), renumbered={"INFO": (0, 1)})
+	assert not result.compatible
+
+	with pytest.raises(TypeError, match="not a string"):
+		check_compatibility("DEBUG", Level)
+	with pytest.raises(TypeError, match="not an Enum"):
+		check_compatibility(int, Level)  # type: ignore[arg-type]
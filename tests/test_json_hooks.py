@@ -0,0 +1,131 @@
+# stdlib
+import json
+from enum import Enum, Flag, IntFlag
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import StrEnum
+from enum_tools.custom_enums import IterableFlag
+from enum_tools.json_hooks import EnumDecoder, EnumEncoder, EnumJSONEncoder, make_object_hook
+
+
+class Colour(Enum):
+	Red = 1
+	Green = 2
+	Blue = 3
+	Rouge = 1
+
+
+class Point(Enum):
+	Origin = (0, 0)
+	Unit = (1, 1)
+
+
+class Permissions(IterableFlag):
+	Nothing = 0
+	Read = 4
+	Write = 2
+	Execute = 1
+	ReadWrite = 6
+
+
+class Planet(StrEnum):
+	Mercury = "mercury"
+
+
+def test_encode():
+	payload = {"colour": Colour.Rouge, "colours": [Colour.Blue, Colour.Green], "point": Point.Unit}
+	assert json.dumps(payload, default=EnumEncoder()) == '{"colour": 1, "colours": [3, 2], "point": [1, 1]}'
+	assert json.dumps(payload, cls=EnumJSONEncoder) == '{"colour": 1, "colours": [3, 2], "point": [1, 1]}'
+
+	assert json.dumps(Planet.Mercury, default=EnumEncoder()) == '"mercury"'
+
+
+@pytest.mark.parametrize(
+		"member, names, integer",
+		[
+				(Permissions.Read, ["Read"], 4),
+				(Permissions.Nothing, ["Nothing"], 0),
+				(Permissions.ReadWrite, ["ReadWrite"], 6),
+				(Permissions.Read | Permissions.Execute, ["Read", "Execute"], 5),
+				(Permissions.Read | Permissions.Write | Permissions.Execute, ["Read", "Write", "Execute"], 7),
+				],
+		)
+def test_encode_flags(member: Permissions, names, integer: int):
+	encoder = EnumEncoder()
+	assert encoder(member) == names
+	assert encoder(member) == names
+	assert EnumEncoder(flags_as="int")(member) == integer
+	assert json.loads(json.dumps(member, cls=EnumJSONEncoder, flags_as="int")) == integer
+
+	decoder = EnumDecoder(Permissions)
+	assert decoder(names) is member
+	assert decoder(integer) is member
+
+
+def test_encode_unknown_bits():
+
+	class Open(IntFlag):
+		Read = 1
+		Write = 2
+
+	assert EnumEncoder()(Open(9)) == ["Read", 8]
+	assert EnumDecoder(Open)(["Read", 8]) is Open(9)
+
+
+def test_encode_errors():
+	with pytest.raises(TypeError, match="Object of type object is not JSON serializable"):
+		json.dumps(object(), default=EnumEncoder())
+
+	with pytest.raises(TypeError, match="Object of type object is not JSON serializable"):
+		json.dumps(object(), cls=EnumJSONEncoder)
+
+	assert json.dumps({1, 2}, default=EnumEncoder(fallback=sorted)) == "[1, 2]"
+
+	with pytest.raises(ValueError, match="'flags_as' must be 'names' or 'int', not 'bits'"):
+		EnumEncoder(flags_as="bits")  # type: ignore[arg-type]
+
+
+def test_decode():
+	decoder = EnumDecoder(Colour)
+	assert decoder(1) is Colour.Red
+	assert decoder(3) is Colour.Blue
+	assert EnumDecoder(Point)([1, 1]) is Point.Unit
+
+	with pytest.raises(ValueError, match="4 is not a valid Colour"):
+		decoder(4)
+
+	with pytest.raises(ValueError, match="'Delete' is not a valid Permissions member name"):
+		EnumDecoder(Permissions)(["Read", "Delete"])
+
+
+def test_decode_cache_is_bounded():
+	Bits = IntFlag("Bits", [(f"B{bit}", 1 << bit) for bit in range(16)])
+	decoder = EnumDecoder(Bits)
+
+	for value in range(1 << 12):
+		assert decoder(value) == Bits(value)
+		assert decoder([value]) == Bits(value)
+
+	assert len(decoder._table) <= len(Bits.__members__) + 1024
+	assert len(decoder._lists) <= 1024
+	assert decoder(1) is Bits.B0
+
+
+def test_object_hook():
+	hook = make_object_hook({"colour": Colour, "permissions": Permissions})
+	data = '[{"colour": 2, "permissions": ["Read", "Write"]}, {"colour": 3, "other": 1}]'
+
+	assert json.loads(data, object_hook=hook) == [
+			{"colour": Colour.Green, "permissions": Permissions.ReadWrite},
+			{"colour": Colour.Blue, "other": 1},
+			]
+
+	hook = make_object_hook({"colour": Colour}, object_hook=lambda obj: obj["colour"])
+	assert json.loads(data, object_hook=hook) == [Colour.Green, Colour.Blue]
+
+	payload = {"colour": Colour.Red, "permissions": Permissions.Read | Permissions.Execute}
+	hook = make_object_hook({"colour": Colour, "permissions": Permissions})
+	assert json.loads(json.dumps(payload, cls=EnumJSONEncoder), object_hook=hook) == payload
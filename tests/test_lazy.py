@@ -0,0 +1,145 @@
+# stdlib
+import copy
+import pickle
+import threading
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools.lazy import LazyEnum
+
+
+class ErrorCode(LazyEnum):
+	_table_ = (
+			("NOT_FOUND", 404),
+			("TEAPOT", 418),
+			("name", 500),
+			)
+
+
+Catalogue = LazyEnum("Catalogue", {f"ITEM_{idx}": idx for idx in range(1000)})
+
+
+def test_lazy_enum():
+	teapot = ErrorCode.TEAPOT
+	assert isinstance(teapot, ErrorCode)
+	assert teapot.name == "TEAPOT"
+	assert teapot.value == 418
+	assert ErrorCode["TEAPOT"] is teapot
+	assert ErrorCode(418) is teapot
+	assert ErrorCode(teapot) is teapot
+	assert teapot in ErrorCode
+	assert 418 not in ErrorCode
+
+	assert repr(teapot) == "<ErrorCode.TEAPOT: 418>"
+	assert str(teapot) == "ErrorCode.TEAPOT"
+	assert f"{teapot:>18}" == "  ErrorCode.TEAPOT"
+	assert repr(ErrorCode) == "<lazy enum 'ErrorCode'>"
+
+	# Members which clash with attributes of the class are still accessible
+	assert ErrorCode.name.value == 500
+	assert ErrorCode.name.name == "name"
+	assert ErrorCode.name is ErrorCode(500)
+
+	assert list(ErrorCode) == [ErrorCode.NOT_FOUND, ErrorCode.TEAPOT, ErrorCode.name]
+	assert list(reversed(ErrorCode)) == [ErrorCode.name, ErrorCode.TEAPOT, ErrorCode.NOT_FOUND]
+	assert len(ErrorCode) == 3
+	assert dict(ErrorCode.__members__) == {
+			"NOT_FOUND": ErrorCode.NOT_FOUND,
+			"TEAPOT": ErrorCode.TEAPOT,
+			"name": ErrorCode.name,
+			}
+	assert "TEAPOT" in dir(ErrorCode)
+
+
+def test_lazy_enum_creates_members_on_access():
+	# A new enum, as other tests create members of the module-level one
+	Catalogue = LazyEnum("Catalogue", {f"ITEM_{idx}": idx for idx in range(1000)})
+
+	assert not Catalogue._member_cache_
+	assert Catalogue._value_index_ is None
+
+	item = Catalogue.ITEM_10
+	assert list(Catalogue._member_cache_) == ["ITEM_10"]
+	assert Catalogue._value_index_ is None
+
+	assert Catalogue(20) is Catalogue.ITEM_20
+	assert Catalogue._value_index_ is not None
+	assert len(Catalogue._member_cache_) == 2
+
+	assert Catalogue.ITEM_10 is item
+	assert Catalogue.__dict__["ITEM_10"] is item
+
+
+def test_lazy_enum_errors():
+	with pytest.raises(AttributeError, match="MISSING"):
+		ErrorCode.MISSING  # pylint: disable=pointless-statement
+
+	with pytest.raises(KeyError, match="MISSING"):
+		ErrorCode["MISSING"]  # pylint: disable=pointless-statement
+
+	with pytest.raises(ValueError, match="200 is not a valid ErrorCode"):
+		ErrorCode(200)
+
+	with pytest.raises(ValueError, match=r"\[\] is not a valid ErrorCode"):
+		ErrorCode([])
+
+	with pytest.raises(AttributeError, match="cannot reassign member 'TEAPOT'"):
+		ErrorCode.TEAPOT = 1
+
+	with pytest.raises(AttributeError, match="cannot delete member 'TEAPOT'"):
+		del ErrorCode.TEAPOT
+
+	with pytest.raises(TypeError, match="Extended: cannot extend <lazy enum 'ErrorCode'>"):
+
+		class Extended(ErrorCode):
+			pass
+
+	with pytest.raises(TypeError, match="Duplicate: duplicate member names"):
+		LazyEnum("Duplicate", [("A", 1), ("A", 2)])
+
+	with pytest.raises(ValueError, match="Alias: duplicate values are not supported"):
+		LazyEnum("Alias", [("A", 1), ("B", 1)])
+
+	with pytest.raises(ValueError, match="Private: invalid member name '_A'"):
+		LazyEnum("Private", [("_A", 1)])
+
+
+def test_lazy_enum_missing():
+
+	class Status(LazyEnum):
+		_table_ = {"OK": 200, "UNKNOWN": 0}
+
+		@classmethod
+		def _missing_(cls, value):  # noqa: MAN001,MAN002
+			return cls.UNKNOWN
+
+	assert Status(999) is Status.UNKNOWN
+
+
+def test_lazy_enum_pickle_copy():
+	for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+		assert pickle.loads(pickle.dumps(ErrorCode.TEAPOT, protocol=protocol)) is ErrorCode.TEAPOT
+		assert pickle.loads(pickle.dumps(Catalogue.ITEM_999, protocol=protocol)) is Catalogue.ITEM_999
+
+	assert copy.copy(ErrorCode.TEAPOT) is ErrorCode.TEAPOT
+	assert copy.deepcopy([ErrorCode.TEAPOT])[0] is ErrorCode.TEAPOT
+	assert Catalogue.__module__ == __name__
+
+
+def test_lazy_enum_threads():
+	Concurrent = LazyEnum("Concurrent", [(f"M_{idx}", idx) for idx in range(200)])
+	results = []
+
+	def worker() -> None:
+		results.append([Concurrent[f"M_{idx}"] for idx in range(200)])
+
+	threads = [threading.Thread(target=worker) for _ in range(8)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+
+	for result in results:
+		assert all(map(lambda a, b: a is b, result, results[0]))
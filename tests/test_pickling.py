@@ -0,0 +1,143 @@
+# stdlib
+import copyreg
+import pickle
+from enum import Enum, Flag
+
+# 3rd party
+import pytest
+
+# this package
+import enum_tools.pickling
+from enum_tools import IntEnum, StrEnum
+from enum_tools.pickling import (
+		_members,
+		_registry,
+		export_registry,
+		get_key,
+		install_registry,
+		register,
+		resolve,
+		set_extension_code
+		)
+
+
+@register
+class Planet(StrEnum):
+	Mercury = "mercury"
+	Venus = "venus"
+	Earth = "earth"
+
+
+@register(key=1)
+class Permissions(Flag):
+	Read = 4
+	Write = 2
+	Execute = 1
+
+
+def test_static_enum():
+	assert get_key(Planet) == "tests.test_pickling:Planet"
+
+	data = pickle.dumps([Planet.Earth, Planet.Mercury, Planet.Earth])
+	assert b"earth" not in data
+	assert pickle.loads(data) == [Planet.Earth, Planet.Mercury, Planet.Earth]
+	assert pickle.loads(data)[0] is Planet.Earth
+
+
+class Unregistered(Flag):
+	Read = 4
+	Write = 2
+	Execute = 1
+
+
+def test_extension_code(monkeypatch):
+	monkeypatch.setattr(enum_tools.pickling, "_extension_code", None)
+
+	set_extension_code(230)
+	set_extension_code(230)
+
+	try:
+		assert len(pickle.dumps(Permissions.Read)) < len(pickle.dumps(Unregistered.Read)) / 2
+		assert pickle.loads(pickle.dumps(Permissions.Read)) is Permissions.Read
+		assert export_registry()["extension_code"] == 230
+
+		with pytest.raises(ValueError, match="The extension code has already been set to 230"):
+			set_extension_code(231)
+
+	finally:
+		copyreg.remove_extension("enum_tools.pickling", "_load_member", 230)
+		copyreg.remove_extension("enum_tools.pickling", "_load_value", 231)
+
+	monkeypatch.setattr(enum_tools.pickling, "_extension_code", None)
+	copyreg.add_extension("tests.test_pickling", "Unregistered", 241)
+
+	try:
+		with pytest.raises(ValueError, match="code 241 is already in use for key"):
+			set_extension_code(240)
+
+		assert 240 not in copyreg._inverted_registry  # type: ignore[attr-defined]
+	finally:
+		copyreg.remove_extension("tests.test_pickling", "Unregistered", 241)
+
+
+def test_integer_key():
+	assert pickle.loads(pickle.dumps(Permissions.Write)) is Permissions.Write
+
+	composite = Permissions.Read | Permissions.Write
+	assert pickle.loads(pickle.dumps(composite)) is composite
+
+
+def test_resolve_imports(monkeypatch):
+	monkeypatch.delitem(_registry, "tests.test_pickling:Planet")
+	monkeypatch.delitem(_members, "tests.test_pickling:Planet")
+	assert resolve("tests.test_pickling:Planet") is Planet
+
+	with pytest.raises(KeyError):
+		resolve("tests.test_pickling:DoesNotExist")
+
+	with pytest.raises(KeyError):
+		resolve(12345)
+
+
+@pytest.mark.usefixtures("pickling_registry")
+def test_dynamic_enum():
+	Colour = register(IntEnum("Colour", [("Red", 1), ("Green", 2), ("Blue", 3), ("Rouge", 1)]), key="colour")
+
+	data = pickle.dumps([Colour.Blue, Colour.Rouge])  # type: ignore[attr-defined]
+	assert pickle.loads(data) == [Colour.Blue, Colour.Red]  # type: ignore[attr-defined]
+
+	state = export_registry()
+	assert "colour" in [entry[0] for entry in state["enums"]]
+	state = pickle.loads(pickle.dumps(state))
+
+	# Simulate a fresh worker process
+	del _registry["colour"]
+	del _members["colour"]
+	install_registry(state)
+
+	new_colour = resolve("colour")
+	assert new_colour is not Colour
+	assert list(new_colour.__members__) == ["Red", "Green", "Blue", "Rouge"]
+	assert [member.name for member in pickle.loads(data)] == ["Blue", "Red"]
+
+
+@pytest.mark.usefixtures("pickling_registry")
+def test_register_errors():
+
+	class Fruit(Enum):
+		Apple = 1
+
+	with pytest.raises(ValueError, match="The key 1 is already registered for <flag 'Permissions'>"):
+		register(Fruit, key=1)
+
+	register(Fruit, key="fruit")
+	assert register(Fruit, key="fruit") is Fruit
+
+	with pytest.raises(ValueError, match="is already registered with the key 'fruit'"):
+		register(Fruit, key="another_fruit")
+
+	with pytest.raises(TypeError, match="'enum' must be an 'Enum', not <class 'type'>!"):
+		register(int)  # type: ignore[type-var]
+
+	_registry.pop("fruit")
+	_members.pop("fruit")
@@ -0,0 +1,92 @@
+# stdlib
+import multiprocessing
+import pickle
+from enum import Enum
+
+# 3rd party
+import pytest
+
+pytest.importorskip("multiprocessing.shared_memory")
+numpy = pytest.importorskip("numpy")
+
+# this package
+from enum_tools.arrays import EnumArray  # noqa: E402
+from enum_tools.containers import EnumCounter  # noqa: E402
+from enum_tools.shared import SharedEnumArray  # noqa: E402
+
+
+class Colour(Enum):
+	Red = 1
+	Green = 2
+	Blue = 3
+
+
+def count(shared: SharedEnumArray) -> EnumCounter:
+	with shared:
+		assert not shared.owner
+		array = shared.array
+		counts = array[1:].value_counts()
+		del array
+		return counts
+
+
+def test_shared_enum_array():
+	array = EnumArray.from_members(Colour, [Colour.Red, Colour.Green, Colour.Blue, Colour.Blue] * 100)
+
+	with SharedEnumArray.create(array) as shared:
+		assert shared.owner
+		assert shared.enum is Colour
+		assert len(shared) == 400
+		assert repr(shared) == f"<SharedEnumArray {shared.name!r} of 400 Colour members>"
+
+		view = shared.array
+		assert view.tolist() == array.tolist()
+		assert not view.codes.flags.writeable
+		del view
+
+		with SharedEnumArray.attach(shared.name, Colour) as attached:
+			assert not attached.owner
+			assert attached.array.tolist() == array.tolist()
+
+		with pickle.loads(pickle.dumps(shared)) as unpickled:
+			assert unpickled.name == shared.name
+			assert len(unpickled) == 400
+
+		name = shared.name
+
+	with pytest.raises(FileNotFoundError):
+		SharedEnumArray.attach(name, Colour)
+
+
+def test_shared_enum_array_pool():
+	array = EnumArray.from_members(Colour, [Colour.Red, Colour.Green, Colour.Blue, Colour.Blue] * 100)
+
+	with SharedEnumArray.create(array) as shared, multiprocessing.Pool(2) as pool:
+		results = pool.map(count, [shared] * 4)
+
+	assert results == [array[1:].value_counts()] * 4
+
+
+def test_shared_enum_array_mismatch():
+	array = EnumArray.from_members(Colour, [Colour.Red])
+	Other = Enum("Colour", ["Red", "Green"], module=__name__)  # type: ignore[misc]
+
+	with SharedEnumArray.create(array) as shared:
+		with pytest.raises(ValueError, match="Colour has changed since the file was written"):
+			SharedEnumArray.attach(shared.name, Other)
+
+
+def test_close_with_views():
+	array = EnumArray.from_members(Colour, [Colour.Red])
+	shared = SharedEnumArray.create(array)
+	view = shared.array
+
+	with pytest.raises(BufferError):
+		shared.close()
+
+	# The block is unlinked even though it could not be closed.
+	with pytest.raises(FileNotFoundError):
+		SharedEnumArray.attach(shared.name, Colour)
+
+	del view
+	shared.close()
@@ -0,0 +1,209 @@
+# stdlib
+import enum
+import pickle
+from enum import Enum, Flag
+from types import DynamicClassAttribute, MethodType
+from typing import Any, Dict, List, Type
+
+# 3rd party
+import pytest
+
+# this package
+import enum_tools.snapshot
+from enum_tools import IntEnum, StrEnum
+from enum_tools.custom_enums import IdentityHashEnum, MultiValueEnum
+from enum_tools.snapshot import MAGIC, cached_enum, get_spec_fingerprint, read_snapshot
+
+
+# Caches filled in lazily by enum_tools.custom_enums.
+_LAZY_ATTRIBUTES = {"_string_cache_", "_str_", "_repr_", "_format_"}
+
+
+def describe(obj: Any) -> Any:
+	"""
+	Returns a representation of ``obj`` which refers to members and enums by name,
+	so that enums built in different ways can be compared.
+	"""
+
+	if isinstance(obj, Enum):
+		return ("member", type(obj).__qualname__, obj._name_)
+	elif isinstance(obj, enum.EnumMeta):
+		return ("enum", obj.__qualname__)
+	elif isinstance(obj, dict):
+		return [(describe(key), describe(value)) for key, value in obj.items()]
+	elif isinstance(obj, (list, tuple)):
+		return [describe(item) for item in obj]
+	elif isinstance(obj, (staticmethod, classmethod)):
+		return (type(obj).__name__, obj.__func__)
+	elif isinstance(obj, MethodType):
+		return ("method", obj.__func__)
+	elif isinstance(obj, DynamicClassAttribute):
+		return ("descriptor", obj.fget, getattr(obj, "name", None), describe(getattr(obj, "member", None)))
+	else:
+		return obj
+
+
+def describe_vars(obj: Any) -> Dict[str, Any]:
+	return {key: describe(value) for key, value in vars(obj).items() if key not in _LAZY_ATTRIBUTES}
+
+
+def assert_same_enum(actual: Type[Enum], expected: Type[Enum]) -> None:
+	assert type(actual) is type(expected)
+	assert actual.__bases__ == expected.__bases__
+	assert actual.__module__ == expected.__module__
+	assert actual.__qualname__ == expected.__qualname__
+	assert describe_vars(actual) == describe_vars(expected)
+
+	for name, member in actual.__members__.items():
+		assert describe_vars(member) == describe_vars(expected[name])
+		assert type(member._value_) is type(expected[name]._value_)
+		assert repr(member) == repr(expected[name])
+		assert str(member) == str(expected[name])
+
+	assert describe(list(actual)) == describe(list(expected))
+
+
+class Colour(MultiValueEnum):
+	pass
+
+
+SPECS = [
+		pytest.param(Enum, [("RED", 1), ("GREEN", "green"), ("BLUE", (3, 4)), ("CRIMSON", 1)], True, id="Enum"),
+		pytest.param(enum.IntEnum, [("OK", 200), ("NOT_FOUND", 404), ("MISSING", 404)], True, id="enum.IntEnum"),
+		pytest.param(IntEnum, [("OK", 200), ("NOT_FOUND", 404), ("MISSING", 404)], True, id="IntEnum"),
+		pytest.param(StrEnum, {"INFO": "info", "ERROR": "error", "ERR": "error"}, True, id="StrEnum"),
+		pytest.param(IdentityHashEnum, [("A", 1), ("B", 2)], True, id="IdentityHashEnum"),
+		pytest.param(Colour, [("RED", (1, "r")), ("GREEN", (2, "g"))], True, id="MultiValueEnum"),
+		pytest.param(Flag, [("READ", 4), ("WRITE", 2), ("ALL", 6)], False, id="Flag"),
+		pytest.param(Enum, [("A", [1]), ("B", [2])], False, id="unhashable"),
+		pytest.param(Enum, [("name", 1), ("value", 2)], False, id="shadowing"),
+		pytest.param(Enum, [], True, id="empty"),
+		]
+
+
+@pytest.mark.parametrize("enum_type, members, fast", SPECS)
+def test_cached_enum(tmp_path, monkeypatch, enum_type: Type[Enum], members: Any, fast: bool):
+	filename = tmp_path / "status.snapshot"
+	created_count = 0
+	create = enum_tools.snapshot._create
+
+	def record(snapshot):  # noqa: MAN001,MAN002
+		nonlocal created_count
+		created_count += 1
+		return create(snapshot)
+
+	monkeypatch.setattr(enum_tools.snapshot, "_create", record)
+	expected = enum_type("Status", members, module=__name__)  # type: ignore[call-overload]
+
+	created = cached_enum(filename, "Status", members, type=enum_type)
+	assert filename.read_bytes().startswith(MAGIC)
+	assert_same_enum(created, expected)
+
+	rebuilt = cached_enum(filename, "Status", members, type=enum_type)
+	assert rebuilt is not created
+	assert_same_enum(rebuilt, expected)
+
+	key = get_spec_fingerprint("Status", members, type=enum_type, module=__name__)
+	assert_same_enum(read_snapshot(filename, key), expected)
+
+	# Without the fast path, the enum is created with the functional API every time.
+	assert created_count == (1 if fast else 3)
+
+
+def test_cached_enum_lookups(tmp_path):
+	filename = tmp_path / "status.snapshot"
+	members = [(f"S{idx}", idx) for idx in range(1000)] + [("FIRST", 0)]
+
+	cached_enum(filename, "Status", members, type=IntEnum, qualname="Outer.Status")
+	Status: Any = cached_enum(filename, "Status", members, type=IntEnum, qualname="Outer.Status")
+
+	assert Status.__qualname__ == "Outer.Status"
+	assert Status.S10 is Status(10) is Status["S10"] is Status.from_int(10)
+	assert Status.FIRST is Status.S0
+	assert len(Status) == 1000
+	assert list(Status)[-1] is Status.S999
+	assert Status.S5 == 5
+	assert Status.S5 in Status
+	assert Status.S5 + 1 == 6
+
+	with pytest.raises(ValueError, match="1000 is not a valid"):
+		Status(1000)
+	with pytest.raises(AttributeError, match="(?i)cannot reassign member"):
+		Status.S1 = 2
+
+
+def test_cached_enum_docs(tmp_path):
+	filename = tmp_path / "level.snapshot"
+	docs = {"INFO": "Informational messages.", "ERR": "Errors."}
+
+	for _ in range(2):
+		Level: Any = cached_enum(filename, "Level", {"INFO": "info", "ERROR": "error", "ERR": "error"}, docs=docs)
+		assert Level.INFO.__doc__ == "Informational messages."
+		assert Level.ERROR.__doc__ == "Errors."
+
+
+def test_cached_enum_stale(tmp_path, monkeypatch):
+	filename = tmp_path / "status.snapshot"
+	created: List[Dict[str, Any]] = []
+	create = enum_tools.snapshot._create
+
+	def record(snapshot):  # noqa: MAN001,MAN002
+		created.append(dict(zip(snapshot.names, snapshot.values)))
+		return create(snapshot)
+
+	monkeypatch.setattr(enum_tools.snapshot, "_create", record)
+
+	Status: Any = cached_enum(filename, "Status", {"OK": 200})
+	Status = cached_enum(filename, "Status", {"OK": 200})
+	assert created == [{"OK": 200}]
+
+	Status = cached_enum(filename, "Status", {"OK": 200, "NOT_FOUND": 404})
+	assert Status.NOT_FOUND.value == 404
+	Status = cached_enum(filename, "Status", {"OK": 200, "NOT_FOUND": 404}, type=IntEnum)
+	assert Status.NOT_FOUND == 404
+	assert len(created) == 3
+
+	key = get_spec_fingerprint("Status", {"OK": 200, "NOT_FOUND": 404}, type=IntEnum, module=__name__)
+	with pytest.raises(ValueError, match="snapshot is out of date"):
+		read_snapshot(filename, "0" * 32)
+	assert read_snapshot(filename, key).NOT_FOUND == 404  # type: ignore[attr-defined]
+
+	# A corrupt snapshot is replaced.
+	filename.write_bytes(MAGIC + b"\x01garbage")
+	with pytest.raises(pickle.UnpicklingError):
+		read_snapshot(filename, key)
+	cached_enum(filename, "Status", {"OK": 200})
+	assert len(created) == 4
+
+	filename.write_bytes(b"garbage")
+	with pytest.raises(ValueError, match="not an enum snapshot"):
+		read_snapshot(filename, key)
+
+
+def test_cached_enum_key(tmp_path):
+	filename = tmp_path / "status.snapshot"
+
+	def members():  # noqa: MAN002
+		yield "OK", 200
+		yield "NOT_FOUND", 404
+
+	cached_enum(filename, "Status", members(), key="version-1")
+
+	# The members aren't needed to rebuild the enum from the snapshot.
+	Status: Any = cached_enum(filename, "Status", iter(()), key="version-1")
+	assert [member.name for member in Status] == ["OK", "NOT_FOUND"]
+
+	Status = cached_enum(filename, "Status", iter(()), key="version-2")
+	assert len(Status) == 0
+
+
+def test_get_spec_fingerprint():
+	fingerprint = get_spec_fingerprint("Status", {"OK": 200})
+	assert fingerprint == get_spec_fingerprint("Status", [("OK", 200)], type=Enum)
+	assert fingerprint != get_spec_fingerprint("Status", {"OK": 201})
+	assert fingerprint != get_spec_fingerprint("Status", {"OK": 200}, type=IntEnum)
+	assert fingerprint != get_spec_fingerprint("Status", {"OK": 200}, module="mod")
+	assert fingerprint != get_spec_fingerprint("Status", {"OK": 200}, docs={"OK": "All good."})
+
+	with pytest.raises(TypeError, match="cannot fingerprint values of type object"):
+		get_spec_fingerprint("Status", {"OK": object()})
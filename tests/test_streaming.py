@@ -0,0 +1,166 @@
+# stdlib
+import asyncio
+from enum import Enum
+from typing import AsyncIterator, Callable, List, TypeVar
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum
+from enum_tools.streaming import RecordLayout, iter_batches, iter_column_batches, iter_records
+
+_T = TypeVar("_T")
+
+
+class Method(Enum):
+	GET = "GET"
+	POST = "POST"
+	PUT = "PUT"
+
+
+class Status(IntEnum):
+	OK = 200
+	NotFound = 404
+	ServerError = 500
+
+
+RECORDS = [
+		(Method.GET, Status.OK),
+		(Method.POST, Status.NotFound),
+		(Method.GET, Status.ServerError),
+		(Method.PUT, Status.OK),
+		(Method.POST, Status.OK),
+		]
+
+
+def make_reader(data: bytes, chunk_size: int = 3) -> asyncio.StreamReader:
+	reader = asyncio.StreamReader()
+
+	# Feed the data in small pieces, so records are split across reads.
+	for start in range(0, len(data), chunk_size):
+		reader.feed_data(data[start:start + chunk_size])
+
+	reader.feed_eof()
+	return reader
+
+
+def read_all(
+		iterate: Callable[..., AsyncIterator[_T]],
+		data: bytes,
+		layout: RecordLayout,
+		batch_size: int = 4096,
+		chunk_size: int = 3,
+		) -> List[_T]:
+
+	async def main() -> List[_T]:
+		# The reader must be created in the running event loop.
+		reader = make_reader(data, chunk_size)
+		return [item async for item in iterate(reader, layout, batch_size)]
+
+	return asyncio.run(main())
+
+
+def test_record_layout():
+	layout = RecordLayout([(Method, 1), (Status, 2)])
+	assert layout.record_size == 3
+	assert layout.codes == "ordinals"
+
+	data = layout.encode(RECORDS)
+	assert data[:6] == b"\x00\x00\x00\x01\x01\x00"
+	assert layout.decode(data) == RECORDS
+	assert layout.decode_columns(data) == ([r[0] for r in RECORDS], [r[1] for r in RECORDS])
+	assert layout.decode(b'') == []
+
+	by_value = RecordLayout([(Status, 2)], codes="values")
+	assert by_value.encode([(Status.NotFound, )]) == b"\x94\x01"
+	assert by_value.decode(b"\x94\x01\xc8\x00") == [(Status.NotFound, ), (Status.OK, )]
+
+	mixed = RecordLayout([(Status, 4), (Status, 1), (Status, 2)], codes="ordinals")
+	records = [(Status.ServerError, Status.OK, Status.NotFound), (Status.OK, Status.ServerError, Status.OK)]
+	assert mixed.record_size == 7
+	assert mixed.encode(records)[:7] == b"\x02\x00\x00\x00\x00\x01\x00"
+	assert mixed.decode(memoryview(mixed.encode(records))) == records
+
+	Wide = IntEnum("Wide", [("Low", 0x10), ("High", 0x01020304)])  # type: ignore[misc]
+	wide = RecordLayout([(Wide, 4), (Status, 2)], codes="values")
+	assert wide.decode(b"\x04\x03\x02\x01\x94\x01\x10\x00\x00\x00\xc8\x00") == [
+			(Wide.High, Status.NotFound),
+			(Wide.Low, Status.OK),
+			]
+
+
+def test_record_layout_errors():
+	layout = RecordLayout([(Method, 1), (Status, 2)])
+
+	with pytest.raises(ValueError, match="data is not a whole number of 3-byte records"):
+		layout.decode(b"\x00\x00")
+
+	with pytest.raises(ValueError, match="3 is not a valid code for Method"):
+		layout.decode(b"\x00\x00\x00\x03\x00\x00")
+
+	with pytest.raises(ValueError, match="201 is not a valid code for Status"):
+		RecordLayout([(Status, 2)], codes="values").decode(b"\x94\x01\xc9\x00")
+
+	with pytest.raises(ValueError, match="invalid width 3 for Method; must be 1, 2 or 4"):
+		RecordLayout([(Method, 3)])
+
+	with pytest.raises(ValueError, match="'codes' must be 'ordinals' or 'values', not 'names'"):
+		RecordLayout([(Method, 1)], codes="names")  # type: ignore[arg-type]
+
+	with pytest.raises(ValueError, match="a record must have at least one field"):
+		RecordLayout([])
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 4096])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_iter_records(batch_size: int, chunk_size: int):
+	layout = RecordLayout([(Method, 1), (Status, 2)])
+	data = layout.encode(RECORDS * 3)
+
+	records = read_all(iter_records, data, layout, batch_size, chunk_size)
+	assert records == RECORDS * 3
+
+	batches = read_all(iter_batches, data, layout, batch_size, chunk_size)
+	assert all(len(batch) <= batch_size for batch in batches)
+	assert [record for batch in batches for record in batch] == RECORDS * 3
+
+	columns = read_all(iter_column_batches, data, layout, batch_size, chunk_size)
+	assert [member for batch in columns for member in batch[1]] == [r[1] for r in RECORDS * 3]
+
+
+def test_iter_records_errors():
+	layout = RecordLayout([(Method, 1), (Status, 2)])
+	data = layout.encode(RECORDS)
+
+	with pytest.raises(ValueError, match="stream ended with a partial record of 2 bytes"):
+		read_all(iter_records, data[:-1], layout)
+
+	with pytest.raises(ValueError, match="5 is not a valid code for Method"):
+		read_all(iter_records, data + b"\x05\x00\x00", layout)
+
+	with pytest.raises(ValueError, match="'batch_size' must be at least 1"):
+		read_all(iter_records, data, layout, 0)
+
+	assert read_all(iter_records, b'', layout) == []
+
+
+def test_iter_records_backpressure():
+	layout = RecordLayout([(Method, 1)])
+
+	async def main() -> List[int]:
+		reader = asyncio.StreamReader()
+		reader.feed_data(bytes([0, 1, 2] * 10))
+		records = iter_records(reader, layout, batch_size=4)
+
+		assert await records.__anext__() == (Method.GET, )
+
+		# Only the first batch has been read from the reader.
+		buffered = [len(reader._buffer)]  # type: ignore[attr-defined]
+
+		reader.feed_eof()
+		rest = [record async for record in records]
+		assert len(rest) == 29
+		return buffered
+
+	assert asyncio.run(main()) == [26]
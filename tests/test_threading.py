@@ -0,0 +1,156 @@
+# stdlib
+import pickle
+import sys
+import threading
+from enum import Enum
+from typing import Callable, Iterator, List, TypeVar
+
+# 3rd party
+import pytest
+
+# this package
+import enum_tools.documentation
+from enum_tools import IntEnum, pickling
+from enum_tools.containers import EnumSet
+from enum_tools.custom_enums import IntervalEnum, IterableIntFlag, MemberDirEnum
+from enum_tools.documentation import document_enum
+from enum_tools.utils import get_members
+
+_T = TypeVar("_T")
+
+THREADS = 16
+ROUNDS = 20
+
+
+@pytest.fixture(autouse=True)
+def switch_often() -> Iterator[None]:
+	# Switch between threads as often as possible, so races show up on builds with a GIL too.
+	interval = sys.getswitchinterval()
+	sys.setswitchinterval(1e-6)
+	yield
+	sys.setswitchinterval(interval)
+
+
+def run_together(function: Callable[[], _T], threads: int = THREADS) -> List[_T]:
+	"""
+	Call ``function`` in several threads at once, and return the results.
+	"""
+
+	barrier = threading.Barrier(threads)
+	results: List[_T] = []
+	errors: List[BaseException] = []
+
+	def worker() -> None:
+		barrier.wait()
+		try:
+			results.append(function())
+		except BaseException as e:  # pragma: no cover
+			errors.append(e)
+
+	pool = [threading.Thread(target=worker) for _ in range(threads)]
+	for thread in pool:
+		thread.start()
+	for thread in pool:
+		thread.join()
+
+	if errors:  # pragma: no cover
+		raise errors[0]
+
+	return results
+
+
+def test_member_tables():
+	for _ in range(ROUNDS):
+		Colour = Enum("Colour", ["RED", "GREEN", "BLUE"])  # type: ignore[misc]
+
+		results = run_together(lambda: (get_members(Colour), EnumSet(Colour, [Colour.RED])))
+
+		# Every thread gets the same cached tables, so sets created in different threads are equal.
+		assert all(members is results[0][0] for members, _ in results)
+		assert all(enum_set == results[0][1] for _, enum_set in results)
+
+
+def test_from_int():
+	for _ in range(ROUNDS):
+		Status = IntEnum("Status", [(f"S{idx}", idx) for idx in range(100)])  # type: ignore[misc]
+
+		results = run_together(lambda: (Status.from_ints(range(100)), Status.from_int))
+
+		assert all(members == list(Status) for members, _ in results)
+		assert all(from_int.__self__ is results[0][1].__self__ for _, from_int in results)  # type: ignore[attr-defined]
+
+
+def test_interval_lookup():
+	for _ in range(ROUNDS):
+
+		class Band(IntervalEnum):
+			LOW = (0, 10)
+			HIGH = (10, 20)
+
+		results = run_together(lambda: ([Band(value) for value in range(20)], Band.lookup))
+
+		assert all(members == [Band.LOW] * 10 + [Band.HIGH] * 10 for members, _ in results)
+		assert all(lookup.__self__ is results[0][1].__self__ for _, lookup in results)
+
+
+def test_flags():
+	for _ in range(ROUNDS):
+
+		class Permission(IterableIntFlag):
+			READ = 4
+			WRITE = 2
+			EXECUTE = 1
+
+		def worker() -> List[List[Permission]]:
+			# Creating composite members while other threads iterate over flags.
+			return [list(Permission(value)) for value in range(16)]
+
+		results = run_together(worker)
+		assert all(result == results[0] for result in results)
+		assert results[0][7] == [Permission.READ, Permission.WRITE, Permission.EXECUTE]
+		assert results[0][6] == [Permission.READ, Permission.WRITE]
+
+		formatters = run_together(lambda: (Permission.format(7), Permission.parse("READ|EXECUTE")))
+		assert formatters == [("READ|WRITE|EXECUTE", Permission.READ | Permission.EXECUTE)] * THREADS
+
+
+def test_dir():
+	for _ in range(ROUNDS):
+
+		class Colour(MemberDirEnum):
+			RED = 1
+			GREEN = 2
+
+		results = run_together(lambda: dir(Colour.RED))
+		assert all(result == results[0] for result in results)
+
+
+@pytest.mark.usefixtures("pickling_registry")
+def test_pickling_register():
+	for idx in range(ROUNDS):
+		Colour = Enum("Colour", ["RED", "GREEN"], module=__name__)  # type: ignore[misc]
+		key = f"{__name__}:threaded-{idx}"
+
+		run_together(lambda: pickling.register(Colour, key=key))
+		assert pickling.get_key(Colour) == key
+
+		results = run_together(lambda: pickle.loads(pickle.dumps(Colour.GREEN)))
+		assert all(member is Colour.GREEN for member in results)
+
+
+def test_document_enum(monkeypatch):
+	monkeypatch.setattr(enum_tools.documentation, "INTERACTIVE", True)
+
+	class Colour(Enum):
+		RED = 1  # doc: The colour red.
+		GREEN = 2
+
+		#: The colour blue.
+		BLUE = 3
+
+	for _ in range(ROUNDS):
+		Colour.RED.__doc__ = Colour.BLUE.__doc__ = None
+		run_together(lambda: document_enum(Colour), threads=4)
+
+		assert Colour.RED.__doc__ == "The colour red."
+		assert Colour.BLUE.__doc__ == "The colour blue."
@@ -0,0 +1,127 @@
+# stdlib
+from enum import Enum
+
+# 3rd party
+import pytest
+
+# this package
+from enum_tools import IntEnum, StrEnum
+from enum_tools.translation import EnumTranslator
+
+
+class Status(IntEnum):
+	OK = 200
+	NOT_FOUND = 404
+	TEAPOT = 418
+
+
+class ApiStatus(StrEnum):
+	NOT_FOUND = "not_found"
+	OK = "ok"
+	MISSING = "not_found"
+	GONE = "gone"
+
+
+class Code(Enum):
+	SUCCESS = 200
+	ABSENT = 404
+	MISSING = 404
+
+
+def test_by_name():
+	translator = EnumTranslator.by_name(Status, ApiStatus, {Status.TEAPOT: ApiStatus.GONE})
+
+	assert translator.source is Status
+	assert translator.target is ApiStatus
+	assert translator.ordinals == (1, 0, 2)
+	assert translator.missing == ()
+	assert translator.unused == ()
+	assert translator.translate(Status.OK) is ApiStatus.OK
+	assert translator.translate_members([Status.TEAPOT, Status.OK]) == [ApiStatus.GONE, ApiStatus.OK]
+	assert translator.translate_ordinals([0, 2, 1]) == [1, 2, 0]
+	assert repr(translator) == "<EnumTranslator Status -> ApiStatus>"
+
+
+def test_incomplete():
+	with pytest.raises(ValueError, match="no translation to ApiStatus for Status members: TEAPOT"):
+		EnumTranslator.by_name(Status, ApiStatus)
+
+	translator = EnumTranslator.by_name(Status, ApiStatus, complete=False)
+	assert translator.ordinals == (1, 0, -1)
+	assert translator.missing == (Status.TEAPOT, )
+	assert translator.unused == (ApiStatus.GONE, )
+
+	with pytest.raises(ValueError, match="has no translation to ApiStatus"):
+		translator.translate(Status.TEAPOT)
+	with pytest.raises(ValueError, match="has no translation to ApiStatus"):
+		translator.translate_members([Status.OK, Status.TEAPOT])
+	with pytest.raises(ValueError, match="has no translation to ApiStatus"):
+		translator.translate_ordinals([0, 2])
+	with pytest.raises(ValueError, match="out of range for Status"):
+		translator.translate_ordinals([3])
+	with pytest.raises(ValueError, match="out of range for Status"):
+		translator.translate_ordinals([-1])
+	with pytest.raises(ValueError, match="is not a canonical member of Status"):
+		translator.translate(200)  # type: ignore[arg-type]
+
+
+def test_by_value():
+	translator = EnumTranslator.by_value(Status, Code, complete=False)
+	assert translator.translate(Status.NOT_FOUND) is Code.ABSENT
+	assert translator.missing == (Status.TEAPOT, )
+
+	inverse = translator.inverse()
+	assert inverse.translate(Code.SUCCESS) is Status.OK
+	assert inverse.translate(Code.MISSING) is Status.NOT_FOUND
+
+
+def test_table():
+	translator = EnumTranslator(
+			Code,
+			ApiStatus,
+			[(Code.SUCCESS, ApiStatus.OK), (Code.ABSENT, ApiStatus.MISSING)],
+			)
+	assert translator.translate(Code.ABSENT) is ApiStatus.NOT_FOUND
+
+	with pytest.raises(ValueError, match="is not a canonical member of Code"):
+		EnumTranslator(Code, ApiStatus, {Status.OK: ApiStatus.OK})
+	with pytest.raises(ValueError, match="is not a canonical member of ApiStatus"):
+		EnumTranslator(Code, ApiStatus, {Code.SUCCESS: "ok"})  # type: ignore[dict-item]
+
+
+def test_inverse_not_one_to_one():
+	translator = EnumTranslator(Status, Code, {member: Code.SUCCESS for member in Status})
+
+	with pytest.raises(ValueError, match="both translate to <Code.SUCCESS: 200>"):
+		translator.inverse()
+	with pytest.raises(ValueError, match="no translation to Status for Code members: ABSENT"):
+		EnumTranslator(Status, Code, {Status.OK: Code.SUCCESS}, complete=False).inverse()
+
+
+def test_translate_array():
+	numpy = pytest.importorskip("numpy")
+
+	# this package
+	from enum_tools.arrays import EnumArray
+
+	translator = EnumTranslator.by_name(Status, ApiStatus, {Status.TEAPOT: ApiStatus.GONE})
+	array = EnumArray.from_members(Status, [Status.TEAPOT, Status.OK, Status.NOT_FOUND])
+
+	translated = translator.translate_array(array)
+	assert translated.enum is ApiStatus
+	assert list(translated) == [ApiStatus.GONE, ApiStatus.OK, ApiStatus.NOT_FOUND]
+
+	codes = translator.translate_ordinals(numpy.array([[0, 1], [2, 2]]))
+	assert codes.tolist() == [[1, 0], [2, 2]]
+	assert codes.dtype == numpy.uint8
+
+	with pytest.raises(ValueError, match="expected an array of Status members, not ApiStatus"):
+		translator.translate_array(translated)  # type: ignore[arg-type]
+	with pytest.raises(ValueError, match="out of range for Status"):
+		translator.translate_ordinals(numpy.array([3]))
+	with pytest.raises(TypeError, match="ordinals must be integers"):
+		translator.translate_ordinals(numpy.array([0.5]))
+
+	incomplete = EnumTranslator.by_name(Status, ApiStatus, complete=False)
+	with pytest.raises(ValueError, match="<Status.TEAPOT: 418> has no translation"):
+		incomplete.translate_array(array)